@@ -0,0 +1,7 @@
+"""Generate Looker views from dbt models in BigQuery."""
+
+from dbt2looker_bigquery.api import DbtProject, generate
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.generators.emitter import dump_lookml
+
+__all__ = ["DbtProject", "GeneratorConfig", "dump_lookml", "generate"]
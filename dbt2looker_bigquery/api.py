@@ -0,0 +1,90 @@
+"""Generate LookML from dbt artifacts in-process, without the cli."""
+
+import os
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.generators import LookmlGenerator
+from dbt2looker_bigquery.models.dbt import DbtModel
+from dbt2looker_bigquery.parsers import DbtParser
+from dbt2looker_bigquery.utils import FileHandler
+
+# a loaded artifact, or the path of its JSON file
+Artifact = Union[Dict, str, os.PathLike]
+
+
+def _load(artifact: Artifact) -> Dict:
+    if isinstance(artifact, dict):
+        return artifact
+    return FileHandler().read(os.fspath(artifact))
+
+
+class DbtProject:
+    """dbt artifacts that are read and validated once, to generate with many configs.
+
+    Models are validated and combined with their catalog node the first time a
+    config selects them, and kept for the lifetime of the project.
+    """
+
+    def __init__(self, manifest: Artifact, catalog: Artifact):
+        """
+        Args:
+            manifest: The content of manifest.json, or its path
+            catalog: The content of catalog.json, or its path
+        """
+        self._parser = DbtParser(_load(manifest), _load(catalog))
+        self._models: Dict[str, DbtModel] = {}
+
+    @classmethod
+    def from_target_dir(cls, target_dir: str) -> "DbtProject":
+        """Read manifest.json and catalog.json from a dbt target directory."""
+        return cls(
+            os.path.join(target_dir, "manifest.json"),
+            os.path.join(target_dir, "catalog.json"),
+        )
+
+    def _iter_models(self, config: GeneratorConfig) -> Iterator[DbtModel]:
+        unique_ids = self._parser.select(config)
+        missing = [
+            unique_id for unique_id in unique_ids if unique_id not in self._models
+        ]
+        if missing:
+            for model in self._parser.iter_models(config, missing):
+                self._models[model.unique_id] = model
+
+        for unique_id in unique_ids:
+            # models without a catalog node are skipped, the parser warns about them
+            if unique_id in self._models:
+                yield self._models[unique_id]
+
+    def generate(
+        self, config: Optional[GeneratorConfig] = None
+    ) -> Iterator[Tuple[str, Dict]]:
+        """Generate the views of the models selected by a config.
+
+        Yields the path of each view, relative to the output directory, with its
+        LookML as a dictionary, e.g. for dump_lookml.
+        """
+        config = config or GeneratorConfig()
+        lookml_generator = LookmlGenerator(config)
+        for model in self._iter_models(config):
+            yield lookml_generator.generate(model=model)
+
+
+def generate(
+    manifest: Artifact, catalog: Artifact, config: Optional[GeneratorConfig] = None
+) -> Iterator[Tuple[str, Dict]]:
+    """Generate the views of the models selected by a config.
+
+    To generate with several configs without reading and validating the artifacts
+    again, use a DbtProject.
+
+    Args:
+        manifest: The content of manifest.json, or its path
+        catalog: The content of catalog.json, or its path
+        config: The selection and generation options, the cli defaults if omitted
+
+    Returns:
+        An iterator of the path of each view with its LookML dictionary
+    """
+    return DbtProject(manifest, catalog).generate(config)
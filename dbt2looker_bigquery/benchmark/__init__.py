@@ -0,0 +1,11 @@
+"""Benchmarks for dbt2looker_bigquery.
+
+Generate a synthetic dbt project and time each stage of turning it into LookML:
+
+    python -m dbt2looker_bigquery.benchmark --models 1000 --columns 50 --depth 2
+"""
+
+from dbt2looker_bigquery.benchmark.runner import STAGES, run_benchmark
+from dbt2looker_bigquery.benchmark.synthetic import SyntheticProject, generate_project
+
+__all__ = ["STAGES", "SyntheticProject", "generate_project", "run_benchmark"]
@@ -0,0 +1,148 @@
+"""Command line entry point for the benchmarks."""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from dbt2looker_bigquery.benchmark.decode import run_decode_benchmark
+from dbt2looker_bigquery.benchmark.runner import STAGES, run_benchmark
+from dbt2looker_bigquery.benchmark.synthetic import SyntheticProject, generate_project
+from dbt2looker_bigquery.decoding import default_decoder
+from dbt2looker_bigquery.incremental import get_tool_version
+
+
+def _init_argparser() -> argparse.ArgumentParser:
+    defaults = SyntheticProject()
+    parser = argparse.ArgumentParser(
+        description="Benchmark dbt2looker on a synthetic dbt project",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--models", type=int, default=defaults.models)
+    parser.add_argument(
+        "--columns",
+        type=int,
+        default=defaults.columns,
+        help="top level columns per model",
+    )
+    parser.add_argument(
+        "--depth", type=int, default=defaults.depth, help="STRUCT/ARRAY nesting depth"
+    )
+    parser.add_argument(
+        "--nested-fields",
+        type=int,
+        default=defaults.nested_fields,
+        help="fields per STRUCT",
+    )
+    parser.add_argument(
+        "--struct-ratio",
+        type=float,
+        default=defaults.struct_ratio,
+        help="share of top level columns that are STRUCT or ARRAY",
+    )
+    parser.add_argument(
+        "--meta-density",
+        type=float,
+        default=defaults.meta_density,
+        help="share of models and columns with looker meta",
+    )
+    parser.add_argument("--exposures", type=int, default=defaults.exposures)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--target-dir",
+        help="benchmark an existing dbt target directory instead of a synthetic project",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="also trace the peak of python allocations, slows down the run",
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="path of the results file"
+    )
+    parser.add_argument(
+        "cli_args",
+        nargs=argparse.REMAINDER,
+        help="dbt2looker arguments to benchmark with, after --",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = _init_argparser().parse_args(argv)
+    cli_args = [arg for arg in args.cli_args if arg != "--"]
+    # warnings about the synthetic project are expected and not interesting here
+    logging.getLogger().setLevel(logging.ERROR)
+
+    project = SyntheticProject(
+        models=args.models,
+        columns=args.columns,
+        depth=args.depth,
+        nested_fields=args.nested_fields,
+        struct_ratio=args.struct_ratio,
+        meta_density=args.meta_density,
+        exposures=args.exposures,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        if args.target_dir:
+            target_dir = args.target_dir
+        else:
+            target_dir = project_dir
+            generate_project(target_dir, project)
+
+        result = run_benchmark(
+            target_dir,
+            repeat=args.repeat,
+            cli_args=cli_args,
+            trace_memory=args.trace_memory,
+        )
+        decode = run_decode_benchmark(target_dir, repeat=args.repeat)
+
+    results = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "version": get_tool_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "project": {"target_dir": args.target_dir}
+        if args.target_dir
+        else project.to_dict(),
+        "cli_args": cli_args,
+        "repeat": args.repeat,
+        "decoder": default_decoder(),
+        **result,
+        "decode": decode,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{result['models']} models, {result['columns']} columns")
+    for stage in STAGES:
+        print(f"{stage:<30} {result['stages'][stage]['min']:>9.3f}s")
+    print(f"{'total':<30} {result['total']['min']:>9.3f}s")
+    print(f"{result['throughput']['models_per_second']:.1f} models/s")
+    print(
+        f"{'lkml.dump (comparison)':<30} {result['lkml_dump']['min']:>9.3f}s, "
+        f"dump_lookml is {result['lkml_dump']['speedup'] or 0:.1f}x as fast, "
+        f"{result['lkml_dump']['mismatches']} mismatches"
+    )
+    if result["peak_rss_mb"] is not None:
+        print(f"peak rss {result['peak_rss_mb']:.1f} MB")
+    for file_name, decoders in decode.items():
+        for decoder, stats in decoders.items():
+            rss = (
+                f", peak rss +{stats['rss_increase_mb']:.1f} MB"
+                if stats["rss_increase_mb"] is not None
+                else ""
+            )
+            print(f"{file_name + ' ' + decoder:<30} {stats['seconds']:>9.3f}s{rss}")
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Decode time and peak memory of every installed JSON decoder.
+
+Peak resident memory can only grow within a process, so every decoder is measured
+in a fresh interpreter:
+
+    python -m dbt2looker_bigquery.benchmark.decode target manifest.json json
+"""
+
+import json
+import os
+import subprocess  # nosec B404
+import sys
+import time
+from typing import Dict, List
+
+from dbt2looker_bigquery.benchmark.runner import peak_rss_mb
+from dbt2looker_bigquery.decoding import available_decoders, load_json
+
+# json.load on a file opened in text mode, how artifacts were read before
+TEXT_BASELINE = "json.load"
+
+
+def measure_decoder(path: str, decoder: str, repeat: int = 3) -> Dict:
+    """Decode a file repeatedly in this process, returning the fastest time and the memory."""
+    baseline_rss = peak_rss_mb()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if decoder == TEXT_BASELINE:
+            with open(path, "r") as f:
+                document = json.load(f)
+        else:
+            document = load_json(path, decoder)
+        times.append(time.perf_counter() - start)
+        del document
+
+    peak = peak_rss_mb()
+    return {
+        "seconds": min(times),
+        "peak_rss_mb": peak,
+        "rss_increase_mb": peak - baseline_rss if peak is not None else None,
+    }
+
+
+def run_decode_benchmark(
+    target_dir: str,
+    files: List[str] = ("manifest.json", "catalog.json"),
+    repeat: int = 3,
+) -> Dict[str, Dict[str, Dict]]:
+    """Measure every installed decoder and the text mode baseline on the artifacts.
+
+    Returns the measurements by file name and decoder name.
+    """
+    results = {}
+    for file_name in files:
+        path = os.path.join(target_dir, file_name)
+        results[file_name] = {}
+        for decoder in (*available_decoders(), TEXT_BASELINE):
+            # runs this module with the current interpreter, without a shell
+            completed = subprocess.run(  # nosec B603
+                [sys.executable, "-m", __name__, path, decoder, str(repeat)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results[file_name][decoder] = json.loads(completed.stdout)
+    return results
+
+
+if __name__ == "__main__":
+    path, decoder, repeat = sys.argv[1:]
+    print(json.dumps(measure_decoder(path, decoder, int(repeat))))
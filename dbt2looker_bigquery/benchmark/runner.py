@@ -0,0 +1,178 @@
+"""Timing of the generation stages for benchmarks."""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+import lkml
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.generators import LookmlGenerator
+from dbt2looker_bigquery.generators.emitter import dump_lookml
+from dbt2looker_bigquery.output import OutputWriter
+from dbt2looker_bigquery.parsers import DbtParser
+from dbt2looker_bigquery.profiling import profiler
+from dbt2looker_bigquery.utils import FileHandler
+
+try:
+    import resource
+except ImportError:  # not available on windows
+    resource = None
+
+STAGES = (
+    "read",
+    "DbtParser",
+    "CatalogParser.process_model",
+    "LookmlGenerator.generate",
+    "dump_lookml",
+    "write",
+)
+
+
+def get_args(target_dir: str, output_dir: str, cli_args: List[str] = ()):
+    """Parse cli arguments the way a dbt2looker run would."""
+    return (
+        Cli()
+        ._init_argparser()
+        .parse_args(["--target-dir", target_dir, "--output-dir", output_dir, *cli_args])
+    )
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process, or None where it cannot be measured."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_once(target_dir: str, output_dir: str, cli_args: List[str] = ()) -> Dict:
+    """Run every stage once and return the seconds spent in each.
+
+    DbtParser excludes the time spent in CatalogParser.process_model, which is read
+    from the profiler spans. lkml.dump is timed next to dump_lookml for comparison, outside of the
+    stages, and every model whose two dumps differ is counted as a dump mismatch.
+    """
+    config = GeneratorConfig.from_args(get_args(target_dir, output_dir, cli_args))
+    timings = dict.fromkeys(STAGES, 0.0)
+    file_handler = FileHandler()
+
+    start = time.perf_counter()
+    raw_manifest = file_handler.read(os.path.join(target_dir, "manifest.json"))
+    raw_catalog = file_handler.read(os.path.join(target_dir, "catalog.json"))
+    timings["read"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parser = DbtParser(raw_manifest, raw_catalog, config)
+    # process_model is timed from the spans the parser records for it
+    profiler.reset()
+    profiler.enable()
+    try:
+        models = parser.get_models(config)
+    finally:
+        profiler.disable()
+    timings["CatalogParser.process_model"] = sum(
+        span.duration
+        for span in profiler.spans
+        if span.name == "CatalogParser.process_model"
+    )
+    profiler.reset()
+    timings["DbtParser"] = (
+        time.perf_counter() - start - timings["CatalogParser.process_model"]
+    )
+
+    generator = LookmlGenerator(config)
+    writer = OutputWriter(output_dir, file_handler)
+    columns = 0
+    lkml_dump = 0.0
+    dump_mismatches = 0
+    for model in models:
+        columns += len(model.columns)
+
+        start = time.perf_counter()
+        file_path, lookml = generator.generate(model)
+        generated = time.perf_counter()
+        contents = dump_lookml(lookml)
+        dumped = time.perf_counter()
+        writer.write(file_path, contents)
+        written = time.perf_counter()
+        lkml_contents = lkml.dump(lookml)
+        lkml_dump += time.perf_counter() - written
+        dump_mismatches += lkml_contents != contents
+
+        timings["LookmlGenerator.generate"] += generated - start
+        timings["dump_lookml"] += dumped - generated
+        timings["write"] += written - dumped
+
+    return {
+        "timings": timings,
+        "models": len(models),
+        "columns": columns,
+        "lkml_dump": lkml_dump,
+        "dump_mismatches": dump_mismatches,
+    }
+
+
+def run_benchmark(
+    target_dir: str,
+    repeat: int = 3,
+    cli_args: List[str] = (),
+    trace_memory: bool = False,
+) -> Dict:
+    """Benchmark a dbt project, returning stage timings, throughput and peak memory.
+
+    Every repetition writes to a fresh output directory, so each one writes all
+    views. With trace_memory, the peak of Python allocations is traced as well,
+    which makes the run itself slower.
+    """
+    runs = []
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as output_dir:
+                runs.append(run_once(target_dir, output_dir, cli_args))
+        traced_peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    stages = {
+        stage: {
+            "min": min(run["timings"][stage] for run in runs),
+            "median": statistics.median(run["timings"][stage] for run in runs),
+        }
+        for stage in STAGES
+    }
+    totals = [sum(run["timings"].values()) for run in runs]
+    lkml_dump = min(run["lkml_dump"] for run in runs)
+    models = runs[0]["models"]
+    columns = runs[0]["columns"]
+
+    return {
+        "models": models,
+        "columns": columns,
+        "stages": stages,
+        "total": {"min": min(totals), "median": statistics.median(totals)},
+        "throughput": {
+            "models_per_second": models / min(totals) if min(totals) else None,
+            "columns_per_second": columns / min(totals) if min(totals) else None,
+        },
+        "lkml_dump": {
+            "min": lkml_dump,
+            "median": statistics.median(run["lkml_dump"] for run in runs),
+            "speedup": lkml_dump / stages["dump_lookml"]["min"]
+            if stages["dump_lookml"]["min"]
+            else None,
+            "mismatches": runs[0]["dump_mismatches"],
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_traced_mb": traced_peak / (1024 * 1024) if trace_memory else None,
+        "runs": [run["timings"] for run in runs],
+    }
@@ -0,0 +1,214 @@
+"""Synthetic dbt project generation for benchmarks."""
+
+import json
+import os
+import random
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Tuple
+
+PROJECT_NAME = "bench"
+DATABASE = "bench-project"
+
+SCALAR_TYPES = (
+    "STRING",
+    "INT64",
+    "FLOAT64",
+    "NUMERIC",
+    "BOOL",
+    "DATE",
+    "TIMESTAMP",
+)
+MEASURE_TYPES = ("sum", "average", "count_distinct", "max")
+
+
+@dataclass(frozen=True)
+class SyntheticProject:
+    """Shape of a generated dbt project.
+
+    Every top level column has a struct_ratio chance of being a STRUCT, or an ARRAY
+    of STRUCT, of nested_fields fields, nested up to depth levels. meta_density is
+    the share of models and columns that get looker meta.
+    """
+
+    models: int = 100
+    columns: int = 30
+    depth: int = 1
+    nested_fields: int = 4
+    struct_ratio: float = 0.1
+    meta_density: float = 0.5
+    exposures: int = 5
+    seed: int = 0
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class _ProjectBuilder:
+    def __init__(self, project: SyntheticProject):
+        self._project = project
+        # seeded for reproducible projects, not for security
+        self._random = random.Random(project.seed)  # nosec B311
+
+    def _struct_type(self, depth: int) -> Tuple[str, List[Tuple[str, str]]]:
+        """Build a STRUCT type and the relative names and types of its nested fields."""
+        fields = []
+        nested = []
+        for i in range(self._project.nested_fields):
+            name = f"field_{i}"
+            if depth > 1 and i == 0:
+                field_type, field_nested = self._struct_type(depth - 1)
+                if self._random.random() < 0.5:
+                    field_type = f"ARRAY<{field_type}>"
+                nested.append((name, field_type))
+                nested.extend(
+                    (f"{name}.{sub_name}", sub_type)
+                    for sub_name, sub_type in field_nested
+                )
+            else:
+                field_type = SCALAR_TYPES[i % len(SCALAR_TYPES)]
+                nested.append((name, field_type))
+            fields.append(f"{name} {field_type}")
+        return f"STRUCT<{', '.join(fields)}>", nested
+
+    def _column_types(self) -> List[Tuple[str, str]]:
+        """Names and types of all columns of a model, nested fields included."""
+        columns = []
+        for i in range(self._project.columns):
+            if self._project.depth > 0 and self._random.random() < (
+                self._project.struct_ratio
+            ):
+                name = f"record_{i}"
+                column_type, nested = self._struct_type(self._project.depth)
+                if self._random.random() < 0.5:
+                    column_type = f"ARRAY<{column_type}>"
+                columns.append((name, column_type))
+                columns.extend(
+                    (f"{name}.{sub_name}", sub_type) for sub_name, sub_type in nested
+                )
+            else:
+                column_type = SCALAR_TYPES[i % len(SCALAR_TYPES)]
+                columns.append((f"column_{i}", column_type))
+        return columns
+
+    def _column_meta(self, name: str, column_type: str) -> Dict:
+        if self._random.random() >= self._project.meta_density:
+            return {}
+        looker = {
+            "dimension": {
+                "label": name.replace("_", " ").title(),
+                "group_label": f"Group {len(name) % 5}",
+            }
+        }
+        if column_type in ("INT64", "FLOAT64", "NUMERIC"):
+            looker["measures"] = [{"type": self._random.choice(MEASURE_TYPES)}]
+        return {"looker": looker}
+
+    def _model_meta(self, index: int) -> Dict:
+        if self._random.random() >= self._project.meta_density:
+            return {}
+        return {
+            "looker": {
+                "view": {"label": f"Model {index}"},
+                "explore": {"group_label": f"Group {index % 5}"},
+            }
+        }
+
+    def build(self) -> Tuple[Dict, Dict]:
+        """Build the raw manifest and catalog."""
+        nodes = {}
+        catalog_nodes = {}
+        for i in range(self._project.models):
+            name = f"model_{i}"
+            folder = f"folder_{i % 10}"
+            schema = f"dataset_{i % 5}"
+            unique_id = f"model.{PROJECT_NAME}.{name}"
+            column_types = self._column_types()
+
+            nodes[unique_id] = {
+                "database": DATABASE,
+                "schema": schema,
+                "name": name,
+                "resource_type": "model",
+                "package_name": PROJECT_NAME,
+                "path": f"{folder}/{name}.sql",
+                "original_file_path": f"models/{folder}/{name}.sql",
+                "unique_id": unique_id,
+                "fqn": [PROJECT_NAME, folder, name],
+                "alias": name,
+                "config": {"enabled": True, "materialized": "table", "tags": []},
+                "tags": [f"tag_{i % 3}"],
+                "description": f"Synthetic model {i}",
+                "columns": {
+                    column_name: {
+                        "name": column_name,
+                        "description": f"Column {column_name}",
+                        "meta": self._column_meta(column_name, column_type),
+                        "data_type": column_type,
+                        "constraints": [],
+                        "tags": [],
+                    }
+                    for column_name, column_type in column_types
+                },
+                "meta": self._model_meta(i),
+                "relation_name": f"`{DATABASE}`.`{schema}`.`{name}`",
+            }
+            catalog_nodes[unique_id] = {
+                "metadata": {
+                    "type": "table",
+                    "schema": schema,
+                    "name": name,
+                    "database": DATABASE,
+                },
+                "columns": {
+                    column_name: {
+                        "type": column_type,
+                        "index": index,
+                        "name": column_name,
+                        "comment": None,
+                    }
+                    for index, (column_name, column_type) in enumerate(
+                        column_types, start=1
+                    )
+                },
+            }
+
+        model_ids = list(nodes)
+        exposures = {}
+        for i in range(self._project.exposures):
+            unique_id = f"exposure.{PROJECT_NAME}.exposure_{i}"
+            refs = self._random.sample(model_ids, min(len(model_ids), 5))
+            exposures[unique_id] = {
+                "name": f"exposure_{i}",
+                "resource_type": "exposure",
+                "unique_id": unique_id,
+                "type": "dashboard",
+                "tags": [f"tag_{i % 3}"],
+                "refs": [{"name": nodes[ref]["name"]} for ref in refs],
+                "depends_on": {"macros": [], "nodes": refs},
+            }
+
+        manifest = {
+            "metadata": {"adapter_type": "bigquery", "project_name": PROJECT_NAME},
+            "nodes": nodes,
+            "exposures": exposures,
+        }
+        catalog = {"metadata": {}, "nodes": catalog_nodes, "sources": {}}
+        return manifest, catalog
+
+
+def generate_project(target_dir: str, project: SyntheticProject) -> Tuple[str, str]:
+    """Write a synthetic manifest.json and catalog.json to a target directory.
+
+    Returns:
+        The paths of the manifest and the catalog
+    """
+    manifest, catalog = _ProjectBuilder(project).build()
+
+    os.makedirs(target_dir, exist_ok=True)
+    paths = []
+    for file_name, contents in (("manifest.json", manifest), ("catalog.json", catalog)):
+        path = os.path.join(target_dir, file_name)
+        with open(path, "w") as f:
+            json.dump(contents, f)
+        paths.append(path)
+    return tuple(paths)
@@ -1,8 +1,16 @@
 import argparse
+import copy
+import cProfile
+import math
 import os
+import time
+import warnings
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
 from dbt2looker_bigquery.warnings import captured_warnings
 
-import lkml
 
 try:
     from importlib.metadata import version
@@ -13,9 +21,33 @@ import logging
 
 from rich.logging import RichHandler
 
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.database.bigquery import DEFAULT_MAX_WORKERS
+from dbt2looker_bigquery.database.cache import DEFAULT_TTL
+from dbt2looker_bigquery.exceptions import CliError
 from dbt2looker_bigquery.generators import LookmlGenerator
+from dbt2looker_bigquery.generators.emitter import dump_lookml
+from dbt2looker_bigquery.incremental import IncrementalState
+from dbt2looker_bigquery.index import ArtifactIndex
+from dbt2looker_bigquery.output import OutputWriter
 from dbt2looker_bigquery.parsers import DbtParser
+from dbt2looker_bigquery.parsers.catalog import CatalogStreamParser
+from dbt2looker_bigquery.parsers.manifest import ManifestStreamParser
+from dbt2looker_bigquery.parsers.selection import ModelSelector
+from dbt2looker_bigquery.profiling import (
+    CPROFILE_FILE_NAME,
+    log_report,
+    profiler,
+)
+from dbt2looker_bigquery.server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    GenerationService,
+    make_server,
+)
+from dbt2looker_bigquery.snapshot import ProjectSnapshot, SnapshotCache, snapshot_key
 from dbt2looker_bigquery.utils import FileHandler
+from dbt2looker_bigquery.watch import DEFAULT_INTERVAL, ArtifactWatcher
 
 logging.basicConfig(
     level=logging.INFO, format="%(message)s", datefmt="[%X]", handlers=[RichHandler()]
@@ -28,6 +60,8 @@ class Cli:
     BIGQUERY_DATASET = "BIGQUERY_DATASET"
     DBT_FOLDER = "DBT_FOLDER"
     DEFAULT_FOLDER_STRUCTURE = BIGQUERY_DATASET
+    # models per chunk sent to a worker process, when the number of models is unknown
+    POOL_CHUNK_SIZE = 16
     HEADER = """
     Convert your dbt models to LookML views
     """
@@ -35,6 +69,9 @@ class Cli:
     def __init__(self):
         self._args_parser = self._init_argparser()
         self._file_handler = FileHandler()
+        self._state = None
+        # unique ids of all models in the manifest, used to prune deleted models
+        self._model_ids = None
 
     def _init_argparser(self):
         """Create and configure the argument parser"""
@@ -54,11 +91,7 @@ class Cli:
             default=self.DEFAULT_TARGET_DIR,
             type=str,
         )
-        parser.add_argument(
-            "--tag",
-            help="Filter to dbt models using this tag, can be combined with --exposures-only to only generate lookml files for exposures with this tag",
-            type=str,
-        )
+        self._add_request_arguments(parser)
         parser.add_argument(
             "--log-level",
             "-log",
@@ -73,6 +106,137 @@ class Cli:
             default=self.DEFAULT_LOOKML_OUTPUT_DIR,
             type=str,
         )
+        parser.add_argument(
+            "--strict",
+            help="Add this flag to enable strict mode. This will raise an error for any lookml parsing errors and deprecations. It will expect all --select models to generate files.",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--prefilter",
+            help="Deprecated: models are always selected before parsing, this flag has no effect",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--stream-manifest",
+            help="Experimental: add this flag to read manifest.json incrementally, only keeping the models that pass the filters in memory",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--artifact-index",
+            help="Add this flag to store an index of manifest.json and catalog.json next to them, so runs that select a few models only decode those models. The index is built on the first run and whenever the artifacts change",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--snapshot-cache-dir",
+            help="Directory for snapshots of the models in manifest.json and catalog.json. Runs against the same artifacts load the snapshot instead of decoding the artifacts. Disabled by default",
+            default=None,
+        )
+        parser.add_argument(
+            "--no-prune",
+            help="Add this flag to keep views in the output directory that were written for models that have since been deleted or moved",
+            action="store_false",
+            dest="prune",
+            default=True,
+        )
+        parser.add_argument(
+            "--incremental",
+            help="Add this flag to only regenerate views for models whose manifest, catalog or generation options changed since the last run",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--watch",
+            help="Add this flag to keep running and regenerate the views of changed models whenever manifest.json or catalog.json change",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--watch-interval",
+            help=f"Seconds between checks for changes with --watch. Default is {DEFAULT_INTERVAL}",
+            type=float,
+            default=DEFAULT_INTERVAL,
+        )
+        parser.add_argument(
+            "--serve",
+            help=f"Add this flag to start a local server on {DEFAULT_HOST} that keeps the dbt project in memory and generates views on request",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--port",
+            help=f"Port of the server started with --serve. Default is {DEFAULT_PORT}",
+            type=int,
+            default=DEFAULT_PORT,
+        )
+        parser.add_argument(
+            "--profile",
+            help="Record the time spent per stage and per model, and write a JSON report and a Chrome trace to this directory. Default is ./profile",
+            nargs="?",
+            const="profile",
+            default=None,
+        )
+        parser.add_argument(
+            "--profile-top",
+            help="Number of slowest models to list with --profile. Default is 10",
+            type=int,
+            default=10,
+        )
+        parser.add_argument(
+            "--cprofile",
+            help="Add this flag to also write a cProfile dump to the --profile directory, covering the main process only",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            help="Number of processes used to generate and write views. Default is 1",
+            type=int,
+            default=1,
+        )
+        parser.add_argument(
+            "--typing-source",
+            "-ts",
+            help="Experimental: Define the catalog parser to use. Default is 'CATALOG', options ['DATABASE', 'CATALOG']",
+            default="CATALOG",
+        )
+        parser.add_argument(
+            "--database-concurrency",
+            help=f"Number of table schemas fetched concurrently with '--typing-source DATABASE'. Default is {DEFAULT_MAX_WORKERS}",
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+        )
+        parser.add_argument(
+            "--schema-cache-dir",
+            help="Directory for caching table schemas between runs with '--typing-source DATABASE'. Disabled by default",
+            type=str,
+            default=None,
+        )
+        parser.add_argument(
+            "--schema-cache-ttl",
+            help=f"Seconds a cached table schema is used before checking if the table has changed. Default is {DEFAULT_TTL}",
+            type=float,
+            default=DEFAULT_TTL,
+        )
+        parser.set_defaults(
+            build_explore=True, write_output=True, hide_arrays_and_structs=True
+        )
+        return parser
+
+    def _add_request_arguments(self, parser):
+        """Add the arguments that select models and shape the LookML
+
+        These are also the only arguments a request to the generation server can set.
+        """
+        parser.add_argument(
+            "--tag",
+            help="Filter to dbt models using this tag, can be combined with --exposures-only to only generate lookml files for exposures with this tag",
+            type=str,
+        )
         parser.add_argument(
             "--exposures-only",
             help="add this flag to only generate lookml files for exposures",
@@ -141,126 +305,414 @@ class Cli:
             action="store_false",
             dest="write_output",
         )
-        parser.add_argument(
-            "--strict",
-            help="Add this flag to enable strict mode. This will raise an error for any lookml parsing errors and deprecations. It will expect all --select models to generate files.",
-            action="store_true",
-            default=False,
-        )
-        parser.add_argument(
-            "--prefilter",
-            help="Experimental: add this flag to prefilter the manifest.json file before parsing for --select",
-            action="store_true",
-            default=False,
-        )
-        parser.add_argument(
-            "--typing-source",
-            "-ts",
-            help="Experimental: Define the catalog parser to use. Default is 'CATALOG', options ['DATABASE', 'CATALOG']",
-            default="CATALOG",
-        )
         parser.add_argument(
             "--prefix",
             help="Experimental: add a string to prefix all generated views with this string",
             type=str,
             default=None,
         )
-        parser.set_defaults(
-            build_explore=True, write_output=True, hide_arrays_and_structs=True
-        )
-        return parser
-
-    def _write_lookml_file(
-        self,
-        output_dir: str,
-        file_path: str,
-        contents: str,
-    ) -> str:
-        """Write LookML content to a file."""
-        # Create directory structure
 
-        file_name = os.path.basename(file_path)
-        file_path = os.path.join(output_dir, file_path.split(file_name)[0])
-        os.makedirs(file_path, exist_ok=True)
+    def _init_request_argparser(self):
+        """Create the argument parser for requests to the generation server"""
+        parser = argparse.ArgumentParser(prog="POST /generate", add_help=False)
+        self._add_request_arguments(parser)
+        return parser
 
-        file_path = f"{file_path}/{file_name}"
+    def _generate_views(self, args, models) -> Iterator[Tuple[str, str]]:
+        """Generate, serialize and write the views of models one at a time.
 
-        # Write contents
-        self._file_handler.write(file_path, contents)
+        Yields the unique id of each model with the path of its view, or with the
+        LookML itself when no output is written.
+        """
+        lookml_generator = LookmlGenerator(GeneratorConfig.from_args(args))
+        if args.write_output:
+            output_writer = OutputWriter(args.output_dir, self._file_handler)
 
-        return file_path
+        for model in models:
+            with profiler.span("LookmlGenerator.generate", model.unique_id):
+                file_path, lookml = lookml_generator.generate(
+                    model=model,
+                )
 
-    def generate(self, args, models):
-        """Generate LookML views from dbt models"""
-        logging.info("Parsing dbt models (bigquery) and creating lookml views...")
+            with profiler.span("dump_lookml", model.unique_id):
+                contents = dump_lookml(lookml)
 
-        lookml_generator = LookmlGenerator(args)
+            if args.write_output:
+                with profiler.span("FileHandler.write", model.unique_id):
+                    view = output_writer.write(file_path, contents)
+            else:
+                view = contents
 
-        views = []
-        for model in models:
-            file_path, lookml = lookml_generator.generate(
-                model=model,
-            )
+            yield model.unique_id, view
 
-            if args.write_output:
-                view = self._write_lookml_file(
-                    output_dir=args.output_dir,
-                    file_path=file_path,
-                    contents=lkml.dump(lookml),
+    def _generate_views_in_pool(self, args, models) -> Iterator[Tuple[str, str]]:
+        """Generate views in a process pool, with a bounded number of chunks in flight"""
+        if isinstance(models, list):
+            # a few chunks per process keeps the workers busy when model sizes vary
+            chunk_size = math.ceil(len(models) / (args.jobs * 4))
+        else:
+            chunk_size = self.POOL_CHUNK_SIZE
+        models = iter(models)
+        chunks = iter(lambda: list(islice(models, chunk_size)), [])
+
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        _generate_views_worker, args, chunk, profiler.enabled
+                    )
                 )
-            else:
-                view = lkml.dump(lookml)
+                if len(pending) >= args.jobs * 2:
+                    yield from self._collect_chunk(pending.popleft().result())
+            while pending:
+                yield from self._collect_chunk(pending.popleft().result())
+
+    def _collect_chunk(self, result) -> List[Tuple[str, str]]:
+        """Merge the warnings, file counts and profile spans of a worker into this process"""
+        chunk_views, chunk_warnings, chunk_counts, chunk_spans = result
+        captured_warnings.extend(chunk_warnings)
+        self._file_handler.counts.update(chunk_counts)
+        profiler.merge(chunk_spans)
+        return chunk_views
+
+    def generate(self, args, models) -> Counter:
+        """Generate LookML views from dbt models
+
+        models can be any iterable, a generator is consumed one model at a time.
+        Returns the summary counts of the run.
+        """
+        logging.info("Parsing dbt models (bigquery) and creating lookml views...")
 
-            views.append(view)
+        if args.jobs > 1 and not (isinstance(models, list) and len(models) < 2):
+            logging.debug(f"Generating views with {args.jobs} processes")
+            views = self._generate_views_in_pool(args, models)
+        else:
+            views = self._generate_views(args, models)
+
+        counts = Counter()
+        # only the paths are kept, to prune views that were written elsewhere
+        written = {}
+        for unique_id, view in views:
+            counts["views"] += 1
+            if self._state is not None:
+                self._state.record(unique_id, view)
+            if args.write_output and args.prune:
+                written[unique_id] = view
+
+        if self._state is not None:
+            self._state.save()
+
+        if args.write_output and args.prune:
+            OutputWriter(args.output_dir, self._file_handler).prune(
+                written, self._model_ids
+            )
 
-        logging.info(f"Generated {len(views)} views")
+        logging.info(f"Generated {counts['views']} views")
+        if args.write_output:
+            counts.update(self._file_handler.counts)
+            logging.info(
+                f"Files written: {counts['written']}, unchanged: {counts['unchanged']}, removed: {counts['removed']}"
+            )
         logging.info("Success")
+        return counts
 
     def parse(self, args):
         """parse dbt models"""
-        raw_manifest = self._file_handler.read(
-            os.path.join(args.target_dir, "manifest.json")
-        )
+        config = GeneratorConfig.from_args(args)
+        return self._load_parser(args, config).get_models(config)
+
+    def iter_models(self, args) -> Iterator:
+        """parse dbt models lazily, one model at a time"""
+        config = GeneratorConfig.from_args(args)
+        return self._load_parser(args, config).iter_models(config)
+
+    def _load_parser(self, args, config: GeneratorConfig) -> DbtParser:
+        """Read the dbt artifacts and set up the parser"""
+        if args.prefilter:
+            logging.warning(
+                "--prefilter is deprecated and has no effect, models are always selected before parsing"
+            )
+        with profiler.span("Cli.read_artifacts"):
+            return self._read_artifacts(args, config)
+
+    def _read_artifacts(self, args, config: GeneratorConfig) -> DbtParser:
+        manifest_path = os.path.join(args.target_dir, "manifest.json")
+        if args.snapshot_cache_dir:
+            raw_manifest, raw_catalog, selector = self._read_snapshot(
+                args, config, manifest_path
+            )
+            self._model_ids = selector.model_ids
+            return self._create_parser(
+                args, config, raw_manifest, raw_catalog, selector
+            )
+
+        if args.artifact_index:
+            raw_manifest, selector = self._read_indexed_manifest(
+                args, config, manifest_path
+            )
+            self._model_ids = selector.model_ids
+        else:
+            if args.stream_manifest:
+                manifest_parser = ManifestStreamParser(config, self._file_handler)
+                raw_manifest = manifest_parser.read(manifest_path)
+            else:
+                raw_manifest = self._file_handler.read(manifest_path)
+
+            selector = ModelSelector(
+                raw_manifest.get("nodes", {}), raw_manifest.get("exposures", {})
+            )
+            self._model_ids = (
+                manifest_parser.model_ids
+                if args.stream_manifest
+                else selector.model_ids
+            )
 
         if args.typing_source == "DATABASE":
             logging.debug("Using database as typing source, skipping catalog.json")
             raw_catalog = None
         else:
-            raw_catalog = self._file_handler.read(
-                os.path.join(args.target_dir, "catalog.json")
+            raw_catalog = self._read_catalog(args, selector.select_for(config))
+
+        return self._create_parser(args, config, raw_manifest, raw_catalog, selector)
+
+    def _create_parser(
+        self,
+        args,
+        config: GeneratorConfig,
+        raw_manifest: dict,
+        raw_catalog: Optional[dict],
+        selector,
+    ) -> DbtParser:
+        # in watch mode the state of the previous build is kept
+        if not args.watch or self._state is None:
+            self._state = self._init_state(args, config)
+
+        return DbtParser(
+            raw_manifest,
+            raw_catalog,
+            config,
+            state=self._state,
+            selector=selector,
+            model_ids=self._model_ids,
+        )
+
+    def _read_snapshot(
+        self, args, config: GeneratorConfig, manifest_path: str
+    ) -> Tuple[dict, Optional[dict], ModelSelector]:
+        """Select on a snapshot of the artifacts, taking it first if there is none"""
+        catalog_path = (
+            None
+            if args.typing_source == "DATABASE"
+            else os.path.join(args.target_dir, "catalog.json")
+        )
+        try:
+            key = snapshot_key(manifest_path, catalog_path)
+        except FileNotFoundError as e:
+            logging.error(
+                f"Could not find file at {e.filename}. Use --target-dir to change the search path for the manifest.json file."
+            )
+            raise CliError("File not found") from e
+
+        cache = SnapshotCache(args.snapshot_cache_dir)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            logging.info(f"Taking a snapshot of the models in {args.target_dir}")
+            snapshot = ProjectSnapshot.from_artifacts(
+                self._file_handler.read(manifest_path),
+                self._file_handler.read(catalog_path) if catalog_path else None,
             )
+            cache.put(key, snapshot)
+        else:
+            logging.debug(f"Using the snapshot of the models in {args.target_dir}")
 
-        parser = DbtParser(raw_manifest, raw_catalog, args)
-        return parser.get_models(args)
+        selector = ModelSelector(snapshot.models, snapshot.exposures)
+        unique_ids = selector.select_for(config)
+        raw_catalog = snapshot.raw_catalog(unique_ids) if catalog_path else None
+        return snapshot.raw_manifest(unique_ids), raw_catalog, selector
 
-    def run(self):
-        """Run the CLI"""
+    def _open_index(self, file_path: str) -> ArtifactIndex:
+        try:
+            return ArtifactIndex(file_path, self._file_handler.decoder)
+        except FileNotFoundError as e:
+            logging.error(
+                f"Could not find file at {file_path}. Use --target-dir to change the search path for the manifest.json file."
+            )
+            raise CliError("File not found") from e
+
+    def _read_indexed_manifest(
+        self, args, config: GeneratorConfig, manifest_path: str
+    ) -> Tuple[dict, ModelSelector]:
+        """Select on the index of manifest.json, only decoding the selected models"""
+        index = self._open_index(manifest_path)
+        exposures = index.read_section("exposures", {})
+        selector = ModelSelector(index.models, exposures)
+        unique_ids = selector.select_for(config)
+        if len(unique_ids) == len(selector.model_ids):
+            # a full load is faster than decoding every model on its own
+            return self._file_handler.read(manifest_path), selector
+
+        raw_manifest = {
+            "metadata": index.read_section("metadata", {}),
+            "exposures": exposures,
+            "nodes": index.read_nodes(unique_ids),
+        }
+        return raw_manifest, selector
+
+    def _init_state(self, args, config: GeneratorConfig) -> Optional[IncrementalState]:
+        if not (args.incremental or args.watch) or not args.write_output:
+            return None
+        if args.typing_source == "DATABASE":
+            logging.warning(
+                "--incremental and --watch need catalog.json to detect changes, generating all models"
+            )
+            return None
+        # --watch alone keeps the state in memory, --incremental also stores it
+        return IncrementalState(args.output_dir, config, persist=args.incremental)
+
+    def _read_catalog(self, args, unique_ids: List[str]) -> dict:
+        """Read catalog.json, only keeping the nodes of the selected models"""
+        catalog_path = os.path.join(args.target_dir, "catalog.json")
+        if len(unique_ids) < len(self._model_ids) and args.artifact_index:
+            return {"nodes": self._open_index(catalog_path).read_nodes(unique_ids)}
+        if len(unique_ids) < len(self._model_ids):
+            return CatalogStreamParser(unique_ids, self._file_handler).read(
+                catalog_path
+            )
+        # a full load is faster than streaming when every model is selected
+        return self._file_handler.read(catalog_path)
+
+    def _run_profiled(self, args):
+        """Parse and generate while recording where the time goes"""
+        cprofile = cProfile.Profile() if args.cprofile else None
+        profiler.reset()
+        profiler.enable()
+        if cprofile:
+            cprofile.enable()
+        try:
+            self.generate(args, self.iter_models(args))
+        finally:
+            if cprofile:
+                cprofile.disable()
+            profiler.disable()
+
+        report = profiler.write(args.profile, top=args.profile_top)
+        log_report(report)
+        if cprofile:
+            cprofile.dump_stats(os.path.join(args.profile, CPROFILE_FILE_NAME))
+
+    def watch(self, args):
+        """Generate views, then regenerate them whenever the dbt artifacts change.
+
+        The state of every view is kept between builds, so only the models whose
+        manifest node, catalog node or view file changed are parsed and written again.
+        Stops on Ctrl+C.
+        """
+        watcher = ArtifactWatcher(
+            [
+                os.path.join(args.target_dir, "manifest.json"),
+                os.path.join(args.target_dir, "catalog.json"),
+            ],
+            args.watch_interval,
+        )
+        try:
+            while True:
+                start = time.perf_counter()
+                # report problems on every build, not only the first time they occur
+                with warnings.catch_warnings():
+                    warnings.simplefilter("always")
+                    try:
+                        self.generate(args, self.iter_models(args))
+                        logging.info(f"Built in {time.perf_counter() - start:.2f}s")
+                    except Exception as e:
+                        logging.error(f"Error occurred during generation. {e}")
+                self._log_feedback(args)
+                captured_warnings.clear()
+
+                logging.info(f"Watching {args.target_dir} for changes")
+                watcher.wait()
+        except KeyboardInterrupt:
+            logging.info("Stopped watching")
+
+    def serve(self, args):
+        """Answer generation requests until stopped with Ctrl+C.
+
+        Every request is generated with the arguments of the server, overridden by
+        the arguments in the request.
+        """
+        if args.typing_source == "DATABASE":
+            raise CliError(
+                "--serve needs catalog.json and does not support '--typing-source DATABASE'"
+            )
+        start = time.perf_counter()
+        service = GenerationService(args, self._init_request_argparser().parse_args)
+        # fill the caches without writing any files
+        warm_up = copy.copy(args)
+        warm_up.write_output = False
+        service.generate(warm_up)
+
+        server = make_server(service, DEFAULT_HOST, args.port)
+        logging.info(
+            f"Warmed up in {time.perf_counter() - start:.2f}s, serving on http://{DEFAULT_HOST}:{args.port}"
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logging.info("Stopped serving")
+        finally:
+            server.server_close()
+
+    def _log_feedback(self, args) -> bool:
+        """Log the distinct captured warnings, returning True if there were any"""
         user_feedback = []
+        for msg, cat, _, _ in captured_warnings:
+            key = f"{cat.__name__}: {msg}"
+            if key not in user_feedback:
+                user_feedback.append(key)
+
+        for m in user_feedback:
+            if args.strict:
+                logging.error(m)
+            else:
+                logging.warning(m)
+        return bool(user_feedback)
 
+    def run(self):
+        """Run the CLI"""
         try:
             args = self._args_parser.parse_args()
             logging.getLogger().setLevel(args.log_level)
 
-            models = self.parse(args)
-            self.generate(args, models)
+            if args.serve:
+                self.serve(args)
+                return
+            if args.watch:
+                self.watch(args)
+                return
+            if args.profile:
+                self._run_profiled(args)
+            else:
+                self.generate(args, self.iter_models(args))
 
         except Exception as e:
             # Logs should already be printed by the handler
             logging.error(f"Error occurred during generation. Stopped execution. {e}")
 
-        for msg, cat, _, _ in captured_warnings:
-            key = f"{cat.__name__}: {msg}"
-            if key not in user_feedback:
-                user_feedback.append(key)
+        if self._log_feedback(args) and args.strict:
+            exit(1)
 
-        if user_feedback:
-            for m in user_feedback:
-                if args.strict:
-                    logging.error(m)
-                else:
-                    logging.warning(m)
-            if args.strict:
-                exit(1)
+
+def _generate_views_worker(args, models, profile=False) -> tuple:
+    """Generate views in a worker process, returning the views, captured warnings, file counts and profile spans"""
+    logging.getLogger().setLevel(getattr(args, "log_level", "INFO"))
+    # a forked worker starts out with a copy of the warnings and spans of the parent
+    captured_warnings.clear()
+    profiler.reset()
+    if profile:
+        profiler.enable()
+    cli = Cli()
+    views = list(cli._generate_views(args, models))
+    return views, list(captured_warnings), cli._file_handler.counts, profiler.spans
 
 
 def main():
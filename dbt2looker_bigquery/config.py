@@ -0,0 +1,52 @@
+"""Typed configuration of model selection and LookML generation."""
+
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple
+
+from dbt2looker_bigquery.database.bigquery import DEFAULT_MAX_WORKERS
+from dbt2looker_bigquery.database.cache import DEFAULT_TTL
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Options that decide which models are generated and what their LookML looks like.
+
+    The parsers and generators take a config, the cli converts its arguments to one
+    with from_args. The attributes have the names of the cli arguments they mirror.
+    """
+
+    # selection
+    select: Optional[Tuple[str, ...]] = None
+    tag: Optional[str] = None
+    exposures_only: bool = False
+    exposures_tag: Optional[str] = None
+
+    # generation
+    build_explore: bool = True
+    use_table_name: bool = False
+    all_hidden: bool = False
+    folder_structure: str = "BIGQUERY_DATASET"
+    remove_prefix_from_dataset: Optional[str] = None
+    hide_arrays_and_structs: bool = True
+    implicit_primary_key: bool = False
+    prefix: Optional[str] = None
+
+    # typing
+    typing_source: str = "CATALOG"
+    database_concurrency: int = DEFAULT_MAX_WORKERS
+    schema_cache_dir: Optional[str] = None
+    schema_cache_ttl: float = DEFAULT_TTL
+
+    def __post_init__(self):
+        if self.select is not None:
+            # a tuple keeps the config hashable
+            object.__setattr__(self, "select", tuple(self.select))
+
+    @classmethod
+    def from_args(cls, args) -> "GeneratorConfig":
+        """Create a config from parsed cli arguments, ignoring the options it has no field for.
+
+        Raises:
+            AttributeError: If the arguments lack an option of the config
+        """
+        return cls(**{field.name: getattr(args, field.name) for field in fields(cls)})
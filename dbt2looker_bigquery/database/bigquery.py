@@ -1,33 +1,104 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple, Union
+
 import google.auth
 from google.auth.transport.requests import Request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dbt2looker_bigquery.database.models.bigqueryTable import (
     BigQueryTableSchema,
     BigQueryFieldSchema,
 )
 
+from dbt2looker_bigquery.database.cache import SchemaCache
 from dbt2looker_bigquery.models.dbt import DbtCatalogNode
 from dbt2looker_bigquery.enums import BigqueryMode, BigqueryType, BigqueryUrl
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
-class BigQueryDatabase:
-    def _fetch_table_schema(
-        self, project_id: str, dataset_id: str, table_id: str
-    ) -> BigQueryTableSchema:
-        """Fetch the schema of a BigQuery table and parse it into a Pydantic model."""
-        credentials, _ = google.auth.default()
+TableId = Tuple[str, str, str]
 
-        credentials.refresh(Request())
 
-        url = BigqueryUrl.BIGQUERY.value.format(
+class BigQueryDatabase:
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        url_template: str = BigqueryUrl.BIGQUERY.value,
+        credentials=None,
+        timeout: float = 10,
+        cache: Optional[SchemaCache] = None,
+    ):
+        """Configure the client. Credentials and the session are created on first use."""
+        self._max_workers = max(1, max_workers)
+        self._retries = retries
+        self._backoff = backoff
+        self._url_template = url_template
+        self._credentials = credentials
+        self._timeout = timeout
+        self._cache = cache
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """Get a session with a connection pool sized for the concurrent fetches."""
+        with self._lock:
+            if self._session is None:
+                retry = Retry(
+                    total=self._retries,
+                    backoff_factor=self._backoff,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=("GET",),
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self._max_workers,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+        return self._session
+
+    def _get_token(self) -> str:
+        """Get an access token, only refreshing the credentials when they have expired."""
+        with self._lock:
+            if self._credentials is None:
+                self._credentials, _ = google.auth.default()
+            if not self._credentials.valid:
+                self._credentials.refresh(Request())
+            return self._credentials.token
+
+    def _fetch_table(
+        self, project_id: str, dataset_id: str, table_id: str, fields: str = None
+    ) -> dict:
+        """Fetch a BigQuery table resource, optionally limited to some fields."""
+        url = self._url_template.format(
             project_id=project_id, dataset_id=dataset_id, table_id=table_id
         )
 
-        headers = {"Authorization": f"Bearer {credentials.token}"}
-        response = requests.get(url, headers=headers, timeout=10)
+        headers = {"Authorization": f"Bearer {self._get_token()}"}
+        params = {"fields": fields} if fields else None
+        response = self._get_session().get(
+            url, headers=headers, params=params, timeout=self._timeout
+        )
         response.raise_for_status()
 
-        table_info = response.json()
+        return response.json()
+
+    def _fetch_table_schema(
+        self, project_id: str, dataset_id: str, table_id: str
+    ) -> BigQueryTableSchema:
+        """Fetch the schema of a BigQuery table and parse it into a Pydantic model."""
+        table_info = self._fetch_table(project_id, dataset_id, table_id)
 
         schema = BigQueryTableSchema(fields=table_info["schema"]["fields"])
 
@@ -89,9 +160,66 @@ class BigQueryDatabase:
 
         return DbtCatalogNode(**catalog_schema)
 
-    def get_dbt_table_schema(self, project, dataset, table_id) -> BigQueryTableSchema:
+    def get_dbt_table_schema(self, project, dataset, table_id) -> DbtCatalogNode:
         """get the schema of a dbt table and parse it into a common dbt model schema."""
-        schema = self._fetch_table_schema(project, dataset, table_id)
+        if self._cache is None:
+            schema = self._fetch_table_schema(project, dataset, table_id)
+            return self._translate_schema_to_dbt_model(schema)
+
+        key = (project, dataset, table_id)
+        entry = self._cache.get(key)
+        if entry is not None:
+            if self._cache.is_fresh(entry):
+                return entry.node
+        if entry is not None and (entry.etag or entry.last_modified):
+            # a metadata only request is enough to tell if the table has changed
+            metadata = self._fetch_table(
+                project, dataset, table_id, fields="etag,lastModifiedTime"
+            )
+            if (metadata.get("etag"), metadata.get("lastModifiedTime")) == (
+                entry.etag,
+                entry.last_modified,
+            ):
+                self._cache.touch(key, entry)
+                return entry.node
+
+        table_info = self._fetch_table(project, dataset, table_id)
+        schema = BigQueryTableSchema(fields=table_info["schema"]["fields"])
         catalog_schema = self._translate_schema_to_dbt_model(schema)
+        self._cache.put(
+            key,
+            catalog_schema,
+            table_info.get("etag"),
+            table_info.get("lastModifiedTime"),
+        )
 
         return catalog_schema
+
+    def _get_dbt_table_schema_or_error(
+        self, table: TableId
+    ) -> Union[DbtCatalogNode, Exception]:
+        try:
+            return self.get_dbt_table_schema(*table)
+        except Exception as e:
+            return e
+
+    def get_dbt_table_schemas(
+        self, tables: Iterable[TableId]
+    ) -> Dict[TableId, Union[DbtCatalogNode, Exception]]:
+        """Fetch the schemas of many tables concurrently.
+
+        Failed fetches are returned as the exception that was raised, so the caller can
+        decide when to surface them.
+        """
+        tables = list(dict.fromkeys(tables))
+        logging.debug(
+            f"Fetching {len(tables)} table schemas with {self._max_workers} workers"
+        )
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            schemas = dict(
+                zip(tables, executor.map(self._get_dbt_table_schema_or_error, tables))
+            )
+
+        if self._cache is not None:
+            self._cache.evict()
+        return schemas
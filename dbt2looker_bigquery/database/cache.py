@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from pydantic import ValidationError
+
+from dbt2looker_bigquery.models.dbt import DbtCatalogNode
+from dbt2looker_bigquery.utils import evict_least_recently_used, write_atomic
+
+CACHE_VERSION = 1
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRIES = 10000
+
+TableId = Tuple[str, str, str]
+
+
+@dataclass
+class SchemaCacheEntry:
+    """A cached table schema and the table metadata it was fetched with."""
+
+    node: DbtCatalogNode
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class SchemaCache:
+    """On-disk cache of translated table schemas for the DATABASE typing source.
+
+    Entries are keyed by project.dataset.table. Within the ttl an entry is used as is,
+    after that it is only used if the table's etag and lastModifiedTime are unchanged.
+    The least recently used entries are evicted when there are more than max_entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        self._max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, table_id: TableId) -> str:
+        key = ".".join(str(part) for part in table_id)
+        return os.path.join(self._cache_dir, f"{quote(key, safe='')}.json")
+
+    def get(self, table_id: TableId) -> Optional[SchemaCacheEntry]:
+        """Get a cached schema, or None if it is missing or unreadable."""
+        path = self._path(table_id)
+        try:
+            with open(path, "r") as f:
+                raw_entry = json.load(f)
+            if raw_entry.get("version") != CACHE_VERSION:
+                return None
+            entry = SchemaCacheEntry(
+                node=DbtCatalogNode.model_validate(raw_entry["node"]),
+                etag=raw_entry.get("etag"),
+                last_modified=raw_entry.get("last_modified"),
+                fetched_at=raw_entry["fetched_at"],
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, ValidationError):
+            logging.debug(f"Ignoring unreadable schema cache entry {path}")
+            return None
+
+        # the modification time tracks use, so eviction drops the least recently used
+        os.utime(path)
+        return entry
+
+    def is_fresh(self, entry: SchemaCacheEntry) -> bool:
+        """Check if an entry can be used without asking the database."""
+        return time.time() - entry.fetched_at < self._ttl
+
+    def put(
+        self,
+        table_id: TableId,
+        node: DbtCatalogNode,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ):
+        """Store a schema, replacing any existing entry atomically."""
+        raw_entry = {
+            "version": CACHE_VERSION,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "node": node.model_dump(),
+        }
+        write_atomic(self._path(table_id), json.dumps(raw_entry))
+
+    def touch(self, table_id: TableId, entry: SchemaCacheEntry):
+        """Mark an entry as verified against the database just now."""
+        self.put(table_id, entry.node, entry.etag, entry.last_modified)
+
+    def evict(self):
+        """Remove the least recently used entries beyond max_entries."""
+        excess = evict_least_recently_used(self._cache_dir, ".json", self._max_entries)
+        if excess:
+            logging.debug(f"Evicted {excess} entries from the schema cache")
@@ -0,0 +1,110 @@
+"""JSON decoding of dbt artifacts with the best decoder that is installed.
+
+msgspec or orjson is used when installed, e.g. with the fast-json extra, and the
+standard library otherwise. They are handed a memory map of the file, so no bytes
+copy of the whole file is made by Python.
+"""
+
+import gc
+import json
+import logging
+import mmap
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+STDLIB_DECODER = "json"
+
+
+def _decode_stdlib(data) -> Any:
+    return json.loads(str(data, "utf-8"))
+
+
+def _decode_orjson(data) -> Any:
+    return orjson.loads(data)
+
+
+def _decode_msgspec(data) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+# installed decoders, preferred first; msgspec decodes about as fast as orjson,
+# which first builds a document of its own, so msgspec needs less memory
+DECODERS: Dict[str, Callable[[Any], Any]] = {}
+if msgspec is not None:
+    DECODERS["msgspec"] = _decode_msgspec
+if orjson is not None:
+    DECODERS["orjson"] = _decode_orjson
+DECODERS[STDLIB_DECODER] = _decode_stdlib
+
+
+def available_decoders() -> List[str]:
+    """Names of the installed decoders, preferred first."""
+    return list(DECODERS)
+
+
+def default_decoder() -> str:
+    """Name of the decoder used when none is asked for."""
+    return next(iter(DECODERS))
+
+
+def decode(data, decoder: Optional[str] = None) -> Any:
+    """Decode a JSON document from bytes or any other buffer.
+
+    orjson and msgspec reject some documents that the standard library accepts,
+    e.g. with NaN values or integers beyond 64 bits, those are decoded again with
+    the standard library.
+    """
+    decoder = decoder or default_decoder()
+    try:
+        return DECODERS[decoder](data)
+    except ValueError:
+        if decoder == STDLIB_DECODER:
+            raise
+        logging.debug(f"{decoder} could not decode the document, retrying with json")
+        return _decode_stdlib(data)
+
+
+def load_json(file_path: str, decoder: Optional[str] = None) -> Any:
+    """Decode a JSON file, through a memory map of its contents where that helps.
+
+    Raises:
+        KeyError: If the decoder is not installed
+        ValueError: If the file is not valid JSON
+    """
+    decoder = decoder or default_decoder()
+    if decoder not in DECODERS:
+        raise KeyError(f"JSON decoder {decoder} is not installed")
+
+    # a decoded document has no reference cycles, pausing the garbage collector
+    # saves it from walking the new objects over and over while they are created
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if decoder == STDLIB_DECODER:
+            # json decodes text, a memory map would only add its pages to the text copy
+            with open(file_path, "r") as f:
+                return json.load(f)
+
+        with open(file_path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty files and some special files cannot be mapped
+                return decode(f.read(), decoder)
+            with mapped, memoryview(mapped) as data:
+                return decode(data, decoder)
+    finally:
+        if gc_enabled:
+            gc.enable()
@@ -3,24 +3,27 @@
 import os
 from typing import Dict
 
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.generators.dimension import LookmlDimensionGenerator
 from dbt2looker_bigquery.generators.explore import LookmlExploreGenerator
 from dbt2looker_bigquery.generators.measure import LookmlMeasureGenerator
 from dbt2looker_bigquery.generators.view import LookmlViewGenerator
 from dbt2looker_bigquery.models.dbt import DbtModel
 from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
+from dbt2looker_bigquery.utils import StructureGenerator
 
 
 class LookmlGenerator:
     """Main LookML generator that coordinates dimension, view, and explore generation."""
 
-    def __init__(self, cli_args):
-        self._cli_args = cli_args
-        self.dimension_generator = LookmlDimensionGenerator(cli_args)
-        self.view_generator = LookmlViewGenerator(cli_args)
-        self.explore_generator = LookmlExploreGenerator(cli_args)
-        self.measure_generator = LookmlMeasureGenerator(cli_args)
-        self.applier = MetaAttributeApplier(cli_args)
+    def __init__(self, config: GeneratorConfig):
+        self._config = config
+        self.dimension_generator = LookmlDimensionGenerator(config)
+        self.view_generator = LookmlViewGenerator(config)
+        self.explore_generator = LookmlExploreGenerator(config)
+        self.measure_generator = LookmlMeasureGenerator(config)
+        self.applier = MetaAttributeApplier(config)
+        self.structure_generator = StructureGenerator(config)
 
     def _get_view_label(self, model: DbtModel) -> str:
         """Get the view label from the model metadata or name."""
@@ -36,16 +39,16 @@ class LookmlGenerator:
 
     def _get_file_path(self, model: DbtModel) -> str:
         """Get the file path for the LookML view."""
-        if self._cli_args.folder_structure == "BIGQUERY_DATASET":
+        if self._config.folder_structure == "BIGQUERY_DATASET":
             file_path = model.db_schema
-            if self._cli_args.remove_prefix_from_dataset:
+            if self._config.remove_prefix_from_dataset:
                 file_path = file_path.replace(
-                    f"{self._cli_args.remove_prefix_from_dataset}.", ""
+                    f"{self._config.remove_prefix_from_dataset}.", ""
                 )
-        elif self._cli_args.folder_structure == "DBT_FOLDER":
+        elif self._config.folder_structure == "DBT_FOLDER":
             file_path = os.path.join(model.path.split(model.name)[0][:-1])
 
-        if self._cli_args.use_table_name:
+        if self._config.use_table_name:
             file_name = model.relation_name.split(".")[-1].strip("`")
         else:
             file_name = model.name
@@ -57,10 +60,15 @@ class LookmlGenerator:
 
         lookml = {}
 
+        # the grouping is shared by the explore and the views
+        grouped_columns = self.structure_generator.process_model(model)
+
         if (
-            self._cli_args.build_explore
+            self._config.build_explore
         ):  # When build_explore is True, we should generate the explore
-            explore = self.explore_generator.generate(model=model)
+            explore = self.explore_generator.generate(
+                model=model, grouped_columns=grouped_columns
+            )
             if explore:
                 lookml["explore"] = explore
 
@@ -69,6 +77,7 @@ class LookmlGenerator:
             model=model,
             dimension_generator=self.dimension_generator,
             measure_generator=self.measure_generator,
+            grouped_columns=grouped_columns,
         )
 
         lookml["views"] = views
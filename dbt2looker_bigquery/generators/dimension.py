@@ -2,27 +2,23 @@
 
 from typing import Optional
 
-from dbt2looker_bigquery.enums import (
-    LookerDateTimeframes,
-    LookerDateTimeTypes,
-    LookerDateTypes,
-    LookerScalarTypes,
-    LookerTimeTimeframes,
-)
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.generators.utils import (
+    DATE_TIMEFRAMES,
+    TIME_TIMEFRAMES,
+    classify_column,
     get_sql_expression,
-    map_bigquery_to_looker,
     MetaAttributeApplier,
 )
-from dbt2looker_bigquery.models.dbt import DbtModelColumn
+from dbt2looker_bigquery.models.dbt import DbtModelColumn, replace_column
 
 
 class LookmlDimensionGenerator:
     """Lookml dimension generator."""
 
-    def __init__(self, args):
-        self._cli_args = args
-        self._applier = MetaAttributeApplier(args)
+    def __init__(self, config: GeneratorConfig):
+        self._config = config
+        self._applier = MetaAttributeApplier(config)
 
     def _format_label(self, name: str | None, remove_date: bool = True) -> str:
         """Format a name into a human-readable label."""
@@ -78,26 +74,21 @@ class LookmlDimensionGenerator:
 
     def _get_looker_dimension_group_type(self, column: DbtModelColumn) -> str:
         """Get the category of a column's type."""
-        looker_type = map_bigquery_to_looker(column.data_type)
-        if looker_type in LookerDateTimeTypes.values():
-            return "time"
-        elif looker_type in LookerDateTypes.values():
-            return "date"
-        return "scalar"
+        return classify_column(column).category
 
     def _create_dimension(
         self, column: DbtModelColumn, sql: str, dimension_name: str
     ) -> Optional[dict]:
         """Create a basic dimension dictionary."""
-        data_type = map_bigquery_to_looker(column.data_type)
-        if data_type is None:
+        classification = classify_column(column)
+        if classification.looker_type is None:
             return None
 
         dimension = {"name": dimension_name}
 
         # Add type for scalar types (should come before sql)
-        if data_type in LookerScalarTypes.values():
-            dimension["type"] = data_type
+        if classification.is_scalar:
+            dimension["type"] = classification.looker_type
 
         dimension |= {"sql": sql, "description": column.description or ""}
 
@@ -106,14 +97,14 @@ class LookmlDimensionGenerator:
             dimension["primary_key"] = "yes"
 
         # Handle array and struct types
-        if "ARRAY" in f"{column.data_type}":
-            if self._cli_args.hide_arrays_and_structs:
+        if classification.is_array:
+            if self._config.hide_arrays_and_structs:
                 dimension["hidden"] = "yes"
             dimension["tags"] = ["array"]
             dimension.pop("type", None)
-        elif "STRUCT" in f"{column.data_type}":
+        elif classification.is_struct:
             dimension["tags"] = ["struct"]
-            if self._cli_args.hide_arrays_and_structs:
+            if self._config.hide_arrays_and_structs:
                 dimension["hidden"] = "yes"
 
         self._applier.apply_meta_attributes(
@@ -154,7 +145,8 @@ class LookmlDimensionGenerator:
         view: dict,
     ) -> tuple:
         """Create dimension group for date/time fields."""
-        if map_bigquery_to_looker(column.data_type) is None:
+        looker_data_type = classify_column(column).looker_type
+        if looker_data_type is None:
             return None, None, None
 
         dimension_group_name = self._adjust_dimension_group_name(column, view)
@@ -162,11 +154,11 @@ class LookmlDimensionGenerator:
         if dimension_group_type == "date":
             looker_type = "time"
             convert_tz = "no"
-            timeframes = LookerDateTimeframes.values()
+            timeframes = list(DATE_TIMEFRAMES)
         elif dimension_group_type == "time":
             looker_type = "time"
             convert_tz = "yes"
-            timeframes = LookerTimeTimeframes.values()
+            timeframes = list(TIME_TIMEFRAMES)
         else:
             return None, None, None
 
@@ -178,7 +170,7 @@ class LookmlDimensionGenerator:
             "type": looker_type,
             "sql": sql,
             "description": column.description,
-            "datatype": map_bigquery_to_looker(column.data_type),
+            "datatype": looker_data_type,
             "timeframes": timeframes,
             "convert_tz": convert_tz,
             "group_label": dimension_group_name.replace("_", " ").title(),
@@ -211,44 +203,28 @@ class LookmlDimensionGenerator:
 
         return dimension_group, dimension_group_set, dimensions
 
-    def lookml_dimensions_from_model(
+    def lookml_fields_from_model(
         self, column_list: list[DbtModelColumn], is_main_view: bool, view: dict = None
-    ) -> tuple:
-        """Generate dimensions from model."""
-        dimensions = []
-
-        if self._cli_args.implicit_primary_key:
-            # add primary keys on the first column, override if there is a primary key in constraints
-            primary_key = True
-            for column in column_list:
-                column.is_primary_key = primary_key
-                primary_key = None
-
-        # Then add regular dimensions
-        for column in column_list:
-            dimension_group_type = self._get_looker_dimension_group_type(column)
-            if dimension_group_type in ("time", "date"):
-                continue
-
-            sql = get_sql_expression(column, is_main_view, view)
-            dimension_name = self._adjust_dimension_name(column, view)
-
-            dimension = self._create_dimension(column, sql, dimension_name)
-
-            if dimension is not None:
-                dimensions.append(dimension)
-
-        return dimensions
-
-    def lookml_dimension_groups_from_model(
-        self, columns: list[DbtModelColumn], is_main_view: bool, view: dict
     ) -> dict:
-        """Generate dimension groups from model."""
+        """Generate dimensions, dimension groups and their sets in one pass over the columns.
+
+        Returns:
+            A dict with the regular dimensions, the dimension groups, the dimension group
+            sets, and the iso dimensions that come with date dimension groups
+        """
         dimensions = []
         dimension_groups = []
         dimension_group_sets = []
+        dimension_group_dimensions = []
 
-        for column in columns:
+        if self._config.implicit_primary_key:
+            # add primary keys on the first column, override if there is a primary key in constraints
+            column_list = [
+                replace_column(column, is_primary_key=True if i == 0 else None)
+                for i, column in enumerate(column_list)
+            ]
+
+        for column in column_list:
             dimension_group_type = self._get_looker_dimension_group_type(column)
             if dimension_group_type in ("time", "date"):
                 dimension_group, dimension_group_set, dimension = (
@@ -264,10 +240,20 @@ class LookmlDimensionGenerator:
                 if dimension_group_set:
                     dimension_group_sets.append(dimension_group_set)
                 if dimension:
-                    dimensions.extend(dimension)
+                    dimension_group_dimensions.extend(dimension)
+                continue
+
+            sql = get_sql_expression(column, is_main_view, view)
+            dimension_name = self._adjust_dimension_name(column, view)
+
+            dimension = self._create_dimension(column, sql, dimension_name)
+
+            if dimension is not None:
+                dimensions.append(dimension)
 
         return {
-            "dimensions": dimensions or None,
+            "dimensions": dimensions,
             "dimension_groups": dimension_groups or None,
             "dimension_group_sets": dimension_group_sets or None,
+            "dimension_group_dimensions": dimension_group_dimensions or None,
         }
@@ -0,0 +1,215 @@
+"""Streaming serialization of generated LookML.
+
+lkml.dump builds a full syntax tree for every document before turning it into a
+string. The emitter in this module follows the same formatting rules, so its
+output is identical to lkml.dump, but writes each field as soon as it is visited.
+"""
+
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Optional
+
+from lkml.keys import (
+    EXPR_BLOCK_KEYS,
+    KEYS_WITH_NAME_FIELDS,
+    PLURAL_KEYS,
+    QUOTED_LITERAL_KEYS,
+    singularize,
+)
+
+_EXPR_BLOCK_KEYS = frozenset(EXPR_BLOCK_KEYS)
+_KEYS_WITH_NAME_FIELDS = frozenset(KEYS_WITH_NAME_FIELDS)
+_PLURAL_KEYS = frozenset(PLURAL_KEYS)
+_QUOTED_LITERAL_KEYS = frozenset(QUOTED_LITERAL_KEYS)
+
+# kinds of the previously emitted node, they decide the whitespace before the next one
+_DOCUMENT = "document"
+_BLOCK = "block"
+_LIST = "list"
+_PAIR = "pair"
+
+
+@lru_cache(maxsize=None)
+def _newline_indent(level: int) -> str:
+    return "\n" + "  " * level
+
+
+@lru_cache(maxsize=None)
+def _singular_plural_key(key: str) -> Optional[str]:
+    """The singular form of a repeatable key, or None if the key is not repeatable."""
+    singular_key = singularize(key)
+    return singular_key if singular_key in _PLURAL_KEYS else None
+
+
+def _format_value(key: str, value: Any, force_quote: bool = False) -> str:
+    if force_quote or key in _QUOTED_LITERAL_KEYS:
+        return '"' + value.replace(r"\"", '"').replace('"', r"\"") + '"'
+    if key in _EXPR_BLOCK_KEYS:
+        return value.strip() + " ;;"
+    return str(value)
+
+
+class LookmlEmitter:
+    """Write a LookML dictionary, as accepted by lkml.dump, to a write callable.
+
+    Every field is written with a single call, e.g. to file.write or list.append.
+    """
+
+    def __init__(self, write: Callable[[str], Any]):
+        self._write = write
+        self._level = 0
+        self._parent_key: Optional[str] = None
+        self._latest: Optional[str] = _DOCUMENT
+
+    def emit(self, obj: Dict[str, Any]):
+        """Write a whole LookML document."""
+        self._level = 0
+        self._parent_key = None
+        self._latest = _DOCUMENT
+        for key, value in obj.items():
+            self._emit_any(key, value)
+
+    def _prefix(self) -> str:
+        if self._latest is _DOCUMENT:
+            return ""
+        if self._latest is _BLOCK:
+            return "\n" + _newline_indent(self._level)
+        return _newline_indent(self._level)
+
+    def _is_plural_key(self, key: str) -> bool:
+        singular_key = _singular_plural_key(key)
+        return (
+            singular_key is not None
+            and not (
+                singular_key == "allowed_value"
+                and self._parent_key.rstrip("s") == "access_grant"
+            )
+            and not (self._parent_key == "query" and singular_key != "filters")
+        )
+
+    def _emit_any(self, key: str, value: Any) -> int:
+        """Write a field, returning the number of LookML nodes written."""
+        if isinstance(value, str):
+            self._emit_pair(key, value)
+            return 1
+        if isinstance(value, (list, tuple)):
+            if self._is_plural_key(key):
+                return self._emit_repeated(key, value)
+            self._emit_list(key, value)
+            return 1
+        if isinstance(value, dict):
+            has_name = key not in _KEYS_WITH_NAME_FIELDS and "name" in value
+            self._emit_block(key, value, value["name"] if has_name else None, has_name)
+            return 1
+        raise TypeError("Value must be a string, list, tuple, or dict.")
+
+    def _emit_repeated(self, key: str, values) -> int:
+        if key == "filters":
+            return self._emit_filters(values)
+        singular_key = singularize(key)
+        count = 0
+        for value in values:
+            count += self._emit_any(singular_key, value)
+        return count
+
+    def _emit_filters(self, values) -> int:
+        """filters has three syntaxes in LookML, pick the one lkml.dump would pick."""
+        if "name" in values[0]:
+            for value in values:
+                self._emit_block("filter", value, value["name"], True)
+            return len(values)
+        if "field" in values[0] and "value" in values[0]:
+            for value in values:
+                self._emit_block("filters", value, None, False)
+            return len(values)
+        self._emit_list("filters", values)
+        return 1
+
+    def _emit_pair(self, key: str, value: str):
+        force_quote = self._parent_key == "filters" and key != "field"
+        self._write(
+            self._prefix() + key + ": " + _format_value(key, value, force_quote)
+        )
+        self._latest = _PAIR
+
+    def _emit_block(self, key: str, items: Dict, name: Any, skip_name: bool):
+        if self._latest is not None and self._latest is not _DOCUMENT:
+            prefix = "\n" + _newline_indent(self._level)
+        else:
+            prefix = self._prefix()
+        self._write(f"{prefix}{key}: {name} {{" if name else f"{prefix}{key}: {{")
+
+        parent_key = self._parent_key
+        self._parent_key = key
+        self._level += 1
+        self._latest = None
+        count = 0
+        for item_key, value in items.items():
+            if skip_name and item_key == "name":
+                continue
+            count += self._emit_any(item_key, value)
+        self._level -= 1
+        self._parent_key = parent_key
+
+        self._write(_newline_indent(self._level) + "}" if count else "}")
+        self._latest = _BLOCK
+
+    def _emit_list(self, key: str, values):
+        # suggestions is only quoted when it is a list
+        force_quote = key == "suggestions"
+        prefix = self._prefix()
+        parent_key = self._parent_key
+        self._parent_key = key
+
+        pair_mode = bool(values) and not isinstance(values[0], (str, int))
+        if len(values) >= 5 or pair_mode:
+            # one item per line, with a trailing comma
+            inner = _newline_indent(self._level + 1)
+            if pair_mode:
+                items = []
+                for value in values:
+                    [(item_key, item_value)] = value.items()
+                    pair_force_quote = key == "filters" and item_key != "field"
+                    items.append(
+                        inner
+                        + item_key
+                        + ": "
+                        + _format_value(item_key, item_value, pair_force_quote)
+                    )
+            else:
+                items = [
+                    inner + _format_value(key, value, force_quote) for value in values
+                ]
+            self._write(
+                prefix
+                + key
+                + ": ["
+                + ",".join(items)
+                + ","
+                + _newline_indent(self._level)
+                + "]"
+            )
+        else:
+            items = [_format_value(key, value, force_quote) for value in values]
+            self._write(prefix + key + ": [" + ", ".join(items) + "]")
+
+        self._parent_key = parent_key
+        self._latest = _LIST
+
+
+def dump_lookml(obj: Dict[str, Any], file_object: Optional[IO] = None) -> Optional[str]:
+    """Serialize a LookML dictionary, with the same output as lkml.dump.
+
+    Args:
+        obj: The LookML dictionary, e.g. as returned by LookmlGenerator.generate
+        file_object: An optional file object to write the LookML to
+
+    Returns:
+        The LookML string if no file_object is passed
+    """
+    if file_object is not None:
+        LookmlEmitter(file_object.write).emit(obj)
+        return None
+
+    chunks = []
+    LookmlEmitter(chunks.append).emit(obj)
+    return "".join(chunks)
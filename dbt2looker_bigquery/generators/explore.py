@@ -1,5 +1,6 @@
 """LookML explore generator module."""
 
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.models.dbt import DbtModel
 from dbt2looker_bigquery.utils import DotManipulation, StructureGenerator
 from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
@@ -8,11 +9,11 @@ from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
 class LookmlExploreGenerator:
     """Lookml explore generator."""
 
-    def __init__(self, args):
-        self._cli_args = args
+    def __init__(self, config: GeneratorConfig):
+        self._config = config
         self._dot = DotManipulation()
-        self._structure_generator = StructureGenerator(args)
-        self._applier = MetaAttributeApplier(args)
+        self._structure_generator = StructureGenerator(config)
+        self._applier = MetaAttributeApplier(config)
 
     def _get_reduced_paths(self, input_string, base):
         """Make a list of reduced paths from the input string."""
@@ -62,13 +63,17 @@ class LookmlExploreGenerator:
     def generate(
         self,
         model: DbtModel,
+        grouped_columns=None,
     ) -> dict:
-        """Create the explore definition."""
+        """Create the explore definition.
+
+        The column grouping can be passed in when it has already been computed.
+        """
         # default behavior is to hide the view
         base_name = (
             model.name
-            if self._cli_args.prefix is None
-            else f"{self._cli_args.prefix}_{model.name}"
+            if self._config.prefix is None
+            else f"{self._config.prefix}_{model.name}"
         )
         # Create explore
         explore = {
@@ -86,7 +91,8 @@ class LookmlExploreGenerator:
             "meta.looker.explore",
         )
 
-        grouped_columns = self._structure_generator.process_model(model)
+        if grouped_columns is None:
+            grouped_columns = self._structure_generator.process_model(model)
 
         # if joins exist we need to explore them
         if joins := self.generate_joins(base_name, grouped_columns):
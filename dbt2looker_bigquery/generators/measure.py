@@ -1,12 +1,9 @@
-from dbt2looker_bigquery.enums import (
-    LookerMeasureType,
-    LookerScalarTypes,
-    LookerDateTypes,
-    LookerDateTimeTypes,
-)
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.enums import LookerMeasureType
 from dbt2looker_bigquery.generators.utils import (
+    MEASURE_TYPES,
+    classify_column,
     get_sql_expression,
-    map_bigquery_to_looker,
 )
 from dbt2looker_bigquery.models.dbt import DbtModelColumn, DbtModel
 from dbt2looker_bigquery.models.looker import DbtMetaLookerMeasure
@@ -16,9 +13,9 @@ from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
 class LookmlMeasureGenerator:
     """Lookml dimension generator."""
 
-    def __init__(self, args):
-        self._cli_args = args
-        self._applier = MetaAttributeApplier(args)
+    def __init__(self, config: GeneratorConfig):
+        self._config = config
+        self._applier = MetaAttributeApplier(config)
 
     def _lookml_measure(
         self,
@@ -33,14 +30,12 @@ class LookmlMeasureGenerator:
         sql = get_sql_expression(column, is_main_view, view)
         type = measure.type.value
 
-        if map_bigquery_to_looker(column.data_type) in LookerScalarTypes.values():
-            if type not in [t.value for t in LookerMeasureType]:
+        classification = classify_column(column)
+        if classification.is_scalar:
+            if type not in MEASURE_TYPES:
                 return None
 
-        elif (
-            map_bigquery_to_looker(column.data_type) in LookerDateTypes.values()
-            or map_bigquery_to_looker(column.data_type) in LookerDateTimeTypes.values()
-        ):
+        elif classification.category in ("date", "time"):
             # looker does not support date and datetime types as measures
             # so we need to implement them directly in bigquery
             type = "number"
@@ -96,14 +91,14 @@ class LookmlMeasureGenerator:
             ]
 
         return m
-    
+
     def _lookml_multi_measure(self, measure: DbtMetaLookerMeasure):
         measure_data = {
-            'name': measure.name,
-            'type': measure.type.value,
-            'sql': measure.sql,
-            'description': measure.description,
-            'label': measure.label,
+            "name": measure.name,
+            "type": measure.type.value,
+            "sql": measure.sql,
+            "description": measure.description,
+            "label": measure.label,
         }
 
         self._applier.apply_meta_attributes(
@@ -131,7 +126,11 @@ class LookmlMeasureGenerator:
         return measure_data
 
     def lookml_measures_from_model(
-        self, model: DbtModel, column_list: list[DbtModelColumn], is_main_view: bool, view: dict = None
+        self,
+        model: DbtModel,
+        column_list: list[DbtModelColumn],
+        is_main_view: bool,
+        view: dict = None,
     ) -> list:
         """Generate measures from model."""
         lookml_measures = []
@@ -161,4 +160,4 @@ class LookmlMeasureGenerator:
                 measures.append(self._lookml_multi_measure(measure))
             lookml_measures.extend(measures)
 
-        return lookml_measures
\ No newline at end of file
+        return lookml_measures
@@ -1,10 +1,73 @@
 """LookML generator utilities."""
 
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
-from dbt2looker_bigquery.enums import LookerBigQueryDataType
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.enums import (
+    LookerBigQueryDataType,
+    LookerDateTimeframes,
+    LookerDateTimeTypes,
+    LookerDateTypes,
+    LookerMeasureType,
+    LookerScalarTypes,
+    LookerTimeTimeframes,
+)
 from dbt2looker_bigquery.models.dbt import DbtModelColumn
 
+# lookup tables built once from the enums, enum values() builds a new list every call
+LOOKER_TYPES = MappingProxyType(
+    {name: member.value for name, member in LookerBigQueryDataType.__members__.items()}
+)
+SCALAR_TYPES = frozenset(LookerScalarTypes.values())
+DATE_TYPES = frozenset(LookerDateTypes.values())
+DATETIME_TYPES = frozenset(LookerDateTimeTypes.values())
+MEASURE_TYPES = frozenset(LookerMeasureType.values())
+DATE_TIMEFRAMES = tuple(LookerDateTimeframes.values())
+TIME_TIMEFRAMES = tuple(LookerTimeTimeframes.values())
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnClassification:
+    """How a column's data type is rendered in LookML.
+
+    category is "time" or "date" for columns that become dimension groups, and
+    "scalar" for everything else, including types looker does not know.
+    """
+
+    looker_type: Optional[str]
+    category: str
+    is_scalar: bool
+    is_array: bool
+    is_struct: bool
+
+
+@lru_cache(maxsize=None)
+def classify_data_type(data_type: str | None) -> ColumnClassification:
+    """Classify a BigQuery data type, once per distinct data type."""
+    looker_type = map_bigquery_to_looker(data_type)
+    if looker_type in DATETIME_TYPES:
+        category = "time"
+    elif looker_type in DATE_TYPES:
+        category = "date"
+    else:
+        category = "scalar"
+
+    return ColumnClassification(
+        looker_type=looker_type,
+        category=category,
+        is_scalar=looker_type in SCALAR_TYPES,
+        is_array="ARRAY" in f"{data_type}",
+        is_struct="STRUCT" in f"{data_type}",
+    )
+
+
+def classify_column(column: DbtModelColumn) -> ColumnClassification:
+    """Classify the data type of a column."""
+    return classify_data_type(column.data_type)
+
 
 def map_bigquery_to_looker(column_type: str | None) -> Optional[str]:
     """Map BigQuery data type to Looker data type
@@ -21,10 +84,7 @@ def map_bigquery_to_looker(column_type: str | None) -> Optional[str]:
     if column_type:
         column_type = column_type.split("<")[0]  # STRUCT< or ARRAY<
         column_type = column_type.split("(")[0]  # Numeric(1,31)
-    try:
-        return LookerBigQueryDataType.get(column_type)
-    except ValueError:
-        return None
+    return LOOKER_TYPES.get(column_type)
 
 
 def get_sql_expression(column: DbtModelColumn, is_main_view: bool, view: dict) -> str:
@@ -50,8 +110,8 @@ def get_sql_expression(column: DbtModelColumn, is_main_view: bool, view: dict) -
 
 
 class MetaAttributeApplier:
-    def __init__(self, cli_args):
-        self.cli_args = cli_args
+    def __init__(self, config: GeneratorConfig):
+        self.config = config
 
     def apply_meta_attributes(
         self, target_dict: dict, obj: any, attributes: list, path: str = ""
@@ -67,7 +127,7 @@ class MetaAttributeApplier:
                         target_dict[attr] = meta_value
 
         # The condition to add "hidden" should remain outside the 'if' check for None
-        if self.cli_args.all_hidden:
+        if self.config.all_hidden:
             target_dict["hidden"] = "yes"
 
     def get_meta_attribute(self, obj: any, attr: str, path: str = "") -> any:
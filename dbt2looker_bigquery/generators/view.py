@@ -2,6 +2,7 @@
 
 from typing import Dict
 
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.models.dbt import DbtModel
 from dbt2looker_bigquery.utils import DotManipulation, StructureGenerator
 from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
@@ -10,11 +11,11 @@ from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
 class LookmlViewGenerator:
     """LookML view generator."""
 
-    def __init__(self, args):
-        self._cli_args = args
+    def __init__(self, config: GeneratorConfig):
+        self._config = config
         self._dot = DotManipulation()
-        self._structure_generator = StructureGenerator(args)
-        self._applier = MetaAttributeApplier(args)
+        self._structure_generator = StructureGenerator(config)
+        self._applier = MetaAttributeApplier(config)
 
     def _build_view(
         self,
@@ -32,24 +33,18 @@ class LookmlViewGenerator:
         else:
             is_main_view = False
 
-        dimensions = dimension_generator.lookml_dimensions_from_model(
+        fields = dimension_generator.lookml_fields_from_model(
             column_list, is_main_view, view
         )
+        dimensions = fields["dimensions"]
 
-        if (
-            dimensions_groups_dimensions
-            := dimension_generator.lookml_dimension_groups_from_model(
-                column_list, is_main_view, view
-            ).get("dimensions")
-        ):
+        if dimensions_groups_dimensions := fields["dimension_group_dimensions"]:
             dimensions.append(dimensions_groups_dimensions)
 
         if dimensions:
             view["dimensions"] = dimensions
 
-        if dimension_groups := dimension_generator.lookml_dimension_groups_from_model(
-            column_list, is_main_view, view
-        ).get("dimension_groups"):
+        if dimension_groups := fields["dimension_groups"]:
             view["dimension_groups"] = dimension_groups
 
         if measures := measure_generator.lookml_measures_from_model(
@@ -57,9 +52,7 @@ class LookmlViewGenerator:
         ):
             view["measures"] = measures
 
-        if sets := dimension_generator.lookml_dimension_groups_from_model(
-            column_list, is_main_view, view
-        ).get("dimension_group_sets"):
+        if sets := fields["dimension_group_sets"]:
             view["sets"] = sets
 
         view.pop("array_name", None)
@@ -71,15 +64,20 @@ class LookmlViewGenerator:
         model: DbtModel,
         dimension_generator,
         measure_generator,
+        grouped_columns=None,
     ) -> Dict:
-        """Generate a view for a model."""
+        """Generate a view for a model.
+
+        The column grouping can be passed in when it has already been computed.
+        """
         views = []
-        grouped_columns = self._structure_generator.process_model(model)
+        if grouped_columns is None:
+            grouped_columns = self._structure_generator.process_model(model)
 
         base_view = (
             {"name": model.name}
-            if not self._cli_args.prefix
-            else {"name": f"{self._cli_args.prefix}_{model.name}"}
+            if not self._config.prefix
+            else {"name": f"{self._config.prefix}_{model.name}"}
         )
         self._applier.apply_meta_attributes(
             base_view, model, ["label"], "meta.looker.view"
@@ -0,0 +1,143 @@
+"""Incremental generation state."""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:
+    from importlib_metadata import PackageNotFoundError, version
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.utils import write_atomic
+
+STATE_FILE_NAME = ".dbt2looker_state.json"
+
+# options of GeneratorConfig that change the generated lookml
+GENERATION_FLAGS = (
+    "build_explore",
+    "use_table_name",
+    "all_hidden",
+    "folder_structure",
+    "remove_prefix_from_dataset",
+    "hide_arrays_and_structs",
+    "implicit_primary_key",
+    "prefix",
+    "typing_source",
+)
+
+
+def get_tool_version() -> str:
+    """Get the installed version of dbt2looker_bigquery."""
+    try:
+        return version("dbt2looker_bigquery")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class IncrementalState:
+    """Remember what each view was generated from, so unchanged models can be skipped.
+
+    For every model the state holds a digest of its manifest node, its catalog node,
+    the cli flags that affect generation and the tool version, together with the path
+    of the view that was written. It is stored as a JSON file in the output directory,
+    unless persist is False, then it only lives as long as the object, e.g. in --watch.
+    """
+
+    def __init__(self, output_dir: str, config: GeneratorConfig, persist: bool = True):
+        self._output_dir = output_dir
+        self._path = os.path.join(output_dir, STATE_FILE_NAME)
+        self._settings = {
+            "version": get_tool_version(),
+            "flags": {flag: getattr(config, flag) for flag in GENERATION_FLAGS},
+        }
+        self._persist = persist
+        self._models: Dict[str, Dict[str, str]] = self._load() if persist else {}
+        self._pending: Dict[str, str] = {}
+        # raw nodes seen by filter_changed, a long lived state is reused by --watch
+        self._inputs: Dict[str, Tuple[Tuple[Dict, Optional[Dict]], str]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self._path, "r") as f:
+                return json.load(f).get("models", {})
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logging.warning(f"Ignoring unreadable incremental state at {self._path}")
+            return {}
+
+    def digest(self, raw_node: Dict, raw_catalog_node: Optional[Dict]) -> str:
+        """Hash everything that the view of a model is generated from."""
+        inputs = json.dumps(
+            [self._settings, raw_node, raw_catalog_node], sort_keys=True, default=str
+        )
+        return hashlib.sha256(inputs.encode()).hexdigest()
+
+    def _is_unchanged(self, unique_id: str, digest: str) -> bool:
+        entry = self._models.get(unique_id)
+        return (
+            entry is not None
+            and entry["digest"] == digest
+            and os.path.exists(os.path.join(self._output_dir, entry["path"]))
+        )
+
+    def filter_changed(
+        self,
+        unique_ids: List[str],
+        get_raw_node: Callable[[str], Dict],
+        get_raw_catalog_node: Callable[[str], Optional[Dict]],
+    ) -> List[str]:
+        """Drop the models whose inputs are the same as when their view was written."""
+        changed = []
+        for unique_id in unique_ids:
+            inputs = (get_raw_node(unique_id), get_raw_catalog_node(unique_id))
+            previous = self._inputs.get(unique_id)
+            if previous is not None and previous[0] == inputs:
+                # comparing with the inputs of the previous call is cheaper than hashing
+                digest = previous[1]
+            else:
+                digest = self.digest(*inputs)
+            self._inputs[unique_id] = (inputs, digest)
+            if not self._is_unchanged(unique_id, digest):
+                self._pending[unique_id] = digest
+                changed.append(unique_id)
+
+        logging.info(
+            f"Skipping {len(unique_ids) - len(changed)} unchanged models, {len(changed)} to generate"
+        )
+        return changed
+
+    def forget_missing(self, model_ids: List[str]):
+        """Drop the state of models that are no longer in the manifest."""
+        model_ids = set(model_ids)
+        self._inputs = {
+            unique_id: inputs
+            for unique_id, inputs in self._inputs.items()
+            if unique_id in model_ids
+        }
+        self._models = {
+            unique_id: entry
+            for unique_id, entry in self._models.items()
+            if unique_id in model_ids
+        }
+
+    def record(self, unique_id: str, file_path: str):
+        """Record that the view of a model was written."""
+        if digest := self._pending.pop(unique_id, None):
+            self._models[unique_id] = {
+                "digest": digest,
+                "path": os.path.relpath(file_path, self._output_dir),
+            }
+
+    def save(self):
+        """Write the state to the output directory."""
+        if not self._persist:
+            return
+        os.makedirs(self._output_dir, exist_ok=True)
+        write_atomic(
+            self._path, json.dumps({"models": self._models}, indent=2, sort_keys=True)
+        )
@@ -0,0 +1,192 @@
+"""Sidecar indexes of dbt artifacts, to decode single nodes without the whole file.
+
+An index holds the byte range of every node and of the other top level sections of
+manifest.json or catalog.json, with the fields models are selected by. It is built
+with one streaming pass the first time it is needed and stored next to the artifact,
+keyed by the SHA-256 of the file. Later runs memory map the artifact and decode only
+the nodes that are asked for, so selecting a few models costs the same in a project
+of any size.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from dbt2looker_bigquery.decoding import decode, load_json
+from dbt2looker_bigquery.streaming import JsonStreamReader
+from dbt2looker_bigquery.utils import write_atomic
+
+# bumped whenever the layout of the index file changes
+INDEX_VERSION = 1
+# fields of a model node that ModelSelector selects by
+SELECTION_FIELDS = ("resource_type", "name", "path", "original_file_path", "tags")
+# top level sections that are decoded as a whole when asked for
+INDEXED_SECTIONS = ("metadata", "exposures")
+
+
+def index_path(file_path: str) -> str:
+    """Path of the index of an artifact, e.g. target/.manifest.json.dbt2looker_index"""
+    directory, name = os.path.split(file_path)
+    return os.path.join(directory, f".{name}.dbt2looker_index")
+
+
+def file_digest(file_path: str) -> str:
+    """SHA-256 of the contents of a file."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class StaleIndexError(ValueError):
+    """The artifact no longer matches its index."""
+
+
+class ArtifactIndex:
+    """Byte ranges of the nodes of a dbt artifact, read from or stored to its sidecar.
+
+    The index is trusted without hashing while the size and modification time of the
+    artifact are unchanged. Otherwise the artifact is hashed, and the index is only
+    rebuilt when the hash differs, e.g. not after a touch or a copy.
+    """
+
+    def __init__(self, file_path: str, decoder: Optional[str] = None):
+        """
+        Args:
+            file_path: Path to manifest.json or catalog.json
+            decoder: Name of the JSON decoder to decode nodes with, the fastest installed if None
+
+        Raises:
+            FileNotFoundError: If the artifact does not exist
+        """
+        self._file_path = file_path
+        self._index_path = index_path(file_path)
+        self._decoder = decoder
+        self._index = self._load() or self._build()
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Dict[str, int]:
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load(self) -> Optional[Dict]:
+        """Read the stored index, if it is still valid for the artifact."""
+        stat = os.stat(self._file_path)
+        try:
+            index = load_json(self._index_path, self._decoder)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logging.warning(f"Ignoring unreadable index at {self._index_path}")
+            return None
+
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            return None
+        signature = self._signature(stat)
+        if index.get("signature") == signature:
+            return index
+        if index.get("size") != stat.st_size:
+            return None
+        if index.get("sha256") != file_digest(self._file_path):
+            return None
+
+        # same contents with a new modification time, remember it to skip the hash
+        index["signature"] = signature
+        self._save(index)
+        return index
+
+    def _build(self) -> Dict:
+        """Scan the artifact once and store the byte ranges of its nodes."""
+        logging.info(f"Indexing {self._file_path}")
+        stat = os.stat(self._file_path)
+        index = {
+            "version": INDEX_VERSION,
+            "sha256": file_digest(self._file_path),
+            "size": stat.st_size,
+            "signature": self._signature(stat),
+            "sections": {},
+            "nodes": {},
+            "models": {},
+        }
+        reader = JsonStreamReader(self._file_path)
+        for section, key, offset, raw in reader.iter_spans(
+            streamed=["nodes"], loaded=INDEXED_SECTIONS
+        ):
+            if key is None:
+                index["sections"][section] = [offset, len(raw)]
+                continue
+            index["nodes"][key] = [offset, len(raw)]
+            node = decode(raw, self._decoder)
+            if node.get("resource_type") == "model":
+                index["models"][key] = {
+                    field: node[field] for field in SELECTION_FIELDS if field in node
+                }
+
+        self._save(index)
+        return index
+
+    def _save(self, index: Dict):
+        try:
+            write_atomic(self._index_path, json.dumps(index))
+        except OSError as e:
+            # e.g. a read only target directory, the index is rebuilt on the next run
+            logging.debug(f"Could not store the index at {self._index_path}: {e}")
+
+    @property
+    def models(self) -> Dict[str, Dict[str, Any]]:
+        """The selection fields of every model node, by unique id, in file order."""
+        return self._index["models"]
+
+    @property
+    def node_ids(self) -> List[str]:
+        """Unique ids of all nodes in the artifact, in file order."""
+        return list(self._index["nodes"])
+
+    def _decode_spans(self, spans: Dict[str, List[int]]) -> Dict[str, Any]:
+        decoded = {}
+        with open(self._file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size != self._index["size"]:
+                raise StaleIndexError(f"{self._file_path} changed since it was indexed")
+            if not spans:
+                return decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as data:
+                    for key, (offset, length) in spans.items():
+                        decoded[key] = decode(
+                            data[offset : offset + length], self._decoder
+                        )
+        return decoded
+
+    def _read(self, spans: Dict[str, List[int]], nodes: bool) -> Dict[str, Any]:
+        """Decode spans of the artifact, rebuilding the index once if it is stale."""
+        for attempt in range(2):
+            try:
+                decoded = self._decode_spans(spans)
+                # nodes repeat their unique id, catalog nodes of older dbt versions may not
+                if nodes and any(
+                    node.get("unique_id", unique_id) != unique_id
+                    for unique_id, node in decoded.items()
+                ):
+                    raise StaleIndexError(f"{self._file_path} does not match its index")
+                return decoded
+            except ValueError:
+                # a span that is no longer a whole value fails to decode as well
+                if attempt:
+                    raise
+                logging.info(f"{self._file_path} changed, indexing it again")
+                self._index = self._build()
+                spans = self._spans_of(spans, nodes)
+
+    def _spans_of(self, keys: Iterable[str], nodes: bool) -> Dict[str, List[int]]:
+        spans = self._index["nodes" if nodes else "sections"]
+        return {key: spans[key] for key in keys if key in spans}
+
+    def read_nodes(self, unique_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Decode the nodes with these unique ids, skipping ids that are not in the artifact."""
+        return self._read(self._spans_of(unique_ids, nodes=True), nodes=True)
+
+    def read_section(self, section: str, default: Any = None) -> Any:
+        """Decode one of the indexed top level sections, e.g. metadata."""
+        return self._read(self._spans_of([section], nodes=False), nodes=False).get(
+            section, default
+        )
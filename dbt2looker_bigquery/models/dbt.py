@@ -1,9 +1,11 @@
 import logging
-from typing import Dict, List, Optional, Union
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import warnings
 from dbt2looker_bigquery.warnings import DeprecationWarning, ParsingWarning
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
 from dbt2looker_bigquery import enums
 
@@ -98,13 +100,21 @@ class DbtCatalogNode(BaseModel):
 
     columns: Dict[str, DbtCatalogNodeColumn]
 
-    @field_validator("columns")
+    @field_validator("columns", mode="before")
     @classmethod
-    def case_insensitive_column_names(cls, v: Dict[str, DbtCatalogNodeColumn]):
-        return {
-            name.lower(): column.model_copy(update={"name": column.name.lower()})
-            for name, column in v.items()
-        }
+    def case_insensitive_column_names(cls, v: Any):
+        """Lower case column names before validation, so columns are not copied"""
+        if not isinstance(v, dict):
+            return v
+        return {name.lower(): _lower_column_name(column) for name, column in v.items()}
+
+
+def _lower_column_name(column: Any) -> Any:
+    if isinstance(column, DbtCatalogNodeColumn):
+        return column.model_copy(update={"name": column.name.lower()})
+    if isinstance(column, dict) and isinstance(column.get("name"), str):
+        return {**column, "name": column["name"].lower()}
+    return column
 
 
 class DbtCatalog(BaseModel):
@@ -113,6 +123,32 @@ class DbtCatalog(BaseModel):
     nodes: Dict[str, DbtCatalogNode]
 
 
+class DbtLazyCatalogNodes(Mapping):
+    """Catalog nodes that are kept as raw dicts and validated each time they are accessed.
+
+    Every model looks up its catalog node once, so validated nodes are not kept.
+    """
+
+    def __init__(self, raw_nodes: Dict[str, Dict[str, Any]]):
+        self._raw_nodes = raw_nodes
+
+    def __getitem__(self, unique_id: str) -> DbtCatalogNode:
+        return DbtCatalogNode.model_validate(self._raw_nodes[unique_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_nodes)
+
+    def __len__(self) -> int:
+        return len(self._raw_nodes)
+
+
+class DbtLazyCatalog:
+    """A dbt catalog that defers validation of its nodes until they are used."""
+
+    def __init__(self, nodes: Dict[str, Dict[str, Any]], **_):
+        self.nodes = DbtLazyCatalogNodes(nodes)
+
+
 class DbtModelColumnMeta(BaseModel):
     """Metadata about a column in a dbt model"""
 
@@ -120,6 +156,8 @@ class DbtModelColumnMeta(BaseModel):
 
     @model_validator(mode="before")
     def warn_outdated(cls, values):
+        # work on a copy, the raw manifest is compared between builds in --watch
+        values = dict(values)
         looker_measures = values.pop(
             "looker_measures", None
         )  # Use pop to remove from values if it exists
@@ -154,6 +192,7 @@ class DbtModelColumn(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def set_nested_and_parent_name(cls, values):
+        values = dict(values)
         name = values.get("name", "")
 
         # If there's a dot in the name, it's a nested field
@@ -169,15 +208,66 @@ class DbtModelColumn(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def set_primary_key(cls, values):
+        values = dict(values)
         constraints = values.get("constraints", [])
 
-        if 'primary_key' in map(lambda x: x.get('type'), constraints):
+        if "primary_key" in map(lambda x: x.get("type"), constraints):
             logging.debug("Found primary key constraint on %s model", values["name"])
             values["is_primary_key"] = True
 
         return values
 
 
+_EMPTY_COLUMN_META = DbtModelColumnMeta()
+
+
+@dataclass(frozen=True, slots=True)
+class DbtColumn:
+    """A column of a model with its materialized type.
+
+    DbtModelColumn validates the manifest, DbtColumn is the compact record that
+    CatalogParser builds from it, and that is passed on to the generators. The
+    validated meta of the manifest column is shared, not copied.
+    """
+
+    name: str
+    description: Optional[str] = None
+    data_type: Optional[str] = None
+    inner_types: Tuple[str, ...] = ()
+    # the empty meta is shared by every column without meta
+    meta: Optional[DbtModelColumnMeta] = field(
+        default_factory=lambda: _EMPTY_COLUMN_META
+    )
+    nested: Optional[bool] = False
+    is_primary_key: Optional[bool] = False
+    is_inner_array_representation: Optional[bool] = False
+
+    @classmethod
+    def from_manifest(
+        cls, column: DbtModelColumn, data_type: str, inner_types: Sequence[str]
+    ) -> "DbtColumn":
+        """Build the record of a manifest column with its materialized type."""
+        return cls(
+            name=column.name,
+            description=column.description,
+            data_type=data_type,
+            inner_types=tuple(inner_types),
+            meta=column.meta,
+            nested=column.nested,
+            is_primary_key=column.is_primary_key,
+            is_inner_array_representation=column.is_inner_array_representation,
+        )
+
+
+def replace_column(
+    column: Union[DbtColumn, DbtModelColumn], **changes
+) -> Union[DbtColumn, DbtModelColumn]:
+    """Get a changed copy of a column record, or of a validated manifest column."""
+    if isinstance(column, DbtColumn):
+        return replace(column, **changes)
+    return column.model_copy(update=changes)
+
+
 class DbtModelMeta(BaseModel):
     """Metadata about a dbt model"""
 
@@ -196,7 +286,9 @@ class DbtModel(DbtNode):
     db_schema: str = Field(..., alias="schema")
     name: str
     description: str
-    columns: Dict[str, DbtModelColumn]
+    # validated from the manifest as DbtModelColumn, CatalogParser.process_model
+    # replaces them with DbtColumn records
+    columns: Dict[str, Union[DbtModelColumn, DbtColumn]]
     tags: List[str]
     meta: DbtModelMeta
     path: str
@@ -214,10 +306,14 @@ class DbtModel(DbtNode):
             if isinstance(column, dict):
                 new_columns[name] = column
             elif isinstance(column, DbtModelColumn):
-                # Lowercase the name and update the column name
-                new_columns[name.lower()] = column.model_copy(
-                    update={"name": column.name.lower()}
-                )
+                # Lowercase the name and update the column name, the column
+                # validator has usually done so already
+                if column.name == column.name.lower():
+                    new_columns[name.lower()] = column
+                else:
+                    new_columns[name.lower()] = column.model_copy(
+                        update={"name": column.name.lower()}
+                    )
             else:
                 raise TypeError(
                     f"The value for key {name} is not a DbtModelColumn instance."
@@ -226,6 +322,7 @@ class DbtModel(DbtNode):
 
     @model_validator(mode="before")
     def validate_model(cls, values):
+        values = dict(values)
         columns = values.get("columns", {})
 
         # Check and convert columns if they are in dict form instead of DbtModelColumn instances
@@ -274,3 +371,62 @@ class DbtManifest(BaseModel):
     nodes: Dict[str, Union[DbtModel, DbtNode]]
     metadata: DbtManifestMetadata
     exposures: Dict[str, DbtExposure]
+
+
+class DbtLazyNodes(Mapping):
+    """Manifest nodes that are kept as raw dicts and only validated when accessed.
+
+    Validation follows the Union[DbtModel, DbtNode] rules of DbtManifest.nodes.
+    """
+
+    def __init__(self, raw_nodes: Dict[str, Dict[str, Any]]):
+        self._raw_nodes = raw_nodes
+        self._validated: Dict[str, Union[DbtModel, DbtNode]] = {}
+
+    def _validate(self, raw_node: Dict[str, Any]) -> Union[DbtModel, DbtNode]:
+        if raw_node.get("resource_type") == "model":
+            try:
+                return DbtModel.model_validate(raw_node)
+            except ValidationError:
+                pass
+        return DbtNode.model_validate(raw_node)
+
+    def __getitem__(self, unique_id: str) -> Union[DbtModel, DbtNode]:
+        if unique_id not in self._validated:
+            self._validated[unique_id] = self.validate(unique_id)
+        return self._validated[unique_id]
+
+    def validate(self, unique_id: str) -> Union[DbtModel, DbtNode]:
+        """Validate a node without keeping it, unlike access by key."""
+        return self._validate(self._raw_nodes[unique_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_nodes)
+
+    def __len__(self) -> int:
+        return len(self._raw_nodes)
+
+    def raw(self, unique_id: str) -> Dict[str, Any]:
+        """Get a node without validating it."""
+        return self._raw_nodes[unique_id]
+
+
+class DbtLazyManifest:
+    """A dbt manifest that defers validation of its nodes until they are used.
+
+    Metadata and exposures are small and validated up front like in DbtManifest.
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, Dict[str, Any]],
+        metadata: Dict[str, Any],
+        exposures: Dict[str, Dict[str, Any]],
+        **_,
+    ):
+        self.metadata = DbtManifestMetadata.model_validate(metadata)
+        self.exposures = {
+            unique_id: DbtExposure.model_validate(exposure)
+            for unique_id, exposure in exposures.items()
+        }
+        self.nodes = DbtLazyNodes(nodes)
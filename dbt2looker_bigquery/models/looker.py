@@ -181,6 +181,8 @@ class DbtMetaColumnLooker(DbtMetaLookerViewElement):
 
     @model_validator(mode="before")
     def warn_outdated(cls, values):
+        # work on a copy, the raw manifest is compared between builds in --watch
+        values = dict(values)
         dimension_attrs = {
             "label": values.get("label"),
             "hidden": values.get("hidden"),
@@ -280,6 +282,7 @@ class DbtMetaLooker(BaseModel):
 
     @model_validator(mode="before")
     def warn_outdated(cls, values):
+        values = dict(values)
         dimension_attrs = {
             "label": values.get("label"),
             "hidden": values.get("hidden"),
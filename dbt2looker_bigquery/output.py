@@ -0,0 +1,99 @@
+"""Output writing functionality."""
+
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional, Set
+
+from dbt2looker_bigquery.utils import FileHandler, write_atomic
+
+MANAGED_FILES_NAME = ".dbt2looker_files.json"
+
+
+class OutputWriter:
+    """Write views to the output directory and remove the ones that have gone stale.
+
+    Every view that is written is recorded in a managed-files manifest in the output
+    directory, together with the model it was generated from. Only files in that
+    manifest are ever pruned, so files that were not written by dbt2looker are safe.
+    """
+
+    def __init__(self, output_dir: str, file_handler: Optional[FileHandler] = None):
+        self._output_dir = output_dir
+        self._file_handler = file_handler or FileHandler()
+        self._path = os.path.join(output_dir, MANAGED_FILES_NAME)
+        self._created_dirs: Set[str] = set()
+
+    def write(self, file_path: str, contents: str) -> str:
+        """Write a view to its path relative to the output directory.
+
+        Returns:
+            The path of the written file
+        """
+        directory, file_name = os.path.split(file_path)
+        directory = os.path.join(self._output_dir, directory)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+        file_path = f"{directory}/{file_name}"
+        self._file_handler.write(file_path, contents)
+
+        return file_path
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self._path, "r") as f:
+                return json.load(f).get("files", {})
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logging.warning(f"Ignoring unreadable managed files at {self._path}")
+            return {}
+
+    def _remove_empty_dirs(self, directory: str):
+        """Remove a directory and its parents while they are empty, up to the output directory"""
+        output_dir = os.path.abspath(self._output_dir)
+        directory = os.path.abspath(directory)
+        while directory != output_dir and directory.startswith(output_dir):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    def prune(self, written: Dict[str, str], model_ids: Optional[Iterable[str]] = None):
+        """Remove views the current run made stale and record the managed files.
+
+        A managed view is stale when its model is no longer in the manifest, or when
+        its model was written to a different path in this run. Views of models that
+        were not generated this run, e.g. because of --select, are kept.
+
+        Args:
+            written: Path of the file written for each model unique id in this run
+            model_ids: Unique ids of all models in the manifest, None if unknown
+        """
+        model_ids = set(model_ids) if model_ids is not None else None
+        files = {
+            os.path.relpath(path, self._output_dir): unique_id
+            for unique_id, path in written.items()
+        }
+
+        for path, unique_id in self._load().items():
+            if path in files:
+                continue
+            if unique_id in written or (
+                model_ids is not None and unique_id not in model_ids
+            ):
+                logging.debug(f"Removing stale view {path}")
+                file_path = os.path.join(self._output_dir, path)
+                self._file_handler.remove(file_path)
+                self._remove_empty_dirs(os.path.dirname(file_path))
+            else:
+                files[path] = unique_id
+
+        self._save(files)
+
+    def _save(self, files: Dict[str, str]):
+        os.makedirs(self._output_dir, exist_ok=True)
+        write_atomic(self._path, json.dumps({"files": files}, indent=2, sort_keys=True))
@@ -1,12 +1,16 @@
 """Base DBT parser functionality."""
 
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
-from dbt2looker_bigquery.models.dbt import DbtCatalog, DbtManifest, DbtModel
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.database.bigquery import BigQueryDatabase
+from dbt2looker_bigquery.database.cache import SchemaCache
+from dbt2looker_bigquery.incremental import IncrementalState
+from dbt2looker_bigquery.models.dbt import DbtLazyCatalog, DbtLazyManifest, DbtModel
 from dbt2looker_bigquery.parsers.catalog import CatalogParser
-from dbt2looker_bigquery.parsers.exposure import ExposureParser
 from dbt2looker_bigquery.parsers.model import ModelParser
-from dbt2looker_bigquery.utils import strip_model_name
+from dbt2looker_bigquery.parsers.selection import ModelSelector
+from dbt2looker_bigquery.profiling import profiler
 
 import warnings
 from dbt2looker_bigquery.warnings import CatalogWarning
@@ -15,82 +19,112 @@ from dbt2looker_bigquery.warnings import CatalogWarning
 class DbtParser:
     """Main DBT parser that coordinates parsing of manifest and catalog files."""
 
-    def __init__(self, raw_manifest: Dict, raw_catalog: Dict, args: Dict = None):
-        """Initialize the parser with raw manifest and catalog data."""
-
-        if hasattr(args, "select") and hasattr(args, "prefilter") and args.prefilter:
-            filtered_raw_manifest = self.filter_before_pydantic(
-                raw_manifest, args.select
-            )
-            self._manifest = DbtManifest(**filtered_raw_manifest)
-        else:
-            self._manifest = DbtManifest(**raw_manifest)
-
+    def __init__(
+        self,
+        raw_manifest: Dict,
+        raw_catalog: Dict,
+        config: Optional[GeneratorConfig] = None,
+        state: Optional[IncrementalState] = None,
+        selector: Optional[ModelSelector] = None,
+        model_ids: Optional[List[str]] = None,
+    ):
+        """Initialize the parser with raw manifest and catalog data.
+
+        With an incremental state, models whose inputs are unchanged are skipped.
+        A selector already built from the same raw manifest can be passed in.
+        When the raw manifest only holds some of the models, e.g. with
+        --stream-manifest, model_ids holds the unique ids of all models.
+        Catalog nodes are only validated when a model asks for them.
+        """
+
+        self._manifest = DbtLazyManifest(**raw_manifest)
+        self._selector = selector or ModelSelector(
+            raw_manifest.get("nodes", {}), raw_manifest.get("exposures", {})
+        )
         self._model_parser = ModelParser(self._manifest)
+        self._model_ids = model_ids
+        self._state = state
+        self._raw_catalog_nodes = (raw_catalog or {}).get("nodes", {})
 
-        if hasattr(args, "typing_source") and args.typing_source == "DATABASE":
+        config = config or GeneratorConfig()
+        if config.typing_source == "DATABASE":
             self._catalog = None
-            self._catalog_parser = CatalogParser(use_database=True)
+            self._catalog_parser = CatalogParser(
+                use_database=True,
+                database=BigQueryDatabase(
+                    max_workers=config.database_concurrency,
+                    cache=SchemaCache(
+                        config.schema_cache_dir, ttl=config.schema_cache_ttl
+                    )
+                    if config.schema_cache_dir
+                    else None,
+                ),
+            )
         else:
-            self._catalog = DbtCatalog(**raw_catalog)
+            self._catalog = DbtLazyCatalog(**raw_catalog)
             self._catalog_parser = CatalogParser(catalog=self._catalog)
 
-        self._exposure_parser = ExposureParser(self._manifest)
-
-    def filter_before_pydantic(
-        self, raw_manifest: Dict, select_model: List[str]
-    ) -> List[DbtModel]:
-        """Filter models based on multiple criteria."""
-
-        manifest = raw_manifest
-
-        filtered_nodes = {
-            model_name: model
-            for model_name, model in manifest.get("nodes", {}).items()
-            if model_name.split(".")[-1]
-            in [strip_model_name(model) for model in select_model]
-        }
-
-        manifest["nodes"] = filtered_nodes
-        logging.info(f"Prefiltered manifest to {len(filtered_nodes)} models")
-        return manifest
+    @property
+    def model_ids(self) -> List[str]:
+        """Unique ids of all models in the manifest."""
+        if self._model_ids is not None:
+            return self._model_ids
+        return self._selector.model_ids
+
+    def select(self, config: GeneratorConfig) -> List[str]:
+        """Unique ids of the models selected by a config."""
+        return self._selector.select_for(config)
+
+    def raw_inputs(self, unique_id: str) -> Tuple[Dict, Optional[Dict]]:
+        """The raw manifest and catalog nodes a model is generated from."""
+        return self._manifest.nodes.raw(unique_id), self._raw_catalog_nodes.get(
+            unique_id
+        )
 
-    def get_models(self, args) -> List[DbtModel]:
+    def get_models(self, config: GeneratorConfig) -> List[DbtModel]:
         """Parse dbt models from manifest and filter by criteria."""
-
-        all_models = self._model_parser.get_all_models()
-
-        # Get exposed models if needed
-        exposed_names = None
-        if (hasattr(args, "exposures_only") and args.exposures_only) or (
-            hasattr(args, "exposures_tag") and args.exposures_tag
-        ):
-            exposed_names = self._exposure_parser.get_exposures(
-                args.exposures_tag if hasattr(args, "exposures_tag") else None
+        return list(self.iter_models(config))
+
+    def iter_models(
+        self, config: GeneratorConfig, unique_ids: Optional[List[str]] = None
+    ) -> Iterator[DbtModel]:
+        """Parse, filter and process dbt models one at a time.
+
+        Only the model being processed is kept alive by the parser, except with
+        the database as typing source, where all selected models are validated
+        up front so their schemas can be fetched concurrently.
+        unique_ids can be passed to process those models instead of the selection.
+        """
+        if unique_ids is None:
+            # Select on the raw manifest, so only the selected models are validated
+            unique_ids = self.select(config)
+            logging.debug(f"Selected {len(unique_ids)} models before parsing")
+
+        if self._state is not None:
+            self._state.forget_missing(self.model_ids)
+            unique_ids = self._state.filter_changed(
+                unique_ids, self._manifest.nodes.raw, self._raw_catalog_nodes.get
             )
-        if exposed_names:
-            logging.debug(f"Found {len(exposed_names)} exposed models")
-
-        # Filter models based on criteria
-        filtered_models = self._model_parser.filter_models(
-            all_models,
-            select_model=args.select if hasattr(args, "select") else None,
-            tag=args.tag if hasattr(args, "tag") else None,
-            exposed_names=exposed_names,
-        )
+
+        filtered_models = self._model_parser.iter_models(unique_ids)
+        if self._catalog_parser.use_database:
+            filtered_models = list(filtered_models)
+            self._catalog_parser.prefetch(filtered_models)
 
         # Process models (update with catalog info)
-        processed_models = []
+        processed = 0
         nodes_without_catalogue = []
         for model in filtered_models:
-            if processed_model := self._catalog_parser.process_model(model):
-                processed_models.append(processed_model)
+            with profiler.span("CatalogParser.process_model", model.unique_id):
+                processed_model = self._catalog_parser.process_model(model)
+            if processed_model:
+                processed += 1
+                yield processed_model
             else:
                 nodes_without_catalogue.append(model.unique_id)
-        logging.debug(f"Found {len(processed_models)} models that were materialized")
+        logging.debug(f"Found {processed} models that were materialized")
         if nodes_without_catalogue:
             warnings.warn(
                 f"Not all models were materialized {nodes_without_catalogue}",
                 CatalogWarning,
             )
-        return processed_models
@@ -1,40 +1,76 @@
 """Catalog-specific parsing functionality."""
 
-from typing import List, Optional, Tuple
+import logging
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
 
 from dbt2looker_bigquery.models.dbt import (
     DbtCatalog,
+    DbtColumn,
+    DbtLazyCatalog,
     DbtModel,
     DbtModelColumn,
-    DbtModelColumnMeta,
 )
 from dbt2looker_bigquery.parsers.type import TypeParser
 from dbt2looker_bigquery.database.bigquery import BigQueryDatabase
+from dbt2looker_bigquery.utils import FileHandler
 import warnings
 from dbt2looker_bigquery.warnings import CatalogWarning
 
 
+class CatalogStreamParser:
+    """Read catalog.json incrementally, keeping only the nodes of the given models.
+
+    Nodes of other models and all sources are skipped without being decoded.
+    """
+
+    def __init__(
+        self, unique_ids: Collection[str], file_handler: Optional[FileHandler] = None
+    ):
+        self._unique_ids = set(unique_ids)
+        self._file_handler = file_handler or FileHandler()
+
+    def read(self, file_path: str) -> Dict:
+        """Stream the catalog and return a reduced raw catalog."""
+        catalog = {"nodes": {}}
+        for _, unique_id, node in self._file_handler.stream(
+            file_path, streamed=["nodes"], keys=self._unique_ids
+        ):
+            catalog["nodes"][unique_id] = node
+
+        logging.debug(
+            f"Kept {len(catalog['nodes'])} catalog nodes of {len(self._unique_ids)} selected models"
+        )
+        return catalog
+
+
 class CatalogParser:
     """Fill out a manifest with the actual materialization information."""
 
-    def __init__(self, catalog: DbtCatalog = None, use_database: bool = False):
+    def __init__(
+        self,
+        catalog: Union[DbtCatalog, DbtLazyCatalog] = None,
+        use_database: bool = False,
+        database: Optional[BigQueryDatabase] = None,
+    ):
         """Initialize with catalog data."""
         self._catalog = catalog
         self._type_parser = TypeParser()
-        self._database = BigQueryDatabase()
+        self._database = database or BigQueryDatabase()
+        self._prefetched = {}
         self.use_database = use_database
         self.node = None
 
     def _create_missing_column(
-        self, column_name: str, data_type: str, inner_types: List[str]
-    ) -> DbtModelColumn:
-        """Create a new column model for array columns missing from manifest."""
-        return DbtModelColumn(
-            name=column_name,
+        self, column_name: str, data_type: str, inner_types: Sequence[str]
+    ) -> DbtColumn:
+        """Create a new column record for array columns missing from manifest."""
+        name = column_name.lower()
+        return DbtColumn(
+            name=name,
             description="missing column from manifest.json, generated from catalog.json",
             data_type=data_type,
-            inner_types=inner_types,
-            meta=DbtModelColumnMeta(),
+            inner_types=tuple(inner_types),
+            nested="." in name,
         )
 
     def _get_catalog_node(self, unique_id: str):
@@ -48,63 +84,86 @@ class CatalogParser:
             )
             self.node = None
 
+    def _get_table_id(self, model: DbtModel) -> Tuple[str, str, str]:
+        """Get the project, dataset and table of a model in the database."""
+        return model.database, model.db_schema, model.name.split(".")[-1]
+
+    def prefetch(self, models: List[DbtModel]):
+        """Fetch the schemas of all models from the database concurrently."""
+        if self.use_database:
+            self._prefetched = self._database.get_dbt_table_schemas(
+                self._get_table_id(model) for model in models
+            )
+
     def _get_node(self, model: DbtModel):
         """Get a materialization node from the source."""
 
         if self.use_database:
-            self.node = self._database.get_dbt_table_schema(
-                model.database, model.db_schema, model.name.split(".")[-1]
-            )
+            table_id = self._get_table_id(model)
+            if table_id in self._prefetched:
+                node = self._prefetched.pop(table_id)
+                if isinstance(node, Exception):
+                    raise node
+                self.node = node
+            else:
+                self.node = self._database.get_dbt_table_schema(*table_id)
         else:
             self._get_catalog_node(model.unique_id)
 
+    def _get_column_type(
+        self, column_name: str
+    ) -> Tuple[Optional[str], Tuple[str, ...]]:
+        """Get the type and the shared inner types tuple of a column from the catalog."""
+        catalog_column = (
+            self.node.columns.get(column_name.lower()) if self.node else None
+        )
+        if catalog_column is None or catalog_column.type is None:
+            return None, ()
+
+        return self._type_parser.parse_shared(catalog_column.type)
+
     def _get_typing_information(
         self, column_name: str
     ) -> Tuple[Optional[str], List[str]]:
         """Get column type information from catalog."""
-        if not self.node or column_name.lower() not in self.node.columns:
-            return None, []
+        data_type, inner_types = self._get_column_type(column_name)
+        return data_type, list(inner_types)
 
-        catalog_column = self.node.columns[column_name.lower()]
-        if catalog_column.type is None:
-            return None, []
-
-        data_type = self._type_parser.get_data_type(catalog_column.type)
-        inner_types = self._type_parser.get_inner_types(catalog_column.type)
-
-        return data_type, inner_types
-
-    def _add_types(self, column: DbtModelColumn) -> Optional[DbtModelColumn]:
-        """Update a column with type information from catalog."""
-        data_type, inner_types = self._get_typing_information(column.name)
+    def _add_types(self, column: DbtModelColumn) -> Optional[DbtColumn]:
+        """Build the record of a column with type information from catalog."""
+        data_type, inner_types = self._get_column_type(column.name)
         if data_type is not None:
-            return column.model_copy(
-                update={"data_type": data_type, "inner_types": inner_types}
-            )
+            return DbtColumn.from_manifest(column, data_type, inner_types)
 
     def process_model(self, model: DbtModel) -> Optional[DbtModel]:
-        """Process a model by filling out its columns with catalog information."""
-        processed_columns = {}
+        """Process a model by filling out its columns with catalog information.
+
+        The columns of the processed model are DbtColumn records.
+        """
+        processed_columns: Dict[str, DbtColumn] = {}
 
         self._get_node(model)
 
         if self.node:
             # add types to manifested columns
             for column_name, column in model.columns.items():
-                print(model.name, column_name)
                 processed_column = self._add_types(column)
-                if processed_column.data_type and processed_column.inner_types:
+                if (
+                    processed_column
+                    and processed_column.data_type
+                    and processed_column.inner_types
+                ):
                     processed_columns[column_name] = processed_column
                 else:
                     warnings.warn(
-                        f"🟥➖ {self.node.unique_id}, Manifest Column {column.name} is not materialized. Skipping.",
+                        f"🟥➖ {model.unique_id}, Manifest Column {column.name} is not materialized. Skipping.",
                         CatalogWarning,
                     )
 
             # add missing columns from materialization
             for column_name, column in self.node.columns.items():
                 if column_name not in processed_columns:
-                    data_type, inner_types = self._get_typing_information(column_name)
+                    data_type, inner_types = self._get_column_type(column_name)
 
                     if data_type not in ["ARRAY", "STRUCT"]:
                         warnings.warn(
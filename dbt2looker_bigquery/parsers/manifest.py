@@ -0,0 +1,85 @@
+"""Streaming manifest parsing functionality."""
+
+import logging
+from typing import Dict, List, Optional, Set
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.parsers.selection import ModelSelector
+from dbt2looker_bigquery.utils import FileHandler, strip_model_name
+
+
+class ManifestStreamParser:
+    """Read manifest.json incrementally, keeping only the models that pass the filters.
+
+    The result has the same shape as a raw manifest, but its nodes only contain the
+    models that would survive the --select, --tag and exposure filters, so it can be
+    handed to DbtParser without the full manifest ever being held in memory.
+    """
+
+    def __init__(
+        self, config: GeneratorConfig, file_handler: Optional[FileHandler] = None
+    ):
+        self._file_handler = file_handler or FileHandler()
+        select = config.select
+        self._selectors = {strip_model_name(s) for s in select} if select else None
+        self._select_paths = set(select or [])
+        self._tag = config.tag
+        self._exposures_tag = config.exposures_tag
+        self._use_exposures = (
+            config.exposures_only or bool(self._exposures_tag)
+        ) and not self._selectors
+        # unique ids of every model in the manifest, kept or not
+        self.model_ids: List[str] = []
+
+    def _keep_node(self, node: Dict, exposed_names: Set[str]) -> bool:
+        """Check if a raw node is a model that passes the filters."""
+        if node.get("resource_type") != "model":
+            return False
+        if self._selectors is not None:
+            return node.get("name") in self._selectors or bool(
+                {node.get("path"), node.get("original_file_path")} & self._select_paths
+            )
+        if self._tag and self._tag not in (node.get("tags") or []):
+            return False
+        if exposed_names and node.get("name") not in exposed_names:
+            return False
+        return True
+
+    def read(self, file_path: str) -> Dict:
+        """Stream the manifest and return a reduced raw manifest."""
+        manifest = {"nodes": {}, "exposures": {}}
+
+        if self._use_exposures:
+            # exposures are stored after the nodes, so they need a pass of their own
+            for section, key, value in self._file_handler.stream(
+                file_path, streamed=["exposures"], loaded=["metadata"]
+            ):
+                if key is None:
+                    manifest[section] = value
+                else:
+                    manifest[section][key] = value
+            exposed_names = ModelSelector({}, manifest["exposures"]).exposed_names(
+                self._exposures_tag
+            )
+            sections = {"streamed": ["nodes"]}
+        else:
+            exposed_names = set()
+            sections = {"streamed": ["nodes", "exposures"], "loaded": ["metadata"]}
+
+        scanned = 0
+        for section, key, value in self._file_handler.stream(file_path, **sections):
+            if key is None:
+                manifest[section] = value
+            elif section == "exposures":
+                manifest[section][key] = value
+            else:
+                scanned += 1
+                if value.get("resource_type") == "model":
+                    self.model_ids.append(key)
+                if self._keep_node(value, exposed_names):
+                    manifest[section][key] = value
+
+        logging.debug(
+            f"Kept {len(manifest['nodes'])} of {scanned} nodes while streaming manifest"
+        )
+        return manifest
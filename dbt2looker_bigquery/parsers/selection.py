@@ -0,0 +1,110 @@
+"""Model selection functionality."""
+
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.utils import strip_model_name
+
+
+class ModelSelector:
+    """Select models from the raw manifest before any of them are validated.
+
+    Model nodes are indexed by name, path and tag, and exposures by the names of the
+    models they reference, in a single pass over the manifest. Every selection after
+    that is a set lookup instead of a scan over all nodes.
+    """
+
+    def __init__(
+        self, raw_nodes: Dict[str, Dict], raw_exposures: Optional[Dict] = None
+    ):
+        """Build the index from raw manifest nodes and exposures."""
+        self._model_ids: List[str] = []
+        self._by_name: Dict[str, List[str]] = defaultdict(list)
+        self._by_path: Dict[str, List[str]] = defaultdict(list)
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        # None holds the models referenced by any exposure
+        self._exposed_names: Dict[Optional[str], Set[str]] = defaultdict(set)
+
+        for unique_id, node in raw_nodes.items():
+            if node.get("resource_type") != "model":
+                continue
+            self._model_ids.append(unique_id)
+            self._by_name[node.get("name")].append(unique_id)
+            for path in {node.get("path"), node.get("original_file_path")} - {None}:
+                self._by_path[path].append(unique_id)
+            for tag in node.get("tags") or []:
+                self._by_tag[tag].add(unique_id)
+
+        for exposure in (raw_exposures or {}).values():
+            if exposure.get("resource_type") != "exposure":
+                continue
+            names = {ref["name"] for ref in exposure.get("refs", [])}
+            self._exposed_names[None] |= names
+            for tag in exposure.get("tags") or []:
+                self._exposed_names[tag] |= names
+
+    @property
+    def model_ids(self) -> List[str]:
+        """Unique ids of all models in the manifest, in manifest order."""
+        return self._model_ids
+
+    def exposed_names(self, exposures_tag: Optional[str] = None) -> Set[str]:
+        """Get the names of models referenced by exposures, optionally by exposure tag."""
+        return set(self._exposed_names.get(exposures_tag, ()))
+
+    def _ids_for_names(self, names: Set[str]) -> Set[str]:
+        return {
+            unique_id for name in names for unique_id in self._by_name.get(name, ())
+        }
+
+    def select(
+        self,
+        select_model: Optional[List[str]] = None,
+        tag: Optional[str] = None,
+        exposures_only: bool = False,
+        exposures_tag: Optional[str] = None,
+    ) -> List[str]:
+        """Get the unique ids of the selected models, in manifest order.
+
+        --select takes precedence over the other criteria. A selector matches a model
+        by its name (with any folders and file extension removed) or by its path.
+        """
+        selected = None
+
+        if select_model:
+            selected = set()
+            for selector in select_model:
+                selected.update(self._by_path.get(selector, ()))
+            selected |= self._ids_for_names(
+                {strip_model_name(selector) for selector in select_model}
+            )
+        else:
+            if tag:
+                selected = set(self._by_tag.get(tag, ()))
+                logging.debug(f"Models after tag: {len(selected)}")
+
+            if exposures_only or exposures_tag:
+                exposed_names = self.exposed_names(exposures_tag)
+                logging.debug(f"Found {len(exposed_names)} exposed models")
+                # no matching exposures means no exposure filtering
+                if exposed_names:
+                    exposed_ids = self._ids_for_names(exposed_names)
+                    selected = (
+                        exposed_ids if selected is None else selected & exposed_ids
+                    )
+                    logging.debug(f"Models after exposures: {len(selected)}")
+
+        if selected is None:
+            return list(self._model_ids)
+        return [unique_id for unique_id in self._model_ids if unique_id in selected]
+
+    def select_for(self, config: GeneratorConfig) -> List[str]:
+        """Get the unique ids of the models selected by the selection options of a config."""
+        return self.select(
+            select_model=config.select,
+            tag=config.tag,
+            exposures_only=config.exposures_only,
+            exposures_tag=config.exposures_tag,
+        )
@@ -8,9 +8,16 @@ while maintaining the hierarchical relationships between fields.
 import re
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dbt2looker_bigquery.enums import BigqueryType
 
+# distinct type strings to keep parsed, the same STRUCT types repeat across models
+TYPE_CACHE_SIZE = 4096
+
+_ARRAY_PREFIX = BigqueryType.ARRAY.value + "<"
+_STRUCT_PREFIX = BigqueryType.STRUCT.value + "<"
+
 
 @dataclass
 class SchemaField:
@@ -137,30 +144,155 @@ class TypeParser:
 
     def get_data_type(self, schema_str: str) -> str:
         """Returns the outer data type for a schema string."""
-        schema_str = self._normalize_numerics(schema_str)
+        return self._data_type(self._normalize_numerics(schema_str))
+
+    def _data_type(self, schema_str: str) -> str:
+        """Returns the outer data type of a normalized schema string."""
+        return self._map_type(schema_str.partition("<")[0].strip())
+
+    def _match_brackets(
+        self, text: str
+    ) -> Optional[Tuple[Dict[int, int], Dict[int, List[int]]]]:
+        """Tokenize a type string in a single pass.
+
+        Returns:
+            The position of the closing bracket for every opening bracket, and the
+            positions of the commas directly inside every opening bracket. None when
+            the brackets are unbalanced.
+        """
+        closing = {}
+        commas = {-1: []}
+        stack = [-1]
+        for position, char in enumerate(text):
+            if char == "<":
+                stack.append(position)
+                commas[position] = []
+            elif char == ">":
+                if len(stack) == 1:
+                    return None
+                closing[stack.pop()] = position
+            elif char == ",":
+                commas[stack[-1]].append(position)
+        if len(stack) > 1:
+            return None
+        return closing, commas
+
+    def _strip_range(self, text: str, start: int, end: int) -> Tuple[int, int]:
+        """Shrink a range of the text to exclude leading and trailing whitespace."""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def _find_inner_range(self, text: str, start: int, end: int) -> Tuple[int, int]:
+        """Range of the content between the first < and the last > in a range."""
+        opening = text.find("<", start, end)
+        closing = text.rfind(">", start, end)
+        if opening == -1 or closing <= opening:
+            return start, end
+        return opening + 1, closing
+
+    def _process_type_range(
+        self, text: str, start: int, end: int
+    ) -> Tuple[int, int, bool]:
+        """Same as _process_type, on a range of the text.
+        Returns: (inner_type_start, inner_type_end, has_struct)"""
+        if text.startswith(_ARRAY_PREFIX, start, end):
+            inner_start, inner_end = self._find_inner_range(text, start, end)
+            if text.startswith(_STRUCT_PREFIX, inner_start, inner_end):
+                return (*self._find_inner_range(text, inner_start, inner_end), True)
+            return inner_start, inner_end, False
+
+        if text.startswith(_STRUCT_PREFIX, start, end):
+            return (*self._find_inner_range(text, start, end), True)
+
+        return start, end, False
+
+    def _process_field_ranges(self, text: str, start: int, end: int, brackets):
+        """Processes the field definitions in a range of the text.
+
+        The fields of a bracket are split on the commas found while tokenizing, so
+        nested fields are not scanned again at every level.
+        """
+        closing, commas = brackets
+        opening = start - 1
+        if closing.get(opening) != end:
+            # the range is not a single bracket, e.g. ARRAY<A>, B<C>
+            self._process_fields(text[start:end])
+            return
+
+        boundaries = [start - 1, *commas[opening], end]
+        for field_start, field_end in zip(boundaries, boundaries[1:]):
+            field_start, field_end = self._strip_range(text, field_start + 1, field_end)
+            if field_start == field_end:
+                continue
 
-        if "<" not in schema_str:
-            return self._map_type(schema_str.strip())
-        else:
-            return self._map_type(schema_str.split("<")[0].strip())
+            space = text.find(" ", field_start, field_end)
+            if space == -1:
+                raise ValueError(f"Field without a type: {text[field_start:field_end]}")
+            name = text[field_start:space]
+
+            type_start, type_end = self._strip_range(text, space + 1, field_end)
+            inner_start, inner_end, has_struct = self._process_type_range(
+                text, type_start, type_end
+            )
+
+            if has_struct:
+                self._add_field(name, text[inner_start:inner_end])
+                with self._path_context(name):
+                    self._process_field_ranges(text, inner_start, inner_end, brackets)
+            else:
+                self._add_field(name, text[space + 1 : field_end])
 
     def get_inner_types(self, schema_str: str) -> List[str]:
         """Returns the outer data type and a list of inner types for a schema string."""
+        return self._inner_types(self._normalize_numerics(schema_str))
+
+    def _inner_types(self, schema_str: str) -> List[str]:
+        """Returns the inner types of a normalized schema string."""
         self._fields = []
         self._current_path = []
 
-        schema_str = self._normalize_numerics(schema_str)
-
-        inner_type_str, is_struct = self._process_type(schema_str)
-
-        if is_struct:
-            self._process_fields(inner_type_str)
+        brackets = self._match_brackets(schema_str) if "\n" not in schema_str else None
+        if brackets is None:
+            # unbalanced types are split the slow way
+            inner_type_str, is_struct = self._process_type(schema_str)
+            if is_struct:
+                self._process_fields(inner_type_str)
+            else:
+                self._add_field("", inner_type_str)
         else:
-            self._add_field(
-                "",
-                inner_type_str,
+            inner_start, inner_end, is_struct = self._process_type_range(
+                schema_str, 0, len(schema_str)
             )
+            if is_struct:
+                self._process_field_ranges(schema_str, inner_start, inner_end, brackets)
+            else:
+                self._add_field("", schema_str[inner_start:inner_end])
 
         inner_type_list = sorted(str(field) for field in self._fields)
 
         return inner_type_list
+
+    def parse(self, schema_str: str) -> Tuple[str, List[str]]:
+        """Returns the outer data type and the inner types of a schema string.
+
+        Results are cached by schema string, see TYPE_CACHE_SIZE.
+        """
+        data_type, inner_types = _parse_cached(schema_str)
+        return data_type, list(inner_types)
+
+    def _parse(self, schema_str: str) -> Tuple[str, Tuple[str, ...]]:
+        """Returns the outer data type and the inner types, normalizing the string once."""
+        schema_str = self._normalize_numerics(schema_str)
+        return self._data_type(schema_str), tuple(self._inner_types(schema_str))
+
+    def parse_shared(self, schema_str: str) -> Tuple[str, Tuple[str, ...]]:
+        """Like parse, but returns the cached inner types tuple itself instead of a copy."""
+        return _parse_cached(schema_str)
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _parse_cached(schema_str: str) -> Tuple[str, Tuple[str, ...]]:
+    return TypeParser()._parse(schema_str)
@@ -0,0 +1,178 @@
+"""Per-stage and per-model profiling of a generation run."""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, List, NamedTuple, Optional
+
+from dbt2looker_bigquery.utils import write_atomic
+
+REPORT_FILE_NAME = "profile.json"
+TRACE_FILE_NAME = "profile.trace.json"
+CPROFILE_FILE_NAME = "profile.prof"
+
+_DISABLED = nullcontext()
+
+
+class Span(NamedTuple):
+    """A timed stage, optionally for a single model."""
+
+    name: str
+    model: Optional[str]
+    start: float
+    duration: float
+    # net change in the number of memory blocks allocated by the interpreter
+    allocated_blocks: int
+    pid: int
+    tid: int
+
+
+class _SpanContext:
+    __slots__ = ("_profiler", "_name", "_model", "_start", "_blocks")
+
+    def __init__(self, profiler: "Profiler", name: str, model: Optional[str]):
+        self._profiler = profiler
+        self._name = name
+        self._model = model
+
+    def __enter__(self):
+        self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self._start
+        self._profiler.spans.append(
+            Span(
+                self._name,
+                self._model,
+                self._start,
+                duration,
+                sys.getallocatedblocks() - self._blocks,
+                os.getpid(),
+                threading.get_native_id(),
+            )
+        )
+
+
+class Profiler:
+    """Collect spans of the instrumented stages while enabled.
+
+    When disabled, span() returns a shared no-op context, so the instrumentation
+    costs next to nothing in normal runs.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.spans = []
+
+    def span(self, name: str, model: Optional[str] = None):
+        """Time a stage, e.g. with profiler.span("dump_lookml", model.unique_id): ..."""
+        if not self.enabled:
+            return _DISABLED
+        return _SpanContext(self, name, model)
+
+    def merge(self, spans: List[Span]):
+        """Add spans recorded in another process."""
+        self.spans.extend(Span(*span) for span in spans)
+
+    def report(self, top: int = 10) -> Dict:
+        """Summarize the spans per stage and per model."""
+        stages = defaultdict(list)
+        models = defaultdict(
+            lambda: {"total": 0.0, "allocated_blocks": 0, "stages": {}}
+        )
+        for span in self.spans:
+            stages[span.name].append(span.duration)
+            if span.model is not None:
+                model = models[span.model]
+                model["total"] += span.duration
+                model["allocated_blocks"] += span.allocated_blocks
+                model["stages"][span.name] = (
+                    model["stages"].get(span.name, 0.0) + span.duration
+                )
+
+        slowest = sorted(
+            models.items(), key=lambda item: item[1]["total"], reverse=True
+        )
+        return {
+            "stages": {
+                name: {
+                    "count": len(durations),
+                    "total": sum(durations),
+                    "mean": sum(durations) / len(durations),
+                    "max": max(durations),
+                }
+                for name, durations in stages.items()
+            },
+            "models": dict(models),
+            "slowest_models": [
+                {"model": name, **stats} for name, stats in slowest[:top]
+            ],
+        }
+
+    def chrome_trace(self) -> Dict:
+        """Spans in the Chrome trace event format, for chrome://tracing or Perfetto."""
+        origin = min((span.start for span in self.spans), default=0.0)
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": "dbt2looker",
+                    "ph": "X",
+                    "ts": (span.start - origin) * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": {
+                        "model": span.model,
+                        "allocated_blocks": span.allocated_blocks,
+                    },
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, profile_dir: str, top: int = 10) -> Dict:
+        """Write the report and the Chrome trace to a directory, returning the report."""
+        report = self.report(top)
+        os.makedirs(profile_dir, exist_ok=True)
+        write_atomic(
+            os.path.join(profile_dir, REPORT_FILE_NAME), json.dumps(report, indent=2)
+        )
+        write_atomic(
+            os.path.join(profile_dir, TRACE_FILE_NAME), json.dumps(self.chrome_trace())
+        )
+        logging.info(f"Wrote profile report and trace to {profile_dir}")
+        return report
+
+
+# the profiler shared by the instrumented stages
+profiler = Profiler()
+
+
+def log_report(report: Dict):
+    """Log the time per stage and the slowest models of a report."""
+    for name, stats in report["stages"].items():
+        logging.info(
+            f"{name}: {stats['total']:.3f}s in {stats['count']} calls, max {stats['max']:.3f}s"
+        )
+    for model in report["slowest_models"]:
+        stages = ", ".join(
+            f"{name} {duration:.3f}s" for name, duration in model["stages"].items()
+        )
+        logging.info(f"Slow model {model['model']}: {model['total']:.3f}s ({stages})")
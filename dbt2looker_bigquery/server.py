@@ -0,0 +1,211 @@
+"""A local generation server that keeps the parsed dbt project warm between requests."""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import time
+import warnings
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.generators import LookmlGenerator
+from dbt2looker_bigquery.generators.emitter import dump_lookml
+from dbt2looker_bigquery.incremental import GENERATION_FLAGS, get_tool_version
+from dbt2looker_bigquery.output import OutputWriter
+from dbt2looker_bigquery.parsers import DbtParser
+from dbt2looker_bigquery.utils import FileHandler
+from dbt2looker_bigquery.watch import Signature, file_signature
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class GenerationService:
+    """Generate views from dbt artifacts that are kept in memory between calls.
+
+    manifest.json and catalog.json are only read again when their size or
+    modification time changed. The LookML of every model is kept until its
+    manifest node, catalog node or the generation flags change, or the model is
+    deleted.
+    """
+
+    def __init__(self, args, parse_args: Callable[..., argparse.Namespace]):
+        """
+        Args:
+            args: The cli arguments the server was started with, they are the
+                defaults of every request
+            parse_args: Parses the arguments of a request into a namespace, e.g.
+                the parse_args of a parser with only the selection and generation
+                arguments, so requests cannot change paths or server options
+        """
+        self._args = args
+        self._parse_args = parse_args
+        self._file_handler = FileHandler()
+        self._paths = (
+            os.path.join(args.target_dir, "manifest.json"),
+            os.path.join(args.target_dir, "catalog.json"),
+        )
+        self._signatures: Optional[Tuple[Signature, Signature]] = None
+        self._parser: Optional[DbtParser] = None
+        # flags, raw inputs, view path and LookML of every generated model
+        self._views: Dict[str, Tuple[Tuple, Tuple, str, str]] = {}
+
+    def parse_args(self, argv: List[str]) -> argparse.Namespace:
+        """Parse the arguments of a request on top of the arguments of the server."""
+        try:
+            return self._parse_args(argv, namespace=copy.copy(self._args))
+        except (SystemExit, TypeError):
+            # argparse exits on unknown flags and fails on values that are not strings
+            raise ValueError(f"Invalid arguments: {argv}") from None
+
+    def load(self) -> DbtParser:
+        """Read the artifacts if they changed since they were last read."""
+        signatures = tuple(file_signature(path) for path in self._paths)
+        if self._parser is None or signatures != self._signatures:
+            manifest_path, catalog_path = self._paths
+            self._parser = DbtParser(
+                self._file_handler.read(manifest_path),
+                self._file_handler.read(catalog_path),
+                GeneratorConfig.from_args(self._args),
+            )
+            self._signatures = signatures
+            # forget the views of models that were deleted
+            model_ids = set(self._parser.model_ids)
+            self._views = {
+                unique_id: entry
+                for unique_id, entry in self._views.items()
+                if unique_id in model_ids
+            }
+            logging.info(
+                f"Loaded {len(self._parser.model_ids)} models from {self._args.target_dir}"
+            )
+        return self._parser
+
+    def generate(self, args) -> Dict:
+        """Generate the views of the models selected by the arguments.
+
+        Returns the path of each view, or its LookML when no output is written,
+        by model unique id, with the counts of the run and the warnings it raised.
+        """
+        start = time.perf_counter()
+        # every request reports its own warnings, even ones an earlier request raised
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = self._generate(args)
+
+        return {
+            **result,
+            "warnings": [
+                f"{warning.category.__name__}: {warning.message}" for warning in caught
+            ],
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _generate(self, args) -> Dict:
+        parser = self.load()
+
+        config = GeneratorConfig.from_args(args)
+        flags = tuple(getattr(config, flag) for flag in GENERATION_FLAGS)
+        lookml = {}
+        stale = []
+        for unique_id in parser.select(config):
+            inputs = parser.raw_inputs(unique_id)
+            entry = self._views.get(unique_id)
+            if entry is not None and entry[:2] == (flags, inputs):
+                # keep the inputs of the current artifacts, so older ones can be freed
+                self._views[unique_id] = (flags, inputs, *entry[2:])
+                lookml[unique_id] = entry[2:]
+            else:
+                stale.append(unique_id)
+
+        counts = Counter(cached=len(lookml), generated=0)
+        lookml_generator = LookmlGenerator(config)
+        for model in parser.iter_models(config, stale):
+            file_path, view = lookml_generator.generate(model=model)
+            contents = dump_lookml(view)
+            self._views[model.unique_id] = (
+                flags,
+                parser.raw_inputs(model.unique_id),
+                file_path,
+                contents,
+            )
+            lookml[model.unique_id] = file_path, contents
+            counts["generated"] += 1
+
+        views = {}
+        if args.write_output:
+            file_handler = FileHandler()
+            output_writer = OutputWriter(args.output_dir, file_handler)
+            for unique_id, (file_path, contents) in lookml.items():
+                views[unique_id] = output_writer.write(file_path, contents)
+            if args.prune:
+                output_writer.prune(views, parser.model_ids)
+            counts.update(file_handler.counts)
+        else:
+            views = {unique_id: contents for unique_id, (_, contents) in lookml.items()}
+
+        return {"views": views, "counts": dict(counts)}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """GET /health and POST /generate with a JSON body like {"args": ["--select", "orders"]}"""
+
+    def _respond(self, status: int, body: Dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+        self._respond(200, {"status": "ok", "version": get_tool_version()})
+
+    def do_POST(self):
+        if self.path != "/generate":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        # browsers send cross-site text/plain posts without asking, JSON needs consent
+        if self.headers.get_content_type() != "application/json":
+            self._respond(415, {"error": "Requests must be sent as application/json"})
+            return
+
+        service: GenerationService = self.server.service
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            args = service.parse_args(body.get("args", []))
+        except (ValueError, TypeError, AttributeError) as e:
+            self._respond(400, {"error": str(e)})
+            return
+
+        try:
+            result = service.generate(args)
+        except Exception as e:
+            logging.error(f"Error occurred during generation. {e}")
+            self._respond(500, {"error": str(e)})
+            return
+        logging.info(
+            f"Generated {len(result['views'])} views in {result['seconds'] * 1000:.0f}ms"
+        )
+        self._respond(200, result)
+
+    def log_message(self, format, *args):
+        logging.debug(format % args)
+
+
+def make_server(
+    service: GenerationService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> HTTPServer:
+    """Create a single threaded HTTP server for the service, requests are handled in order."""
+    server = HTTPServer((host, port), _RequestHandler)
+    server.service = service
+    return server
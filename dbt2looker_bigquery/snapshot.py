@@ -0,0 +1,215 @@
+"""Snapshots of the models in dbt artifacts, to skip decoding the artifacts again.
+
+A snapshot holds the model nodes of manifest.json and catalog.json, with the
+metadata and exposures. It is stored in a cache directory under a key made of the
+SHA-256 of both artifacts and the version of the tool, so every run against the
+same artifacts, with any selection and generation options, can load it instead of
+the JSON files.
+
+A snapshot file is a plain text header line, a JSON line with the metadata, the
+exposures, the fields models are selected by and the byte range of every node, and
+the JSON of every node. Loading a snapshot only decodes the first two lines, nodes
+are decoded when their model is selected.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from dbt2looker_bigquery.decoding import decode
+from dbt2looker_bigquery.incremental import get_tool_version
+from dbt2looker_bigquery.index import SELECTION_FIELDS, file_digest
+from dbt2looker_bigquery.utils import evict_least_recently_used, write_atomic
+
+# bumped whenever the layout of a snapshot changes
+SNAPSHOT_VERSION = 2
+DEFAULT_MAX_SNAPSHOTS = 8
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def snapshot_key(manifest_path: str, catalog_path: Optional[str] = None) -> str:
+    """Key of the snapshot of the artifacts, from their contents and the tool version."""
+    parts = [
+        str(SNAPSHOT_VERSION),
+        get_tool_version(),
+        file_digest(manifest_path),
+        file_digest(catalog_path) if catalog_path else "",
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ProjectSnapshot:
+    """The model nodes of a manifest and its catalog, encoded as JSON one by one.
+
+    The metadata, exposures and the fields models are selected by are decoded with
+    the snapshot, the nodes only when a model is selected.
+    """
+
+    def __init__(
+        self,
+        metadata: Dict[str, Any],
+        exposures: Dict[str, Dict[str, Any]],
+        models: Dict[str, Dict[str, Any]],
+        nodes: Dict[str, List[int]],
+        catalog_nodes: Dict[str, List[int]],
+        data: bytes,
+    ):
+        """
+        Args:
+            metadata: The metadata of the manifest
+            exposures: The exposures of the manifest
+            models: The selection fields of every model, by unique id, in manifest order
+            nodes: Offset and length of the manifest node of every model in data
+            catalog_nodes: Offset and length of the catalog node of every model in data
+            data: The JSON of all nodes
+        """
+        self.metadata = metadata
+        self.exposures = exposures
+        self.models = models
+        self._nodes = nodes
+        self._catalog_nodes = catalog_nodes
+        self._data = data
+
+    @classmethod
+    def from_artifacts(
+        cls, raw_manifest: Dict, raw_catalog: Optional[Dict] = None
+    ) -> "ProjectSnapshot":
+        """Reduce loaded artifacts to their models."""
+        models, nodes, catalog_nodes = {}, {}, {}
+        chunks = []
+        size = 0
+
+        def add(node: Dict) -> List[int]:
+            nonlocal size
+            encoded = json.dumps(node).encode()
+            chunks.append(encoded)
+            size += len(encoded)
+            return [size - len(encoded), len(encoded)]
+
+        raw_catalog_nodes = (raw_catalog or {}).get("nodes", {})
+        for unique_id, node in raw_manifest.get("nodes", {}).items():
+            if node.get("resource_type") != "model":
+                continue
+            models[unique_id] = {
+                field: node[field] for field in SELECTION_FIELDS if field in node
+            }
+            nodes[unique_id] = add(node)
+            if unique_id in raw_catalog_nodes:
+                catalog_nodes[unique_id] = add(raw_catalog_nodes[unique_id])
+
+        return cls(
+            raw_manifest.get("metadata", {}),
+            raw_manifest.get("exposures", {}),
+            models,
+            nodes,
+            catalog_nodes,
+            b"".join(chunks),
+        )
+
+    @classmethod
+    def loads(cls, data: bytes) -> "ProjectSnapshot":
+        """Read a snapshot from the output of dumps.
+
+        Raises:
+            ValueError: If the data is not a snapshot
+        """
+        contents, separator, nodes_data = data.partition(b"\n")
+        if not separator:
+            raise ValueError("The snapshot has no nodes")
+        contents = decode(contents)
+        if not isinstance(contents, dict):
+            raise ValueError("The snapshot is not an object")
+        try:
+            return cls(**contents, data=nodes_data)
+        except TypeError as e:
+            raise ValueError(f"The snapshot has other fields: {e}") from e
+
+    def dumps(self) -> bytes:
+        """Encode the snapshot, nodes are stored as they are."""
+        contents = {
+            "metadata": self.metadata,
+            "exposures": self.exposures,
+            "models": self.models,
+            "nodes": self._nodes,
+            "catalog_nodes": self._catalog_nodes,
+        }
+        # JSON without indentation has no newlines, the first one ends the contents
+        return json.dumps(contents).encode() + b"\n" + self._data
+
+    def _decode(
+        self, spans: Dict[str, List[int]], unique_ids: Iterable[str]
+    ) -> Dict[str, Dict]:
+        decoded = {}
+        with memoryview(self._data) as data:
+            for unique_id in unique_ids:
+                if unique_id in spans:
+                    offset, length = spans[unique_id]
+                    decoded[unique_id] = decode(data[offset : offset + length])
+        return decoded
+
+    def raw_manifest(self, unique_ids: Iterable[str]) -> Dict:
+        """A raw manifest with the nodes of these models."""
+        return {
+            "metadata": self.metadata,
+            "exposures": self.exposures,
+            "nodes": self._decode(self._nodes, unique_ids),
+        }
+
+    def raw_catalog(self, unique_ids: Iterable[str]) -> Dict:
+        """A raw catalog with the nodes of these models."""
+        return {"nodes": self._decode(self._catalog_nodes, unique_ids)}
+
+
+class SnapshotCache:
+    """On-disk cache of project snapshots, keyed by snapshot_key.
+
+    Every file starts with a plain text line with the format version and the key,
+    which is checked before the snapshot is decoded. The least recently used
+    snapshots are removed when there are more than max_snapshots.
+    """
+
+    def __init__(self, cache_dir: str, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS):
+        self._cache_dir = cache_dir
+        self._max_snapshots = max_snapshots
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}{SNAPSHOT_SUFFIX}")
+
+    @staticmethod
+    def _header(key: str) -> bytes:
+        return f"dbt2looker snapshot {SNAPSHOT_VERSION} {key}\n".encode()
+
+    def get(self, key: str) -> Optional[ProjectSnapshot]:
+        """Get a snapshot, or None if it is missing or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != self._header(key):
+                    logging.debug(f"Ignoring snapshot {path} of another version")
+                    return None
+                snapshot = ProjectSnapshot.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logging.debug(f"Ignoring unreadable snapshot {path}: {e}")
+            return None
+
+        # the modification time tracks use, so eviction drops the least recently used
+        os.utime(path)
+        return snapshot
+
+    def put(self, key: str, snapshot: ProjectSnapshot):
+        """Store a snapshot, replacing any existing one atomically."""
+        write_atomic(self._path(key), self._header(key) + snapshot.dumps())
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used snapshots beyond max_snapshots."""
+        excess = evict_least_recently_used(
+            self._cache_dir, SNAPSHOT_SUFFIX, self._max_snapshots
+        )
+        if excess:
+            logging.debug(f"Evicted {excess} snapshots from the snapshot cache")
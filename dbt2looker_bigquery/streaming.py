@@ -0,0 +1,231 @@
+"""Incremental reading of large JSON documents.
+
+dbt artifacts such as manifest.json can grow to several hundred megabytes. The
+reader in this module walks the top level object of such a file in chunks and
+only decodes the members that are asked for, so memory use follows the size of
+the largest single member instead of the size of the whole file.
+"""
+
+import json
+import re
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# how deep containers are consumed by the content pattern in one match, deeper
+# ones are counted bracket by bracket
+_NESTED_CONTAINER_DEPTH = 3
+
+
+def _container_content() -> "re.Pattern[bytes]":
+    # a run of anything but brackets, with whole strings, so brackets inside strings
+    # are skipped, and with whole containers up to _NESTED_CONTAINER_DEPTH deep; the
+    # possessive quantifiers never backtrack, a container that is not complete in
+    # the buffer is left for the scanner
+    flat = rb'[^"{}\[\]]++|"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+    content = flat
+    for _ in range(_NESTED_CONTAINER_DEPTH):
+        content = flat + rb"|[\[{](?:" + content + rb")*+[\]}]"
+    return re.compile(rb"(?:" + content + rb")*+", re.DOTALL)
+
+
+_CONTAINER_CONTENT = _container_content()
+_SCALAR = re.compile(rb"[^,:{}\[\]\s]+")
+
+
+class _Scanner:
+    """Byte level scanner over a file that only keeps the unconsumed tail in memory."""
+
+    def __init__(self, file: BinaryIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buf = bytearray()
+        self._buf_start = 0  # file offset of self._buf[0]
+        self._pos = 0
+        self._mark = None  # file offset that must stay in the buffer while capturing
+
+    def _more(self) -> bool:
+        """Read the next chunk, dropping everything that is no longer needed."""
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            return False
+
+        keep_from = self._buf_start + self._pos if self._mark is None else self._mark
+        drop = keep_from - self._buf_start
+        if drop:
+            del self._buf[:drop]
+            self._buf_start += drop
+            self._pos -= drop
+        self._buf += chunk
+        return True
+
+    def _error(self, expected: str) -> ValueError:
+        return ValueError(
+            f"Malformed JSON, expected {expected} at byte {self._buf_start + self._pos}"
+        )
+
+    def skip_whitespace(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._more():
+                return
+
+    def peek(self) -> bytes:
+        self.skip_whitespace()
+        if self._pos >= len(self._buf):
+            raise self._error("a value")
+        return self._buf[self._pos : self._pos + 1]
+
+    def expect(self, char: bytes):
+        if self.peek() != char:
+            raise self._error(repr(char.decode()))
+        self._pos += 1
+
+    def _scan_string(self):
+        while not (match := _STRING.match(self._buf, self._pos)):
+            if not self._more():
+                raise self._error("end of string")
+        self._pos = match.end()
+
+    def _scan_container(self):
+        # step over the opening bracket first, the content pattern would otherwise
+        # consume a small container whole, along with what follows it
+        self._pos += 1
+        depth = 1
+        while True:
+            self._pos = _CONTAINER_CONTENT.match(self._buf, self._pos).end()
+            # at the end of the buffer, or at a string that continues past it
+            if self._pos == len(self._buf) or self._buf[self._pos] == ord('"'):
+                if not self._more():
+                    raise self._error("end of object")
+                continue
+
+            char = self._buf[self._pos]
+            self._pos += 1
+            if char in b"{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _scan_scalar(self):
+        while True:
+            match = _SCALAR.match(self._buf, self._pos)
+            if match is None:
+                raise self._error("a value")
+            if match.end() < len(self._buf) or not self._more():
+                self._pos = match.end()
+                return
+
+    def scan_value(self):
+        """Move past the next value without decoding it."""
+        char = self.peek()
+        if char == b'"':
+            self._scan_string()
+        elif char in (b"{", b"["):
+            self._scan_container()
+        else:
+            self._scan_scalar()
+
+    def capture(self, scan: Callable[[], None]) -> Tuple[int, bytes]:
+        """Run a scan and return the file offset and raw bytes it moved over."""
+        self.skip_whitespace()
+        self._mark = self._buf_start + self._pos
+        try:
+            scan()
+        finally:
+            start, self._mark = self._mark, None
+        return start, bytes(self._buf[start - self._buf_start : self._pos])
+
+    def members(self) -> Iterator[str]:
+        """Iterate the keys of the next object. The caller must consume each value."""
+        self.expect(b"{")
+        if self.peek() == b"}":
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != b'"':
+                raise self._error("an object key")
+            _, raw_key = self.capture(self._scan_string)
+            self.expect(b":")
+            yield json.loads(raw_key)
+
+            char = self.peek()
+            self._pos += 1
+            if char == b"}":
+                return
+            if char != b",":
+                self._pos -= 1
+                raise self._error("',' or '}'")
+
+
+class JsonStreamReader:
+    """Walk the top level object of a JSON file without loading it in full.
+
+    Sections listed in ``streamed`` must be objects and are yielded one member at a
+    time. Sections listed in ``loaded`` are yielded as a whole. Every other section
+    is skipped without being decoded.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._file_path = file_path
+        self._chunk_size = chunk_size
+
+    def iter_spans(
+        self,
+        streamed: Iterable[str] = (),
+        loaded: Iterable[str] = (),
+        keys: Optional[Container[str]] = None,
+    ) -> Iterator[Tuple[str, Optional[str], int, bytes]]:
+        """Yield (section, key, byte offset, raw bytes) for the requested sections.
+
+        key is None for loaded sections. With keys, members of streamed sections
+        with other keys are skipped without being copied.
+        """
+        streamed = set(streamed)
+        loaded = set(loaded)
+        remaining = streamed | loaded
+
+        with open(self._file_path, "rb") as f:
+            scanner = _Scanner(f, self._chunk_size)
+            for section in scanner.members():
+                if not remaining:
+                    # Everything that was asked for has been read
+                    return
+                remaining.discard(section)
+
+                if section in streamed and scanner.peek() == b"{":
+                    for key in scanner.members():
+                        if keys is not None and key not in keys:
+                            scanner.scan_value()
+                            continue
+                        offset, raw = scanner.capture(scanner.scan_value)
+                        yield section, key, offset, raw
+                elif section in loaded:
+                    offset, raw = scanner.capture(scanner.scan_value)
+                    yield section, None, offset, raw
+                else:
+                    scanner.scan_value()
+
+    def iter_sections(
+        self,
+        streamed: Iterable[str] = (),
+        loaded: Iterable[str] = (),
+        keys: Optional[Container[str]] = None,
+    ) -> Iterator[Tuple[str, Optional[str], Any]]:
+        """Yield (section, key, decoded value) for the requested sections."""
+        for section, key, _, raw in self.iter_spans(streamed, loaded, keys):
+            yield section, key, json.loads(raw)
@@ -1,8 +1,30 @@
-import json
 import logging
-
+import os
+import shutil
+import uuid
+from collections import Counter
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dbt2looker_bigquery.decoding import load_json
 from dbt2looker_bigquery.exceptions import CliError
-from dbt2looker_bigquery.models.dbt import DbtModel
+from dbt2looker_bigquery.models.dbt import DbtModel, replace_column
+from dbt2looker_bigquery.streaming import JsonStreamReader
+
+if TYPE_CHECKING:
+    # config imports the database cache, which imports this module
+    from dbt2looker_bigquery.config import GeneratorConfig
 
 
 def strip_model_name(model_name: str) -> str:
@@ -17,7 +39,68 @@ def strip_model_name(model_name: str) -> str:
     return model_name
 
 
+def write_atomic(file_path: str, contents: Union[str, bytes]):
+    """Write a file through a temporary file and a rename
+
+    Readers see either the old or the new contents, never a partly written file.
+    A replaced file keeps its permissions, a new one gets those open() would give it.
+    Bytes are written as is, text as UTF-8 without translating newlines.
+    """
+    directory, name = os.path.split(file_path)
+    temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+    # the umask applies to the mode, like it does for open()
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        if isinstance(contents, bytes):
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        with f:
+            f.write(contents)
+        try:
+            shutil.copymode(file_path, temp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def evict_least_recently_used(directory: str, suffix: str, max_entries: int) -> int:
+    """Remove the files with a suffix beyond max_entries, least recently modified first
+
+    Caches touch their entries when they are used, so the modification time tracks use.
+
+    Returns:
+        The number of files removed
+    """
+    with os.scandir(directory) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in it
+            if entry.name.endswith(suffix)
+        ]
+
+    excess = max(len(entries) - max_entries, 0)
+    for _, path in sorted(entries)[:excess]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    return excess
+
+
 class FileHandler:
+    def __init__(self, decoder: Optional[str] = None):
+        """
+        Args:
+            decoder: Name of the JSON decoder to read with, the fastest installed if None
+        """
+        self.decoder = decoder
+        # number of files written, left unchanged and removed
+        self.counts = Counter()
+
     def read(self, file_path: str, is_json=True) -> dict:
         """Load file from disk. Default is to load as a JSON file
 
@@ -28,8 +111,11 @@ class FileHandler:
             Dictionary containing the JSON data OR raw contents
         """
         try:
-            with open(file_path, "r") as f:
-                raw_file = json.load(f) if is_json else f.read()
+            if is_json:
+                raw_file = load_json(file_path, self.decoder)
+            else:
+                with open(file_path, "r") as f:
+                    raw_file = f.read()
         except FileNotFoundError as e:
             logging.error(
                 f"Could not find file at {file_path}. Use --target-dir to change the search path for the manifest.json file."
@@ -38,24 +124,92 @@ class FileHandler:
 
         return raw_file
 
-    def write(self, file_path: str, contents: str):
-        """Write contents to a file
+    def stream(
+        self,
+        file_path: str,
+        streamed: Iterable[str] = (),
+        loaded: Iterable[str] = (),
+        keys: Optional[Container[str]] = None,
+    ) -> Iterator[Tuple[str, Optional[str], Any]]:
+        """Iterate over sections of a JSON file without loading the whole file
 
         Args:
-            file_path (str): _description_
-            contents (str): _description_
+            file_path: Path to the file
+            streamed: Top level objects to yield one member at a time
+            loaded: Top level sections to yield as a whole
+            keys: Only yield the members of streamed objects with these keys
+
+        Returns:
+            Iterator of (section, key, value) tuples, key is None for loaded sections
+        """
+        try:
+            yield from JsonStreamReader(file_path).iter_sections(streamed, loaded, keys)
+        except FileNotFoundError as e:
+            logging.error(
+                f"Could not find file at {file_path}. Use --target-dir to change the search path for the manifest.json file."
+            )
+            raise CliError("File not found") from e
+
+    def _is_unchanged(self, file_path: str, contents: str) -> bool:
+        """Check if a file already holds exactly these contents"""
+        try:
+            # a size mismatch avoids reading files that have obviously changed
+            if os.path.getsize(file_path) != len(contents.encode("utf-8")):
+                return False
+            # read back the way write_atomic writes text
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                return f.read() == contents
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    def write(self, file_path: str, contents: str) -> bool:
+        """Write contents to a file atomically, unless it already holds the same contents
+
+        Leaving identical files untouched keeps their modification time, so tools
+        that watch the output only see the views that actually changed.
+
+        Args:
+            file_path (str): Path to the file
+            contents (str): Contents to write
+
+        Returns:
+            True if the file was written, False if it was unchanged
 
         Raises:
-            CLIError: _description_
+            CLIError: If the file could not be written
         """
+        if self._is_unchanged(file_path, contents):
+            self.counts["unchanged"] += 1
+            return False
+
         try:
-            with open(file_path, "w") as f:
-                f.truncate()  # Clear file to allow overwriting
-                f.write(contents)
+            write_atomic(file_path, contents)
         except Exception as e:
             logging.error(f"Could not write file at {file_path}.")
             raise CliError("Could not write file") from e
 
+        self.counts["written"] += 1
+        return True
+
+    def remove(self, file_path: str):
+        """Remove a file, if it exists
+
+        Args:
+            file_path (str): Path to the file
+
+        Raises:
+            CLIError: If the file could not be removed
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.error(f"Could not remove file at {file_path}.")
+            raise CliError("Could not remove file") from e
+
+        self.counts["removed"] += 1
+
 
 class Sql:
     def validate_sql(self, sql: str) -> str:
@@ -137,84 +291,66 @@ class DotManipulation:
 class StructureGenerator:
     """Split columns into groups for views and joins"""
 
-    def __init__(self, args):
-        self._cli_args = args
+    def __init__(self, config: Optional["GeneratorConfig"]):
+        self._config = config
 
-    def _find_levels(self, model: DbtModel) -> dict:
-        """
-        Return group keys for the model columns by detecting array columns
-        and grouping them in the correct depth level
-        """
-        grouped_data = {(0, ""): []}
+    @staticmethod
+    def _group_key(path: str) -> Tuple[int, str]:
+        """Return the group key of a column path, a tuple of its depth and the path"""
+        return (path.count(".") + 1 if path else 0, path)
 
-        for column in model.columns.values():
-            depth = column.name.count(".") + 1
-            prepath = column.name
+    def process_model(self, model: DbtModel) -> Mapping[Tuple[int, str], tuple]:
+        """analyze the model to group columns for views and joins
 
-            key = (depth, prepath)
+        Every array column starts a group, and every column belongs to the group of
+        its nearest array ancestor, or the root group (0, ""). An array column itself
+        belongs to the group above it, and an array of a single type is also added
+        to its own group as the inner array representation.
 
-            if column.data_type == "ARRAY":
-                if key not in grouped_data:
-                    grouped_data[key] = []
-
-        return grouped_data
-
-    def _find_permutations(self, column_name: str) -> list:
-        """Return a sorted list of permutation keys for a column name
-        a permutation key is a tuple with the depth level and the column name
-        for example:
-        column_name = "a.b.c"
-        permutations = [
-            (3, "a.b.c"),
-            (2, "a.b"),
-            (1, "a"),
-            (0, "")
-        ]
+        The grouping is computed in a single pass over the columns. The nearest array
+        ancestor of each path is looked up by walking to its parent path, and cached
+        so every path is only resolved once.
+
+        Returns:
+            A read-only mapping of group keys to tuples of columns
         """
-        keys = []
-        path_parts = column_name.split(".")
-        permutations = [
-            ".".join(path_parts[: i + 1]) for i in range(len(path_parts) - 1, -1, -1)
-        ]
-        permutations.append("")
-        for perm in permutations:
-            if perm == "":
-                current_depth = 0
-            else:
-                current_depth = perm.count(".") + 1
-            key = (current_depth, perm)
-            keys.append(key)
-
-        sorted_keys = sorted(keys, key=lambda x: x[0], reverse=True)
-        return sorted_keys
-
-    def process_model(self, model: DbtModel):
-        """analyze the model to group columns for views and joins"""
-
-        grouped_data = self._find_levels(model)
-
-        for column in model.columns.values():
-            permutations = self._find_permutations(column.name)
-
-            matched = False
-            if permutations:
-                for permutation_key in permutations:
-                    if not matched and permutation_key in grouped_data.keys():
-                        matched = True
-                        # Add arrays as columns in two depth levels
-                        if column.data_type == "ARRAY":
-                            if permutation_key[1] == column.name:
-                                matched = False
-
-                                if len(column.inner_types) == 1:
-                                    column_copy = column.model_copy()
-                                    column_copy.is_inner_array_representation = True
-                                    column_copy.data_type = column.inner_types[0]
-                                    grouped_data[permutation_key].append(column_copy)
-
-                        if matched:
-                            grouped_data[permutation_key].append(column)
-
-            if not matched:
-                raise Exception(f"Could not find a match for column {column.name}")
-        return grouped_data
+        columns = list(model.columns.values())
+        groups: Dict[str, list] = {"": []}
+        for column in columns:
+            if column.data_type == "ARRAY":
+                groups.setdefault(column.name, [])
+
+        # nearest path at or above a path that starts a group
+        nearest_group: Dict[str, str] = {"": ""}
+
+        def find_group(path: str) -> str:
+            unresolved = []
+            while path not in nearest_group:
+                if path in groups:
+                    nearest_group[path] = path
+                    break
+                unresolved.append(path)
+                path = path[: max(path.rfind("."), 0)]
+            group = nearest_group[path]
+            for path in unresolved:
+                nearest_group[path] = group
+            return group
+
+        for column in columns:
+            name = column.name
+            if column.data_type == "ARRAY":
+                # Add arrays as columns in two depth levels
+                if len(column.inner_types) == 1:
+                    groups[name].append(
+                        replace_column(
+                            column,
+                            is_inner_array_representation=True,
+                            data_type=column.inner_types[0],
+                        )
+                    )
+                name = name[: max(name.rfind("."), 0)]
+            groups[find_group(name)].append(column)
+
+        return MappingProxyType(
+            {self._group_key(path): tuple(group) for path, group in groups.items()}
+        )
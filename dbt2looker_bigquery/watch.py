@@ -0,0 +1,63 @@
+"""Watch the dbt artifacts and regenerate views when they change."""
+
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+DEFAULT_INTERVAL = 0.5
+
+# size and modification time of a file, None while it does not exist
+Signature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: str) -> Signature:
+    """Size and modification time of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class ArtifactWatcher:
+    """Poll files for changes, without any dependencies beyond the standard library.
+
+    dbt rewrites manifest.json and catalog.json one after the other, so a change is
+    only reported once none of the files changed for a whole polling interval.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        interval: float = DEFAULT_INTERVAL,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._paths = list(paths)
+        self._interval = interval
+        self._sleep = sleep
+        self._signatures = self._poll()
+
+    def _poll(self) -> Dict[str, Signature]:
+        return {path: file_signature(path) for path in self._paths}
+
+    def changed(self) -> bool:
+        """Check the files once, returning True if any changed since the last check."""
+        signatures = self._poll()
+        changed = signatures != self._signatures
+        self._signatures = signatures
+        return changed
+
+    def wait(self) -> Dict[str, Signature]:
+        """Block until the files changed and settled, returning their new signatures."""
+        while not self.changed():
+            self._sleep(self._interval)
+        # wait for the writer to finish
+        self._sleep(self._interval)
+        while self.changed():
+            self._sleep(self._interval)
+
+        for path, signature in self._signatures.items():
+            if signature is None:
+                logging.debug(f"{path} was removed")
+        return self._signatures
@@ -0,0 +1,57 @@
+import json
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from dbt2looker_bigquery import DbtProject, GeneratorConfig, dump_lookml, generate
+from dbt2looker_bigquery.cli import Cli
+
+TARGET_DIR = "tests/fixtures/osmosis2"
+
+
+def _dump(views):
+    return {path: dump_lookml(lookml) for path, lookml in views}
+
+
+def test_generate_matches_cli():
+    cli = Cli()
+    args = cli._init_argparser().parse_args(["--target-dir", TARGET_DIR, "--dry-run"])
+    expected = sorted(view for _, view in cli._generate_views(args, cli.parse(args)))
+
+    views = _dump(generate(f"{TARGET_DIR}/manifest.json", f"{TARGET_DIR}/catalog.json"))
+
+    assert sorted(views.values()) == expected
+    assert "test/tv_data.view.lkml" in views
+
+
+def test_generate_accepts_loaded_artifacts():
+    with open(f"{TARGET_DIR}/manifest.json") as f:
+        manifest = json.load(f)
+    with open(f"{TARGET_DIR}/catalog.json") as f:
+        catalog = json.load(f)
+
+    views = _dump(generate(manifest, catalog, GeneratorConfig(select=["tv_data"])))
+
+    assert list(views) == ["test/tv_data.view.lkml"]
+
+
+def test_project_generates_with_many_configs():
+    project = DbtProject.from_target_dir(TARGET_DIR)
+
+    default = _dump(project.generate())
+    hidden = _dump(project.generate(GeneratorConfig(all_hidden=True, prefix="p")))
+
+    assert default.keys() == hidden.keys()
+    assert all("view: p_" in view for view in hidden.values())
+    # models are shared between configs, generating must not change them
+    assert _dump(project.generate()) == default
+
+
+def test_config_is_frozen_and_mirrors_cli_arguments():
+    args = Cli()._init_argparser().parse_args(["--select", "a", "b", "--all-hidden"])
+
+    config = GeneratorConfig.from_args(args)
+
+    assert config == GeneratorConfig(select=("a", "b"), all_hidden=True)
+    with pytest.raises(FrozenInstanceError):
+        config.all_hidden = False
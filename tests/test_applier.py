@@ -1,11 +1,11 @@
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.generators.utils import MetaAttributeApplier
 from unittest.mock import Mock
 
 
 def test_apply():
     # Test data
-    cli_args = Mock()
-    cli_args.all_hidden = False
+    config = GeneratorConfig(all_hidden=False)
     target_dict = {"name": "1"}
     obj = Mock()
     obj.meta = Mock()
@@ -13,7 +13,7 @@ def test_apply():
     obj.meta.looker.view.hidden = True
     attributes = ["label", "hidden"]
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(cli_args)
+    meta_attribute_applier = MetaAttributeApplier(config)
 
     # Call the method
     meta_attribute_applier.apply_meta_attributes(
@@ -29,8 +29,7 @@ def test_apply():
 
 def test_apply_meta_overwrite():
     # Test data
-    cli_args = Mock()
-    cli_args.all_hidden = False
+    config = GeneratorConfig(all_hidden=False)
     target_dict = {"label": "1"}
     obj = Mock()
     obj.meta = Mock()
@@ -38,7 +37,7 @@ def test_apply_meta_overwrite():
     attributes = ["label"]
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(cli_args)
+    meta_attribute_applier = MetaAttributeApplier(config)
 
     # Call the method
     meta_attribute_applier.apply_meta_attributes(target_dict, obj, attributes, "meta")
@@ -49,14 +48,13 @@ def test_apply_meta_overwrite():
 
 def test_missing_apply_meta_attributes():
     # Test data
-    cli_args = Mock()
-    cli_args.all_hidden = False
+    config = GeneratorConfig(all_hidden=False)
     target_dict = {}
     obj = {"meta": None}
     attributes = ["label"]
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(cli_args)
+    meta_attribute_applier = MetaAttributeApplier(config)
 
     # Call the method
     meta_attribute_applier.apply_meta_attributes(target_dict, obj, attributes, "meta")
@@ -69,8 +67,7 @@ def test_missing_apply_meta_attributes():
 
 def test_apply_meta_attributes():
     # Test data
-    cli_args = Mock()
-    cli_args.all_hidden = False
+    config = GeneratorConfig(all_hidden=False)
     target_dict = {}
     obj = Mock()
     obj.meta = Mock()
@@ -79,7 +76,7 @@ def test_apply_meta_attributes():
     attributes = ["attr1", "attr2"]
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(cli_args)
+    meta_attribute_applier = MetaAttributeApplier(config)
 
     # Call the method
     meta_attribute_applier.apply_meta_attributes(target_dict, obj, attributes, "meta")
@@ -91,8 +88,7 @@ def test_apply_meta_attributes():
 
 def test_apply_meta_attributes_with_all_hidden():
     # Test data
-    cli_args = Mock()
-    cli_args.all_hidden = True
+    config = GeneratorConfig(all_hidden=True)
     target_dict = {}
     obj = Mock()
     obj.meta = Mock()
@@ -100,7 +96,7 @@ def test_apply_meta_attributes_with_all_hidden():
     attributes = ["attr1"]
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(cli_args)
+    meta_attribute_applier = MetaAttributeApplier(config)
 
     # Call the method
     meta_attribute_applier.apply_meta_attributes(target_dict, obj, attributes, "meta")
@@ -118,7 +114,7 @@ def test_get_meta_object():
     path = "meta"
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(Mock())
+    meta_attribute_applier = MetaAttributeApplier(GeneratorConfig())
 
     # Call the method
     result = meta_attribute_applier._get_meta_object(obj, path)
@@ -133,7 +129,7 @@ def test_get_meta_value():
     attr = "attr1"
 
     # Initialize the class
-    meta_attribute_applier = MetaAttributeApplier(Mock())
+    meta_attribute_applier = MetaAttributeApplier(GeneratorConfig())
 
     # Call the method
     result = meta_attribute_applier._get_meta_value(value, attr)
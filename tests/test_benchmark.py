@@ -0,0 +1,65 @@
+import json
+
+from dbt2looker_bigquery.benchmark import (
+    STAGES,
+    SyntheticProject,
+    generate_project,
+    run_benchmark,
+)
+from dbt2looker_bigquery.benchmark.__main__ import main
+from dbt2looker_bigquery.benchmark.decode import TEXT_BASELINE, run_decode_benchmark
+from dbt2looker_bigquery.decoding import available_decoders
+
+
+def test_synthetic_project_shape(tmp_path):
+    project = SyntheticProject(models=4, columns=6, depth=2, struct_ratio=1.0)
+    manifest_path, catalog_path = generate_project(str(tmp_path), project)
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    with open(catalog_path) as f:
+        catalog = json.load(f)
+
+    assert len(manifest["nodes"]) == 4
+    assert manifest["nodes"].keys() == catalog["nodes"].keys()
+    columns = next(iter(catalog["nodes"].values()))["columns"]
+    # every top level column is a record nested two levels deep
+    assert max(name.count(".") for name in columns) == 2
+    assert all(
+        columns[name]["type"].startswith(("STRUCT<", "ARRAY<STRUCT<"))
+        for name in columns
+        if "." not in name
+    )
+
+
+def test_run_benchmark(tmp_path):
+    generate_project(str(tmp_path), SyntheticProject(models=3, columns=5, depth=1))
+
+    result = run_benchmark(str(tmp_path), repeat=2)
+
+    assert result["models"] == 3
+    assert set(result["stages"]) == set(STAGES)
+    assert len(result["runs"]) == 2
+    assert result["total"]["min"] > 0
+    assert result["stages"]["CatalogParser.process_model"]["min"] > 0
+    assert result["lkml_dump"]["mismatches"] == 0
+
+
+def test_run_decode_benchmark(tmp_path):
+    generate_project(str(tmp_path), SyntheticProject(models=3, columns=5, depth=1))
+
+    result = run_decode_benchmark(str(tmp_path), files=["manifest.json"], repeat=1)
+
+    decoders = result["manifest.json"]
+    assert set(decoders) == {*available_decoders(), TEXT_BASELINE}
+    assert all(stats["seconds"] > 0 for stats in decoders.values())
+
+
+def test_benchmark_cli_writes_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--models", "2", "--columns", "3", "--repeat", "1", "--output", str(output)])
+
+    results = json.loads(output.read_text())
+    assert results["project"]["models"] == 2
+    assert results["models"] == 2
+    assert set(results["decode"]) == {"manifest.json", "catalog.json"}
@@ -1,7 +1,7 @@
 from unittest.mock import Mock, call, patch
 
 # Only import from cli.py
-from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.cli import Cli, GeneratorConfig
 
 
 def test_create_parser_default_args():
@@ -83,7 +83,7 @@ def test_cli_parse(mock_file_handler, mock_dbt_parser):
     # Mock file handler
     mock_file_handler_instance = Mock()
     mock_file_handler.return_value = mock_file_handler_instance
-    mock_file_handler_instance.read.side_effect = ["manifest", "catalog"]
+    mock_file_handler_instance.read.side_effect = [{}, "catalog"]
 
     # Mock dbt parser
     mock_parser_instance = Mock()
@@ -99,6 +99,12 @@ def test_cli_parse(mock_file_handler, mock_dbt_parser):
         tag=None,
         select=None,
         build_explore=True,
+        prefilter=False,
+        stream_manifest=False,
+        artifact_index=False,
+        snapshot_cache_dir=None,
+        incremental=False,
+        watch=False,
     )
     result = cli.parse(args)
 
@@ -109,7 +115,9 @@ def test_cli_parse(mock_file_handler, mock_dbt_parser):
 
     # Verify parser calls with correct args
     # mock_dbt_parser.assert_called_once_with("manifest", "catalog")
-    mock_parser_instance.get_models.assert_called_once_with(args)
+    mock_parser_instance.get_models.assert_called_once_with(
+        GeneratorConfig.from_args(args)
+    )
 
     assert result == ["model1", "model2"]
 
@@ -128,12 +136,72 @@ def test_cli_generate_with_args(mock_generator):
     cli = Cli()
 
     # Test with build_explore=True
-    args = Mock(output_dir="output", build_explore=True)
+    args = Mock(
+        output_dir="output", build_explore=True, jobs=1, prune=False, select=None
+    )
     cli.generate(args, [Mock()])
-    mock_generator.assert_called_with(args)
+    mock_generator.assert_called_with(GeneratorConfig.from_args(args))
 
     # Test with build_explore=False
     mock_generator.reset_mock()
-    args = Mock(output_dir="output", build_explore=False)
+    args = Mock(
+        output_dir="output", build_explore=False, jobs=1, prune=False, select=None
+    )
     cli.generate(args, [Mock()])
-    mock_generator.assert_called_with(args)
+    mock_generator.assert_called_with(GeneratorConfig.from_args(args))
+
+
+def _osmosis_args(cli, output_dir, *extra):
+    return cli._init_argparser().parse_args(
+        ["--target-dir", "tests/fixtures/osmosis2", "--output-dir", str(output_dir)]
+        + list(extra)
+    )
+
+
+def test_cli_generate_consumes_models_lazily(tmp_path):
+    """Test that a model is written before the next one is parsed"""
+    cli = Cli()
+    args = _osmosis_args(cli, tmp_path)
+
+    def lazy(models):
+        for i, model in enumerate(models):
+            assert cli._file_handler.counts["written"] == i
+            yield model
+
+    counts = cli.generate(args, lazy(cli.iter_models(args)))
+
+    assert counts["views"] == 2
+    assert counts["written"] == 2
+
+
+def test_cli_generate_lazily_in_pool(tmp_path):
+    cli = Cli()
+    args = _osmosis_args(cli, tmp_path, "--jobs", "2")
+
+    counts = cli.generate(args, cli.iter_models(args))
+
+    assert counts["views"] == 2
+    assert len(list(tmp_path.rglob("*.view.lkml"))) == 2
+
+
+def test_cli_select_reads_selected_catalog_nodes(tmp_path):
+    """Test that only the catalog nodes of selected models are kept"""
+    cli = Cli()
+    args = _osmosis_args(cli, tmp_path, "--select", "tv_data")
+
+    config = GeneratorConfig.from_args(args)
+    parser = cli._load_parser(args, config)
+
+    assert list(parser._catalog.nodes) == ["model.dbt_test_data_gen.tv_data"]
+    assert [model.name for model in parser.iter_models(config)] == ["tv_data"]
+
+
+@patch("dbt2looker_bigquery.cli.logging.warning")
+def test_cli_prefilter_warns(mock_warning, tmp_path):
+    """Test that the deprecated --prefilter flag warns that it has no effect"""
+    cli = Cli()
+    args = _osmosis_args(cli, tmp_path, "--prefilter")
+
+    cli._load_parser(args, GeneratorConfig.from_args(args))
+
+    assert "--prefilter is deprecated" in mock_warning.call_args[0][0]
@@ -0,0 +1,188 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from dbt2looker_bigquery.database.bigquery import BigQueryDatabase
+from dbt2looker_bigquery.database.cache import SchemaCache
+from dbt2looker_bigquery.models.dbt import DbtModel
+from dbt2looker_bigquery.parsers.catalog import CatalogParser
+
+
+class FakeCredentials:
+    def __init__(self):
+        self.valid = False
+        self.token = None
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.valid = True
+        self.token = "token"
+
+
+@pytest.fixture
+def bigquery_server():
+    """A local stand-in for the BigQuery tables.get REST endpoint."""
+    state = SimpleNamespace(
+        requests=[], failures={"flaky": 1}, versions={}, lock=threading.Lock()
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            table_id = self.path.split("?")[0].rsplit("/", 1)[-1]
+            with state.lock:
+                state.requests.append((self.path, self.headers["Authorization"]))
+                failures = state.failures.get(table_id, 0)
+                state.failures[table_id] = failures - 1
+
+            if table_id == "missing":
+                self.send_response(404)
+                self.end_headers()
+                return
+            if failures > 0:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+
+            version = state.versions.get(table_id, 1)
+            if "fields=" in self.path:
+                body = json.dumps(
+                    {"etag": f"etag-{version}", "lastModifiedTime": str(version)}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            body = json.dumps(
+                {
+                    "etag": f"etag-{version}",
+                    "lastModifiedTime": str(version),
+                    "schema": {
+                        "fields": [
+                            {"name": "id", "type": "INTEGER"},
+                            {
+                                "name": "items",
+                                "type": "RECORD",
+                                "mode": "REPEATED",
+                                "fields": [{"name": "sku", "type": "STRING"}],
+                            },
+                        ]
+                        + [{"name": "extra", "type": "DATE"}] * (version > 1)
+                    },
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url_template = (
+        f"http://127.0.0.1:{server.server_port}"
+        "/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+    )
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def database(bigquery_server):
+    return BigQueryDatabase(
+        max_workers=4,
+        backoff=0,
+        url_template=bigquery_server.url_template,
+        credentials=FakeCredentials(),
+    )
+
+
+def test_fetch_schemas_concurrently(bigquery_server, database):
+    tables = [("project", "dataset", f"table_{i}") for i in range(10)]
+    schemas = database.get_dbt_table_schemas(tables + tables[:2])
+
+    assert list(schemas) == tables
+    for schema in schemas.values():
+        assert schema.columns["id"].type == "INTEGER"
+        assert schema.columns["items"].type == "ARRAY<STRUCT<sku STRING>>"
+        assert schema.columns["items.sku"].type == "STRING"
+
+    assert len(bigquery_server.requests) == 10
+    assert {auth for _, auth in bigquery_server.requests} == {"Bearer token"}
+    assert database._credentials.refreshes == 1
+
+
+def test_fetch_retries_and_reports_errors(bigquery_server, database):
+    schemas = database.get_dbt_table_schemas(
+        [("project", "dataset", "flaky"), ("project", "dataset", "missing")]
+    )
+
+    assert "id" in schemas[("project", "dataset", "flaky")].columns
+    assert isinstance(schemas[("project", "dataset", "missing")], requests.HTTPError)
+    assert len(bigquery_server.requests) == 3
+
+
+def test_catalog_parser_reads_prefetched_schemas(bigquery_server, database):
+    model = DbtModel(
+        resource_type="model",
+        name="orders",
+        unique_id="model.test.orders",
+        database="project",
+        relation_name="`project.dataset.orders`",
+        schema="dataset",
+        description="",
+        columns={},
+        meta={},
+        path="orders.sql",
+        tags=[],
+    )
+    parser = CatalogParser(use_database=True, database=database)
+    parser.prefetch([model])
+    assert len(bigquery_server.requests) == 1
+
+    processed = parser.process_model(model)
+    assert len(bigquery_server.requests) == 1
+    assert processed.columns["id"].data_type == "INT64"
+    assert processed.columns["items.sku"].data_type == "STRING"
+
+
+def test_schema_cache(bigquery_server, tmp_path):
+    def database(ttl):
+        return BigQueryDatabase(
+            backoff=0,
+            url_template=bigquery_server.url_template,
+            credentials=FakeCredentials(),
+            cache=SchemaCache(str(tmp_path), ttl=ttl),
+        )
+
+    table = ("project", "dataset", "orders")
+    assert "extra" not in database(ttl=3600).get_dbt_table_schema(*table).columns
+    assert len(bigquery_server.requests) == 1
+
+    # within the ttl the database is not asked at all
+    assert "extra" not in database(ttl=3600).get_dbt_table_schema(*table).columns
+    assert len(bigquery_server.requests) == 1
+
+    # after the ttl an unchanged table only costs a metadata request
+    assert "extra" not in database(ttl=0).get_dbt_table_schema(*table).columns
+    assert len(bigquery_server.requests) == 2
+    assert "fields=" in bigquery_server.requests[-1][0]
+
+    # a changed table is fetched again
+    bigquery_server.versions["orders"] = 2
+    assert "extra" in database(ttl=0).get_dbt_table_schema(*table).columns
+    assert len(bigquery_server.requests) == 4
+    assert "extra" in database(ttl=3600).get_dbt_table_schema(*table).columns
+    assert len(bigquery_server.requests) == 4
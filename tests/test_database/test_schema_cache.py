@@ -0,0 +1,48 @@
+import os
+import time
+
+from dbt2looker_bigquery.database.cache import SchemaCache
+from dbt2looker_bigquery.models.dbt import DbtCatalogNode
+
+
+def _node(column_type="INT64"):
+    return DbtCatalogNode(columns={"ID": {"name": "ID", "type": column_type}})
+
+
+def test_round_trip(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    table = ("my-project", "dataset", "table")
+    assert cache.get(table) is None
+
+    cache.put(table, _node(), "etag", "123")
+    entry = cache.get(table)
+    assert entry.node.columns["id"].type == "INT64"
+    assert (entry.etag, entry.last_modified) == ("etag", "123")
+    assert cache.is_fresh(entry)
+    assert not SchemaCache(str(tmp_path), ttl=0).is_fresh(entry)
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    table = ("project", "dataset", "table")
+    cache.put(table, _node(), None, None)
+    (path,) = tmp_path.iterdir()
+    path.write_text("{not json")
+    assert cache.get(table) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = SchemaCache(str(tmp_path), max_entries=2)
+    tables = [("project", "dataset", f"table_{i}") for i in range(3)]
+    for i, table in enumerate(tables):
+        cache.put(table, _node(), None, None)
+        path = cache._path(table)
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    # reading the oldest entry makes it the most recently used
+    assert cache.get(tables[0]) is not None
+    cache.evict()
+
+    assert cache.get(tables[1]) is None
+    assert cache.get(tables[0]) is not None
+    assert cache.get(tables[2]) is not None
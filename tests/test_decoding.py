@@ -0,0 +1,55 @@
+import gc
+import json
+
+import pytest
+
+from dbt2looker_bigquery.decoding import (
+    STDLIB_DECODER,
+    available_decoders,
+    default_decoder,
+    load_json,
+)
+
+MANIFEST_PATH = "tests/fixtures/osmosis2/manifest.json"
+
+
+@pytest.mark.parametrize("decoder", available_decoders())
+def test_decoders_match_json(decoder):
+    with open(MANIFEST_PATH) as f:
+        expected = json.load(f)
+
+    assert load_json(MANIFEST_PATH, decoder) == expected
+
+
+@pytest.mark.parametrize("decoder", available_decoders())
+def test_documents_only_json_accepts_are_decoded(decoder, tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"value": NaN, "big": 123456789012345678901234567890}')
+
+    document = load_json(str(path), decoder)
+
+    assert document["big"] == 123456789012345678901234567890
+    assert document["value"] != document["value"]
+
+
+@pytest.mark.parametrize("decoder", available_decoders())
+def test_invalid_and_empty_files_raise(decoder, tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"nodes": ')
+    with pytest.raises(ValueError):
+        load_json(str(path), decoder)
+
+    path.write_text("")
+    with pytest.raises(ValueError):
+        load_json(str(path), decoder)
+    assert gc.isenabled()
+
+
+def test_unknown_decoder():
+    with pytest.raises(KeyError):
+        load_json(MANIFEST_PATH, "no-such-decoder")
+
+
+def test_stdlib_is_always_available():
+    assert available_decoders()[-1] == STDLIB_DECODER
+    assert default_decoder() in available_decoders()
@@ -0,0 +1,101 @@
+import copy
+import io
+
+import lkml
+import pytest
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.generators import LookmlGenerator
+from dbt2looker_bigquery.generators.emitter import dump_lookml
+
+SHAPES = [
+    {
+        "explore": {
+            "name": "orders",
+            "label": 'Orders "all"',
+            "hidden": "yes",
+            "joins": [
+                {
+                    "name": "orders__items",
+                    "view_label": "Orders: Items",
+                    "sql": "LEFT JOIN UNNEST(${orders.items}) AS orders__items",
+                    "relationship": "one_to_many",
+                    "required_joins": ["a", "b"],
+                },
+            ],
+        },
+        "views": [
+            {
+                "name": "orders",
+                "sql_table_name": "`project.dataset.orders`  ",
+                "dimensions": [
+                    {
+                        "name": "id",
+                        "type": "string",
+                        "sql": "${TABLE}.id",
+                        "primary_key": "yes",
+                        "tags": ["a", "b", "c", "d", "e"],
+                    },
+                    {"name": "empty"},
+                ],
+                "dimension_groups": [
+                    {
+                        "name": "created",
+                        "type": "time",
+                        "timeframes": ["raw", "time", "date", "week", "month"],
+                        "datatype": "timestamp",
+                    }
+                ],
+                "measures": [
+                    {
+                        "name": "total",
+                        "type": "sum",
+                        "filters": [{"status": "complete"}, {"field": "yes"}],
+                    }
+                ],
+                "sets": [{"name": "s_orders", "fields": []}],
+            },
+            {"name": "orders__items", "dimensions": []},
+        ],
+    },
+    {"view": {"name": "legacy", "filters": [{"name": "f", "type": "string"}]}},
+    {"explore": {"name": "e", "suggestions": ["a"], "always_filter": {}}},
+]
+
+
+@pytest.mark.parametrize("lookml", SHAPES)
+def test_same_output_as_lkml_dump(lookml):
+    # lkml.dump pops the names of filters from its input
+    expected = lkml.dump(copy.deepcopy(lookml))
+    contents = dump_lookml(lookml)
+
+    assert contents == expected
+    assert dump_lookml(lkml.load(contents)) == contents
+
+
+def test_dump_to_file_object():
+    buffer = io.StringIO()
+    assert dump_lookml(SHAPES[0], buffer) is None
+    assert buffer.getvalue() == lkml.dump(SHAPES[0])
+
+
+def test_invalid_value():
+    with pytest.raises(TypeError):
+        dump_lookml({"view": {"name": "v", "hidden": True}})
+
+
+@pytest.mark.parametrize(
+    "fixture", ["tests/fixtures/osmosis2", "tests/fixtures/labelled"]
+)
+def test_generated_views_round_trip(fixture):
+    cli = Cli()
+    args = cli._init_argparser().parse_args(["--target-dir", fixture, "--dry-run"])
+    generator = LookmlGenerator(args)
+    models = cli.parse(args)
+    assert models
+
+    for model in models:
+        _, lookml = generator.generate(model)
+        contents = dump_lookml(lookml)
+        assert contents == lkml.dump(lookml)
+        assert dump_lookml(lkml.load(contents)) == contents
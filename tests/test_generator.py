@@ -1,9 +1,10 @@
 """Test LookML Generator implementations."""
 
-from argparse import Namespace
+from types import MappingProxyType
 
 import pytest
 
+from dbt2looker_bigquery.config import GeneratorConfig
 from dbt2looker_bigquery.enums import (
     LookerDateTimeframes,
     LookerMeasureType,
@@ -14,7 +15,11 @@ from dbt2looker_bigquery.generators import LookmlGenerator
 from dbt2looker_bigquery.generators.dimension import LookmlDimensionGenerator
 from dbt2looker_bigquery.generators.measure import LookmlMeasureGenerator
 from dbt2looker_bigquery.generators.view import LookmlViewGenerator
-from dbt2looker_bigquery.generators.utils import map_bigquery_to_looker
+from dbt2looker_bigquery.generators.utils import (
+    ColumnClassification,
+    classify_data_type,
+    map_bigquery_to_looker,
+)
 from dbt2looker_bigquery.models.dbt import (
     DbtModel,
     DbtModelColumn,
@@ -29,13 +34,13 @@ from dbt2looker_bigquery.models.looker import (
     DbtMetaLooker,
     DbtMetaLookerBase,
 )
-from dbt2looker_bigquery.utils import Sql
+from dbt2looker_bigquery.utils import Sql, StructureGenerator
 
 
 @pytest.fixture
 def cli_args():
-    """Fixture for CLI arguments."""
-    return Namespace(
+    """Fixture for the generator config."""
+    return GeneratorConfig(
         use_table_name=False,
         build_explore=False,
         all_hidden=False,
@@ -83,6 +88,24 @@ def test_map_bigquery_to_looker(bigquery_type, expected_looker_type):
     assert map_bigquery_to_looker(bigquery_type) == expected_looker_type
 
 
+@pytest.mark.parametrize(
+    "bigquery_type,expected_classification",
+    [
+        ("INT64", ColumnClassification("number", "scalar", True, False, False)),
+        ("DATE", ColumnClassification("date", "date", False, False, False)),
+        ("TIMESTAMP", ColumnClassification("timestamp", "time", False, False, False)),
+        ("ARRAY", ColumnClassification("string", "scalar", True, True, False)),
+        ("STRUCT", ColumnClassification("string", "scalar", True, False, True)),
+        ("INTERVAL", ColumnClassification(None, "scalar", False, False, False)),
+        (None, ColumnClassification(None, "scalar", False, False, False)),
+    ],
+)
+def test_classify_data_type(bigquery_type, expected_classification):
+    """Test classification of BigQuery types"""
+    assert classify_data_type(bigquery_type) == expected_classification
+    assert classify_data_type(bigquery_type) is classify_data_type(bigquery_type)
+
+
 def test_dimension_group_time(cli_args):
     """Test creation of time-based dimension groups"""
 
@@ -122,10 +145,7 @@ def test_dimension(cli_args):
     )
 
     dimension_generator = LookmlDimensionGenerator(cli_args)
-    result = dimension_generator.lookml_dimensions_from_model([column], True)
-    import logging
-
-    logging.warning(result)
+    result = dimension_generator.lookml_fields_from_model([column], True)["dimensions"]
     assert isinstance(result[0], dict)
     assert result[0].get("type") == "string"
     assert result[0].get("html") == "<img src={{ value }}>"
@@ -167,6 +187,71 @@ def test_dimension_group_date(cli_args):
     )
 
 
+def test_lookml_fields_from_model(cli_args):
+    """Test that one pass builds dimensions and dimension groups"""
+    dimension_generator = LookmlDimensionGenerator(cli_args)
+    columns = [
+        DbtModelColumn(
+            name="id",
+            data_type="STRING",
+            unique_id="test_model.id",
+            meta=DbtModelColumnMeta(),
+        ),
+        DbtModelColumn(
+            name="created_date",
+            data_type="DATE",
+            unique_id="test_model.created_date",
+            meta=DbtModelColumnMeta(
+                looker=DbtMetaColumnLooker(
+                    dimension=DbtMetaLookerDimension(hidden=True)
+                )
+            ),
+        ),
+        DbtModelColumn(
+            name="updated_at",
+            data_type="TIMESTAMP",
+            unique_id="test_model.updated_at",
+            meta=DbtModelColumnMeta(),
+        ),
+    ]
+
+    fields = dimension_generator.lookml_fields_from_model(columns, True)
+
+    assert [dimension["name"] for dimension in fields["dimensions"]] == ["id"]
+    created, updated = fields["dimension_groups"]
+    assert created["name"] == "created"
+    assert created["convert_tz"] == "no"
+    assert created["hidden"] == "yes"
+    assert updated["name"] == "updated_at"
+    assert updated["convert_tz"] == "yes"
+    assert [group_set["name"] for group_set in fields["dimension_group_sets"]] == [
+        "s_created",
+        "s_updated_at",
+    ]
+    # the iso dimensions of the date column are kept apart from the regular ones
+    assert [
+        dimension["name"] for dimension in fields["dimension_group_dimensions"]
+    ] == ["created_iso_year", "created_iso_week_of_year"]
+
+
+def test_lookml_fields_from_model_without_dimension_groups(cli_args):
+    """Test that models without date or time columns have no dimension groups"""
+    dimension_generator = LookmlDimensionGenerator(cli_args)
+    column = DbtModelColumn(
+        name="id",
+        data_type="INT64",
+        unique_id="test_model.id",
+        meta=DbtModelColumnMeta(),
+    )
+
+    fields = dimension_generator.lookml_fields_from_model([column], True)
+
+    assert len(fields["dimensions"]) == 1
+    assert fields["dimension_groups"] is None
+    assert fields["dimension_group_sets"] is None
+    assert fields["dimension_group_dimensions"] is None
+
+
 def test_lookml_dimensions_with_metadata(cli_args):
     """Test dimension generation with various metadata options"""
     dimension_generator = LookmlDimensionGenerator(cli_args)
@@ -213,9 +298,9 @@ def test_lookml_dimensions_with_metadata(cli_args):
         tags=[],
     )
 
-    dimensions = dimension_generator.lookml_dimensions_from_model(
+    dimensions = dimension_generator.lookml_fields_from_model(
         model.columns.values(), True
-    )
+    )["dimensions"]
     assert len(dimensions) == 1
     dimension = dimensions[0]
     assert dimension["name"] == "string_col"
@@ -458,9 +543,9 @@ def test_legacy_lookml_dimension(cli_args):
         tags=[],
     )
 
-    dimensions = dimension_generator.lookml_dimensions_from_model(
+    dimensions = dimension_generator.lookml_fields_from_model(
         model.columns.values(), True
-    )
+    )["dimensions"]
     assert len(dimensions) == 1
     dimension = dimensions[0]
     assert dimension["name"] == "string_col"
@@ -690,7 +775,7 @@ def naming_model():
 
 def test_writer_bigquery(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="BIGQUERY_DATASET",
         remove_prefix_from_dataset="",
         use_table_name=False,
@@ -705,7 +790,7 @@ def test_writer_bigquery(naming_model):
 
 def test_writer_dbt_folder(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="DBT_FOLDER",
         remove_prefix_from_dataset="",
         use_table_name=False,
@@ -717,7 +802,7 @@ def test_writer_dbt_folder(naming_model):
 
 def test_writer_dbt_folder_remove_prefix(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="DBT_FOLDER",
         remove_prefix_from_dataset="mod",
         use_table_name=False,
@@ -729,7 +814,7 @@ def test_writer_dbt_folder_remove_prefix(naming_model):
 
 def test_writer_bigquery_remove_prefix(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="BIGQUERY_DATASET",
         remove_prefix_from_dataset="dbt_grognerud_",
         use_table_name=False,
@@ -744,7 +829,7 @@ def test_writer_bigquery_remove_prefix(naming_model):
 
 def test_writer_bigquery_use_table_name(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="BIGQUERY_DATASET",
         remove_prefix_from_dataset="",
         use_table_name=True,
@@ -759,7 +844,7 @@ def test_writer_bigquery_use_table_name(naming_model):
 
 def test_writer_dbt_folder_use_table_name(naming_model):
     """Test writing paths"""
-    cli_args = Namespace(
+    cli_args = GeneratorConfig(
         folder_structure="DBT_FOLDER",
         remove_prefix_from_dataset="",
         use_table_name=True,
@@ -767,3 +852,44 @@ def test_writer_dbt_folder_use_table_name(naming_model):
 
     generator = LookmlGenerator(cli_args)
     assert "models/relation_name.view.lkml" == generator._get_file_path(naming_model)
+
+
+def test_structure_generator_groups_by_nearest_array():
+    # data type and inner types as the catalog parser sets them
+    column_types = {
+        "id": ("STRING", []),
+        "tags": ("ARRAY", ["STRING"]),
+        "items": ("ARRAY", ["sku STRING", "parts ARRAY"]),
+        "items.sku": ("STRING", []),
+        "items.parts": ("ARRAY", ["code STRING"]),
+        "items.parts.code": ("STRING", []),
+        "info": ("STRUCT", ["source STRING"]),
+        "info.source": ("STRING", []),
+    }
+    model = DbtModel(
+        name="test_model",
+        path="models/test_model.sql",
+        relation_name="`project.dataset.table_name`",
+        columns={
+            name: DbtModelColumn(name=name, data_type=data_type, inner_types=inner)
+            for name, (data_type, inner) in column_types.items()
+        },
+        meta=DbtModelMeta(),
+        unique_id="test_model",
+        resource_type="model",
+        schema="test_schema",
+        description="Test model",
+        tags=[],
+    )
+
+    grouped = StructureGenerator(None).process_model(model)
+
+    assert isinstance(grouped, MappingProxyType)
+    assert {key: [c.name for c in group] for key, group in grouped.items()} == {
+        (0, ""): ["id", "tags", "items", "info", "info.source"],
+        (1, "tags"): ["tags"],
+        (1, "items"): ["items.sku", "items.parts"],
+        (2, "items.parts"): ["items.parts", "items.parts.code"],
+    }
+    assert grouped[(1, "tags")][0].is_inner_array_representation
+    assert grouped[(1, "tags")][0].data_type == "STRING"
@@ -0,0 +1,54 @@
+import json
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.incremental import STATE_FILE_NAME
+
+
+def _run(tmp_path, *extra):
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        [
+            "--target-dir",
+            "tests/fixtures/osmosis2",
+            "--output-dir",
+            str(tmp_path),
+            "--incremental",
+            *extra,
+        ]
+    )
+    models = cli.parse(args)
+    cli.generate(args, models)
+    return models
+
+
+def test_second_run_skips_unchanged_models(tmp_path):
+    assert len(_run(tmp_path)) == 2
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text())
+    assert len(state["models"]) == 2
+
+    assert _run(tmp_path) == []
+
+
+def test_changed_flags_regenerate_all_models(tmp_path):
+    _run(tmp_path)
+    assert len(_run(tmp_path, "--all-hidden")) == 2
+    assert _run(tmp_path, "--all-hidden") == []
+
+
+def test_deleted_view_is_regenerated(tmp_path):
+    _run(tmp_path)
+    view = next(tmp_path.rglob("*.view.lkml"))
+    view.unlink()
+
+    assert len(_run(tmp_path)) == 1
+    assert view.exists()
+
+
+def test_streamed_selection_keeps_the_state_of_other_models(tmp_path):
+    _run(tmp_path)
+
+    assert len(_run(tmp_path, "--stream-manifest", "--select", "tv_data")) == 0
+    state = json.loads((tmp_path / STATE_FILE_NAME).read_text())
+    assert len(state["models"]) == 2
+
+    assert _run(tmp_path) == []
@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.index import ArtifactIndex, index_path
+
+TARGET_DIR = "tests/fixtures/osmosis2"
+
+
+@pytest.fixture
+def target_dir(tmp_path):
+    target = tmp_path / "target"
+    shutil.copytree(TARGET_DIR, target)
+    return target
+
+
+def _views(target_dir, output_dir, *extra):
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        ["--target-dir", str(target_dir), "--output-dir", str(output_dir), *extra]
+    )
+    cli.generate(args, cli.parse(args))
+    return {
+        os.path.relpath(path, output_dir): path.read_text()
+        for path in output_dir.rglob("*.view.lkml")
+    }
+
+
+@pytest.mark.parametrize("select", [["--select", "tv_data"], []])
+def test_indexed_run_matches_full_read(target_dir, tmp_path, select):
+    expected = _views(target_dir, tmp_path / "full", *select)
+
+    views = _views(target_dir, tmp_path / "indexed", "--artifact-index", *select)
+
+    assert views == expected
+    assert os.path.exists(index_path(str(target_dir / "manifest.json")))
+
+
+def test_nodes_are_decoded_from_their_byte_range(target_dir):
+    manifest_path = str(target_dir / "manifest.json")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    unique_id = next(iter(ArtifactIndex(manifest_path).models))
+
+    index = ArtifactIndex(manifest_path)
+
+    assert index.read_nodes([unique_id, "model.missing"]) == {
+        unique_id: manifest["nodes"][unique_id]
+    }
+    assert index.read_section("metadata") == manifest["metadata"]
+    assert index.models[unique_id]["name"] == manifest["nodes"][unique_id]["name"]
+
+
+def test_index_is_rebuilt_when_the_artifact_changes(target_dir):
+    manifest_path = target_dir / "manifest.json"
+    index = ArtifactIndex(str(manifest_path))
+    unique_id = next(iter(index.models))
+    stored = index_path(str(manifest_path))
+
+    # the same contents with a new modification time keep the index
+    os.utime(manifest_path, ns=(0, 0))
+    ArtifactIndex(str(manifest_path))
+    with open(stored) as f:
+        assert json.load(f)["signature"]["mtime_ns"] == 0
+
+    manifest = json.loads(manifest_path.read_text())
+    manifest["nodes"][unique_id]["name"] = "renamed"
+    manifest_path.write_text(json.dumps(manifest, indent=4))
+
+    assert ArtifactIndex(str(manifest_path)).models[unique_id]["name"] == "renamed"
+
+
+def test_stale_index_is_rebuilt_while_reading(target_dir):
+    manifest_path = target_dir / "manifest.json"
+    index = ArtifactIndex(str(manifest_path))
+    unique_id = next(iter(index.models))
+
+    # rewritten with the same size behind the back of the open index
+    manifest_path.write_text(" " + manifest_path.read_text().rstrip())
+
+    assert index.read_nodes([unique_id])[unique_id]["unique_id"] == unique_id
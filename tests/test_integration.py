@@ -861,6 +861,31 @@ class TestIntegration:
 
         self._spin_down()
 
+    def test_jobs_output_matches_serial(self, tmp_path):
+        cli = Cli()
+        parser = cli._init_argparser()
+        outputs = {}
+        for jobs in ["1", "2"]:
+            output_dir = tmp_path / jobs
+            args = parser.parse_args(
+                [
+                    "--target-dir",
+                    "tests/fixtures/osmosis2",
+                    "--output-dir",
+                    str(output_dir),
+                    "--jobs",
+                    jobs,
+                ]
+            )
+            cli.generate(args, cli.parse(args))
+            outputs[jobs] = {
+                path.relative_to(output_dir): path.read_bytes()
+                for path in output_dir.rglob("*.view.lkml")
+            }
+
+        assert len(outputs["1"]) == 2
+        assert outputs["1"] == outputs["2"]
+
     def _spin_up(self, cli, args, file_path):
         models = cli.parse(args)
         cli.generate(args, models)
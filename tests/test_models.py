@@ -8,12 +8,15 @@ from dbt2looker_bigquery.models.dbt import (
     DbtModelColumnMeta,
     DbtModelMeta,
     DbtExposure,
+    DbtLazyManifest,
+    DbtNode,
 )
 from dbt2looker_bigquery.models.looker import (
     DbtMetaLooker,
     DbtMetaColumnLooker,
     DbtMetaLookerBase,
 )
+from dbt2looker_bigquery.parsers.model import ModelParser
 
 
 class TestCaseBuilder:
@@ -405,3 +408,55 @@ class TestDbtExposure:
         # Fix the assertion for tags: you expect a list from exposure.tags, not just the length
         assert exposure.tags == node.get("tags", [])
         assert exposure.resource_type == "exposure"
+
+
+class TestDbtLazyManifest:
+    @pytest.fixture
+    def raw_manifest(self):
+        return {
+            "metadata": {"adapter_type": "bigquery"},
+            "nodes": {
+                "model.test.model1": {
+                    "resource_type": "model",
+                    "relation_name": "base.model1",
+                    "schema": "my_schema",
+                    "name": "model1",
+                    "unique_id": "model.test.model1",
+                    "tags": [],
+                    "path": "models/model1.sql",
+                    "description": "",
+                    "meta": {},
+                    "columns": {"ID": {"name": "ID"}},
+                },
+                "model.test.ephemeral": {
+                    "resource_type": "model",
+                    "relation_name": None,
+                    "name": "ephemeral",
+                    "unique_id": "model.test.ephemeral",
+                },
+                # missing fields would fail validation if the node was ever validated
+                "test.test.not_null": {"resource_type": "test"},
+            },
+            "exposures": {},
+            "macros": {},
+        }
+
+    def test_models_are_validated_on_access(self, raw_manifest):
+        manifest = DbtLazyManifest(**raw_manifest)
+        model = manifest.nodes["model.test.model1"]
+        assert isinstance(model, DbtModel)
+        assert "id" in model.columns
+        assert manifest.nodes["model.test.model1"] is model
+
+    def test_invalid_models_fall_back_to_nodes(self, raw_manifest):
+        manifest = DbtLazyManifest(**raw_manifest)
+        node = manifest.nodes["model.test.ephemeral"]
+        assert isinstance(node, DbtNode)
+        assert not isinstance(node, DbtModel)
+
+    def test_other_nodes_are_not_validated(self, raw_manifest):
+        manifest = DbtLazyManifest(**raw_manifest)
+        models = ModelParser(manifest).get_models(["model.test.model1"])
+        assert [node.name for node in models] == ["model1"]
+        assert len(manifest.nodes) == 3
+        assert manifest.nodes.raw("test.test.not_null") == {"resource_type": "test"}
@@ -0,0 +1,74 @@
+import json
+
+from dbt2looker_bigquery.output import MANAGED_FILES_NAME, OutputWriter
+from dbt2looker_bigquery.utils import FileHandler
+
+
+def _write_run(output_dir, views, model_ids=None, file_handler=None):
+    writer = OutputWriter(str(output_dir), file_handler)
+    written = {
+        unique_id: writer.write(path, f"view: {unique_id} {{}}")
+        for unique_id, path in views.items()
+    }
+    writer.prune(written, model_ids)
+    return written
+
+
+def test_write_creates_directories(tmp_path):
+    written = _write_run(tmp_path, {"model.a": "folder/a.view.lkml"})
+
+    assert (tmp_path / "folder" / "a.view.lkml").read_text() == "view: model.a {}"
+    assert written["model.a"] == f"{tmp_path}/folder/a.view.lkml"
+    managed = json.loads((tmp_path / MANAGED_FILES_NAME).read_text())
+    assert managed["files"] == {"folder/a.view.lkml": "model.a"}
+
+
+def test_write_leaves_no_temporary_files(tmp_path):
+    _write_run(tmp_path, {"model.a": "a.view.lkml"})
+    _write_run(tmp_path, {"model.a": "a.view.lkml"})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        MANAGED_FILES_NAME,
+        "a.view.lkml",
+    ]
+
+
+def test_prune_removes_deleted_and_moved_models(tmp_path):
+    _write_run(
+        tmp_path,
+        {
+            "model.a": "old/a.view.lkml",
+            "model.b": "b.view.lkml",
+            "model.c": "c.view.lkml",
+        },
+    )
+    (tmp_path / "unmanaged.view.lkml").write_text("view: unmanaged {}")
+
+    file_handler = FileHandler()
+    _write_run(
+        tmp_path,
+        {"model.a": "new/a.view.lkml"},
+        model_ids=["model.a", "model.c"],
+        file_handler=file_handler,
+    )
+
+    # b was deleted, a moved, c was not generated but still exists
+    assert not (tmp_path / "old").exists()
+    assert not (tmp_path / "b.view.lkml").exists()
+    assert (tmp_path / "new" / "a.view.lkml").exists()
+    assert (tmp_path / "c.view.lkml").exists()
+    assert (tmp_path / "unmanaged.view.lkml").exists()
+    assert file_handler.counts["removed"] == 2
+
+    managed = json.loads((tmp_path / MANAGED_FILES_NAME).read_text())
+    assert managed["files"] == {
+        "c.view.lkml": "model.c",
+        "new/a.view.lkml": "model.a",
+    }
+
+
+def test_prune_without_model_ids_keeps_other_models(tmp_path):
+    _write_run(tmp_path, {"model.a": "a.view.lkml", "model.b": "b.view.lkml"})
+    _write_run(tmp_path, {"model.a": "a.view.lkml"})
+
+    assert (tmp_path / "b.view.lkml").exists()
@@ -1,9 +1,12 @@
 """Tests for the base parser module."""
 
-import argparse
+import gc
+import weakref
 
 import pytest
 
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.models.dbt import DbtLazyNodes
 from dbt2looker_bigquery.parsers.base import DbtParser
 
 
@@ -93,19 +96,51 @@ class TestDbtParser:
     def test_get_models_with_select(self, parser):
         """Test parsing specific model by name."""
         self._extracted_from_test_get_models_with_select_3(
-            "model1", None, False, parser
+            ["model1"], None, False, parser
         )
 
     # TODO Rename this here and in `test_get_models_no_filter`, `test_get_models_with_tag`, `test_get_models_with_exposures` and `test_get_models_with_select`
     def _extracted_from_test_get_models_with_select_3(
         self, select_model, tag, build_explore, parser
     ):
-        args = argparse.Namespace(
-            select_model=select_model,
-            tag=tag,
-            exposures_tag=None,
-            build_explore=build_explore,
+        config = GeneratorConfig(
+            select=select_model, tag=tag, build_explore=build_explore
         )
-        models = parser.get_models(args)
+        models = parser.get_models(config)
         assert len(models) == 1
         assert models[0].name == "model1"
+
+    def test_only_selected_models_are_validated(
+        self, sample_manifest, sample_catalog, monkeypatch
+    ):
+        """Test that models outside of the selection never reach pydantic."""
+        validated = []
+        validate = DbtLazyNodes.validate
+        monkeypatch.setattr(
+            DbtLazyNodes,
+            "validate",
+            lambda nodes, unique_id: (
+                validated.append(unique_id) or validate(nodes, unique_id)
+            ),
+        )
+        sample_manifest["nodes"]["model.test.broken"] = {
+            "resource_type": "model",
+            "name": "broken",
+            "unique_id": "model.test.broken",
+            "tags": [],
+        }
+        parser = DbtParser(sample_manifest, sample_catalog)
+        config = GeneratorConfig(select=["model1"], tag="analytics")
+        models = parser.get_models(config)
+        assert [model.name for model in models] == ["model1"]
+        assert validated == ["model.test.model1"]
+
+    def test_processed_models_are_not_kept(self, sample_manifest, sample_catalog):
+        """Test that the parser keeps no reference to the models it yielded."""
+        parser = DbtParser(sample_manifest, sample_catalog)
+        models = [weakref.ref(model) for model in parser.iter_models(GeneratorConfig())]
+        gc.collect()
+
+        assert len(models) == 1
+        assert all(model() is None for model in models)
+        assert len(parser._manifest.nodes._validated) == 0
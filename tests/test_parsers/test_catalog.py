@@ -1,9 +1,16 @@
 """Tests for the catalog parser module."""
 
+import json
+from dataclasses import FrozenInstanceError
+
 import pytest
+from pydantic import ValidationError
 
 from dbt2looker_bigquery.models.dbt import (
     DbtCatalog,
+    DbtCatalogNode,
+    DbtColumn,
+    DbtLazyCatalog,
     DbtModel,
     DbtModelColumn,
     DbtModelColumnMeta,
@@ -13,7 +20,8 @@ from dbt2looker_bigquery.models.looker import (
     DbtMetaColumnLooker,
     DbtMetaLookerDimension,
 )
-from dbt2looker_bigquery.parsers.catalog import CatalogParser
+from dbt2looker_bigquery.parsers.catalog import CatalogParser, CatalogStreamParser
+from dbt2looker_bigquery.warnings import CatalogWarning
 
 
 class TestCatalogParser:
@@ -119,7 +127,7 @@ class TestCatalogParser:
 
         assert column.name == "test_array"
         assert column.data_type == "ARRAY<STRING>"
-        assert column.inner_types == ["STRING"]
+        assert column.inner_types == ("STRING",)
         assert (
             column.description
             == "missing column from manifest.json, generated from catalog.json"
@@ -157,4 +165,76 @@ class TestCatalogParser:
         processed_model = parser.process_model(model)
         assert processed_model is not None
         assert processed_model.columns["id"].data_type == "INT64"
-        assert processed_model.columns["id"].inner_types == ["INT64"]
+        assert processed_model.columns["id"].inner_types == ("INT64",)
+
+    def test_processed_columns_are_records(self, parser):
+        """Test that processed columns are immutable records sharing the manifest meta."""
+        meta = DbtModelColumnMeta()
+        model = DbtModel(
+            resource_type="model",
+            name="model1",
+            unique_id="model.test.model1",
+            relation_name="model1",
+            schema="test_schema",
+            description="Test model",
+            columns={
+                "id": DbtModelColumn(name="id", meta=meta),
+                "gone": DbtModelColumn(name="gone"),
+            },
+            meta=DbtModelMeta(),
+            path="models/test.sql",
+            tags=[],
+        )
+
+        with pytest.warns(
+            CatalogWarning, match="model.test.model1, Manifest Column gone"
+        ):
+            processed_model = parser.process_model(model)
+
+        column = processed_model.columns["id"]
+        assert isinstance(column, DbtColumn)
+        assert column.meta is meta
+        assert "gone" not in processed_model.columns
+        with pytest.raises(FrozenInstanceError):
+            column.data_type = "STRING"
+
+
+def test_catalog_stream_parser_keeps_selected_nodes(tmp_path):
+    """Test that only the catalog nodes of the selected models are read."""
+    raw_catalog = {
+        "metadata": {},
+        "nodes": {
+            f"model.test.model{i}": {
+                "metadata": {"type": "table", "name": f"model{i}"},
+                "columns": {"ID": {"name": "ID", "type": "INT64"}},
+            }
+            for i in range(3)
+        },
+        "sources": {"source.test.s": {"columns": {}}},
+    }
+    file_path = tmp_path / "catalog.json"
+    file_path.write_text(json.dumps(raw_catalog))
+
+    catalog = CatalogStreamParser(["model.test.model1"]).read(str(file_path))
+
+    assert catalog == {
+        "nodes": {"model.test.model1": raw_catalog["nodes"]["model.test.model1"]}
+    }
+
+
+def test_lazy_catalog_validates_on_access():
+    """Test that catalog nodes are validated when they are looked up."""
+    catalog = DbtLazyCatalog(
+        nodes={
+            "model.test.model1": {"columns": {"ID": {"name": "ID", "type": "INT64"}}},
+            "model.test.broken": {"columns": None},
+        }
+    )
+
+    node = catalog.nodes["model.test.model1"]
+    assert isinstance(node, DbtCatalogNode)
+    assert node.columns["id"].name == "id"
+    with pytest.raises(ValidationError):
+        catalog.nodes["model.test.broken"]
+    with pytest.raises(KeyError):
+        catalog.nodes["model.test.missing"]
@@ -0,0 +1,79 @@
+"""Tests for the streaming manifest parser module."""
+
+import json
+
+import pytest
+
+from dbt2looker_bigquery.config import GeneratorConfig
+from dbt2looker_bigquery.exceptions import CliError
+from dbt2looker_bigquery.parsers.manifest import ManifestStreamParser
+
+
+class TestManifestStreamParser:
+    @pytest.fixture
+    def manifest_path(self, tmp_path):
+        def model(name, tags):
+            return {
+                "resource_type": "model",
+                "name": name,
+                "unique_id": f"model.test.{name}",
+                "tags": tags,
+            }
+
+        manifest = {
+            "metadata": {"adapter_type": "bigquery"},
+            "nodes": {
+                "model.test.model1": model("model1", ["analytics"]),
+                "model.test.model2": model("model2", []),
+                "model.test.model3": model("model3", ["analytics"]),
+                "test.test.not_null": {
+                    "resource_type": "test",
+                    "name": "not_null",
+                    "unique_id": "test.test.not_null",
+                },
+            },
+            "exposures": {
+                "exposure.test.dashboard1": {
+                    "resource_type": "exposure",
+                    "name": "dashboard1",
+                    "unique_id": "exposure.test.dashboard1",
+                    "tags": ["finance"],
+                    "refs": [{"name": "model2"}],
+                },
+            },
+        }
+        file_path = tmp_path / "manifest.json"
+        file_path.write_text(json.dumps(manifest))
+        return str(file_path)
+
+    def _node_names(self, manifest):
+        return sorted(node["name"] for node in manifest["nodes"].values())
+
+    def test_keeps_only_models(self, manifest_path):
+        manifest = ManifestStreamParser(GeneratorConfig()).read(manifest_path)
+        assert self._node_names(manifest) == ["model1", "model2", "model3"]
+        assert manifest["metadata"] == {"adapter_type": "bigquery"}
+        assert list(manifest["exposures"]) == ["exposure.test.dashboard1"]
+
+    def test_select(self, manifest_path):
+        config = GeneratorConfig(select=["models/model3.sql"], tag="analytics")
+        manifest = ManifestStreamParser(config).read(manifest_path)
+        assert self._node_names(manifest) == ["model3"]
+
+    def test_tag(self, manifest_path):
+        manifest = ManifestStreamParser(GeneratorConfig(tag="analytics")).read(
+            manifest_path
+        )
+        assert self._node_names(manifest) == ["model1", "model3"]
+
+    def test_exposures(self, manifest_path):
+        config = GeneratorConfig(exposures_only=True, exposures_tag="finance")
+        manifest = ManifestStreamParser(config).read(manifest_path)
+        assert self._node_names(manifest) == ["model2"]
+        assert manifest["metadata"] == {"adapter_type": "bigquery"}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(CliError):
+            ManifestStreamParser(GeneratorConfig()).read(
+                str(tmp_path / "manifest.json")
+            )
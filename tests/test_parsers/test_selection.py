@@ -0,0 +1,80 @@
+"""Tests for the model selection module."""
+
+import pytest
+
+from dbt2looker_bigquery.parsers.selection import ModelSelector
+
+
+class TestModelSelector:
+    @pytest.fixture
+    def selector(self):
+        def model(name, tags, path):
+            return {
+                "resource_type": "model",
+                "name": name,
+                "tags": tags,
+                "path": path,
+                "original_file_path": f"models/{path}",
+            }
+
+        nodes = {
+            "model.test.orders": model("orders", ["finance"], "marts/orders.sql"),
+            "test.test.unique_orders_id": {"resource_type": "test", "name": "orders"},
+            "model.test.customers": model("customers", [], "marts/customers.sql"),
+            "model.test.payments": model("payments", ["finance"], "stg/pay.sql"),
+        }
+        exposures = {
+            "exposure.test.revenue": {
+                "resource_type": "exposure",
+                "tags": ["board"],
+                "refs": [{"name": "orders"}],
+            },
+            "exposure.test.crm": {
+                "resource_type": "exposure",
+                "tags": [],
+                "refs": [{"name": "customers"}, {"name": "payments"}],
+            },
+        }
+        return ModelSelector(nodes, exposures)
+
+    def test_no_filter_selects_all_models(self, selector):
+        assert selector.select() == [
+            "model.test.orders",
+            "model.test.customers",
+            "model.test.payments",
+        ]
+
+    def test_select_by_name_and_path(self, selector):
+        assert selector.select(select_model=["models/customers.sql"]) == [
+            "model.test.customers"
+        ]
+        assert selector.select(select_model=["stg/pay.sql", "orders"]) == [
+            "model.test.orders",
+            "model.test.payments",
+        ]
+
+    def test_select_ignores_other_filters(self, selector):
+        assert selector.select(
+            select_model=["customers"], tag="finance", exposures_tag="board"
+        ) == ["model.test.customers"]
+
+    def test_tag(self, selector):
+        assert selector.select(tag="finance") == [
+            "model.test.orders",
+            "model.test.payments",
+        ]
+
+    def test_exposures(self, selector):
+        assert selector.select(exposures_only=True) == [
+            "model.test.orders",
+            "model.test.customers",
+            "model.test.payments",
+        ]
+        assert selector.select(exposures_tag="board") == ["model.test.orders"]
+        assert selector.select(tag="finance", exposures_only=True) == [
+            "model.test.orders",
+            "model.test.payments",
+        ]
+
+    def test_exposures_without_matches_do_not_filter(self, selector):
+        assert len(selector.select(exposures_tag="unknown")) == 3
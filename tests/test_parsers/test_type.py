@@ -26,3 +26,55 @@ def test_map_type():
     assert parser._map_type("BOOLEAN") == "BOOLEAN"
     assert parser._map_type("GEOGRAPHY") == "GEOGRAPHY"
     assert parser._map_type("BYTES") == "BYTES"
+
+
+def test_inner_types_of_nested_structs():
+    parser = TypeParser()
+
+    assert parser.get_inner_types(
+        "ARRAY<STRUCT<a INT64, b STRUCT<c STRING, d ARRAY<STRUCT<e int64>>>>>"
+    ) == [
+        "a INT64",
+        "b C STRING, D ARRAY<STRUCT<E INT64>>",
+        "b.c STRING",
+        "b.d E INT64",
+        "b.d.e INT64",
+    ]
+    assert parser.get_inner_types("ARRAY<NUMERIC(10, 2)>") == ["NUMERIC"]
+    assert parser.get_inner_types("STRING") == ["STRING"]
+
+
+def test_inner_types_of_unbalanced_types():
+    parser = TypeParser()
+
+    # the unclosed field is dropped, as it always was
+    assert parser.get_inner_types("STRUCT<a STRING, b ARRAY<INT64>") == ["a STRING"]
+
+
+def test_parse_is_cached():
+    parser = TypeParser()
+
+    data_type, inner_types = parser.parse("STRUCT<a INTEGER, b BOOL>")
+    assert data_type == "STRUCT"
+    assert inner_types == ["a INT64", "b BOOLEAN"]
+
+    # callers get their own list
+    inner_types.append("c STRING")
+    assert parser.parse("STRUCT<a INTEGER, b BOOL>")[1] == ["a INT64", "b BOOLEAN"]
+
+
+def test_parse_matches_separate_calls():
+    parser = TypeParser()
+
+    for schema_str in [
+        "STRING",
+        " integer ",
+        "NUMERIC(10, 2)",
+        "ARRAY<NUMERIC(10, 2)>",
+        "STRUCT<a STRING, b ARRAY<INT64>",
+        "ARRAY<STRUCT<a INT64, b STRUCT<c STRING, d ARRAY<STRUCT<e int64>>>>>",
+    ]:
+        assert parser.parse(schema_str) == (
+            parser.get_data_type(schema_str),
+            parser.get_inner_types(schema_str),
+        )
@@ -0,0 +1,74 @@
+import json
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.profiling import (
+    REPORT_FILE_NAME,
+    TRACE_FILE_NAME,
+    Profiler,
+    profiler,
+)
+
+
+def test_disabled_profiler_records_nothing():
+    local_profiler = Profiler()
+    with local_profiler.span("stage", "model.a"):
+        pass
+    assert local_profiler.spans == []
+
+
+def test_report_and_trace():
+    local_profiler = Profiler()
+    local_profiler.enable()
+    with local_profiler.span("generate", "model.a"):
+        pass
+    with local_profiler.span("dump", "model.a"):
+        pass
+    with local_profiler.span("generate", "model.b"):
+        pass
+    with local_profiler.span("parse"):
+        pass
+
+    report = local_profiler.report(top=1)
+    assert report["stages"]["generate"]["count"] == 2
+    assert set(report["models"]) == {"model.a", "model.b"}
+    assert set(report["models"]["model.a"]["stages"]) == {"generate", "dump"}
+    assert len(report["slowest_models"]) == 1
+
+    events = local_profiler.chrome_trace()["traceEvents"]
+    assert len(events) == 4
+    assert all(event["ph"] == "X" and event["ts"] >= 0 for event in events)
+
+
+def test_profiled_run_writes_report(tmp_path):
+    profile_dir = tmp_path / "profile"
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        [
+            "--target-dir",
+            "tests/fixtures/osmosis2",
+            "--output-dir",
+            str(tmp_path / "output"),
+            "--profile",
+            str(profile_dir),
+            "--cprofile",
+        ]
+    )
+    try:
+        cli._run_profiled(args)
+    finally:
+        profiler.disable()
+        profiler.reset()
+
+    report = json.loads((profile_dir / REPORT_FILE_NAME).read_text())
+    assert {
+        "Cli.read_artifacts",
+        "ModelParser.validate",
+        "CatalogParser.process_model",
+        "LookmlGenerator.generate",
+        "dump_lookml",
+    } <= set(report["stages"])
+    assert report["stages"]["ModelParser.validate"]["count"] == 2
+    assert len(report["slowest_models"]) == 2
+    trace = json.loads((profile_dir / TRACE_FILE_NAME).read_text())
+    assert trace["traceEvents"]
+    assert (profile_dir / "profile.prof").exists()
@@ -0,0 +1,148 @@
+import json
+import shutil
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.server import GenerationService, make_server
+
+
+@pytest.fixture
+def service(tmp_path):
+    target_dir = tmp_path / "target"
+    shutil.copytree("tests/fixtures/osmosis2", target_dir)
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        ["--target-dir", str(target_dir), "--output-dir", str(tmp_path / "views")]
+    )
+    return GenerationService(args, cli._init_request_argparser().parse_args)
+
+
+def test_generate_reuses_views_until_inputs_change(service, tmp_path):
+    args = service.parse_args([])
+    result = service.generate(args)
+    assert len(result["views"]) == 2
+    assert result["counts"]["generated"] == 2
+    assert result["counts"]["written"] == 2
+
+    result = service.generate(service.parse_args(["--select", "tv_data"]))
+    assert list(result["views"]) == ["model.dbt_test_data_gen.tv_data"]
+    assert result["counts"]["cached"] == 1
+    assert result["counts"]["unchanged"] == 1
+
+    manifest_path = tmp_path / "target" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    node = manifest["nodes"]["model.dbt_test_data_gen.tv_data"]
+    node["columns"]["show_name"]["description"] = "Changed while serving"
+    manifest_path.write_text(json.dumps(manifest))
+
+    result = service.generate(service.parse_args([]))
+    assert result["counts"]["generated"] == 1
+    assert result["counts"]["cached"] == 1
+    assert result["counts"]["written"] == 1
+
+
+def test_changed_flags_regenerate_views(service):
+    service.generate(service.parse_args(["--dry-run"]))
+
+    result = service.generate(service.parse_args(["--dry-run", "--all-hidden"]))
+
+    assert result["counts"]["generated"] == 2
+    assert all("hidden: yes" in view for view in result["views"].values())
+
+
+def test_every_request_reports_its_warnings(service):
+    first = service.generate(service.parse_args(["--dry-run"]))
+    assert first["warnings"]
+
+    # the same models again, generated anew for the changed flags
+    second = service.generate(service.parse_args(["--dry-run", "--all-hidden"]))
+
+    assert second["counts"]["generated"] == 2
+    assert second["warnings"] == first["warnings"]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--target-dir", "elsewhere"],
+        ["--output-dir", "elsewhere"],
+        ["--jobs", "4"],
+        ["--no-such-flag"],
+        ["--select", 1],
+        [1],
+    ],
+)
+def test_request_can_only_set_selection_and_generation_flags(service, argv):
+    with pytest.raises(ValueError):
+        service.parse_args(argv)
+
+
+def test_views_of_deleted_models_are_forgotten(service, tmp_path):
+    service.generate(service.parse_args(["--dry-run"]))
+
+    manifest_path = tmp_path / "target" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    del manifest["nodes"]["model.dbt_test_data_gen.tv_data"]
+    manifest_path.write_text(json.dumps(manifest))
+    service.load()
+
+    assert "model.dbt_test_data_gen.tv_data" not in service._views
+    assert len(service._views) == 1
+
+
+def test_server_answers_generate_requests(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/health") as response:
+            assert json.load(response)["status"] == "ok"
+
+        request = urllib.request.Request(
+            f"{url}/generate",
+            data=json.dumps({"args": ["--select", "tv_data", "--dry-run"]}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request) as response:
+            result = json.load(response)
+        assert "view: tv_data" in result["views"]["model.dbt_test_data_gen.tv_data"]
+
+        request = urllib.request.Request(
+            f"{url}/generate",
+            data=b'{"args": ["--bad"]}',
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == 400
+
+        request = urllib.request.Request(
+            f"{url}/generate",
+            data=b'{"args": ["--select", 1]}',
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == 400
+
+        # a form or fetch from any web page can send text/plain without consent
+        request = urllib.request.Request(
+            f"{url}/generate",
+            data=b'{"args": ["--dry-run"]}',
+            headers={"Content-Type": "text/plain"},
+            method="POST",
+        )
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == 415
+    finally:
+        server.shutdown()
+        server.server_close()
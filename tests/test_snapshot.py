@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.snapshot import (
+    SNAPSHOT_SUFFIX,
+    ProjectSnapshot,
+    SnapshotCache,
+    snapshot_key,
+)
+from dbt2looker_bigquery.utils import FileHandler
+
+TARGET_DIR = "tests/fixtures/osmosis2"
+
+
+def _views(output_dir, *extra):
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        ["--target-dir", TARGET_DIR, "--output-dir", str(output_dir), *extra]
+    )
+    cli.generate(args, cli.parse(args))
+    return {
+        os.path.relpath(path, output_dir): path.read_text()
+        for path in output_dir.rglob("*.view.lkml")
+    }
+
+
+@pytest.mark.parametrize("select", [["--select", "tv_data"], ["--prefix", "p"]])
+def test_snapshot_runs_match_json_runs(tmp_path, select):
+    cache_dir = tmp_path / "cache"
+    expected = _views(tmp_path / "json", *select)
+
+    # the first run takes the snapshot, the second one loads it
+    for run in ["first", "second"]:
+        views = _views(tmp_path / run, "--snapshot-cache-dir", str(cache_dir), *select)
+        assert views == expected
+    assert len(list(cache_dir.glob(f"*{SNAPSHOT_SUFFIX}"))) == 1
+
+
+def test_snapshot_only_keeps_models():
+    file_handler = FileHandler()
+    manifest = file_handler.read(f"{TARGET_DIR}/manifest.json")
+    catalog = file_handler.read(f"{TARGET_DIR}/catalog.json")
+    model_ids = [
+        unique_id
+        for unique_id, node in manifest["nodes"].items()
+        if node["resource_type"] == "model"
+    ]
+
+    snapshot = ProjectSnapshot.from_artifacts(manifest, catalog)
+
+    assert list(snapshot.models) == model_ids
+    assert snapshot.raw_manifest(model_ids)["nodes"] == {
+        unique_id: manifest["nodes"][unique_id] for unique_id in model_ids
+    }
+    assert snapshot.raw_catalog(model_ids[:1]) == {
+        "nodes": {model_ids[0]: catalog["nodes"][model_ids[0]]}
+    }
+
+
+def test_unreadable_or_foreign_snapshots_are_ignored(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    key = snapshot_key(f"{TARGET_DIR}/manifest.json", f"{TARGET_DIR}/catalog.json")
+    path = tmp_path / f"{key}{SNAPSHOT_SUFFIX}"
+    snapshot = ProjectSnapshot({}, {}, {"model.a": {}}, {"model.a": [0, 2]}, {}, b"{}")
+    cache.put(key, snapshot)
+    header, contents = path.read_bytes().split(b"\n", 1)
+
+    # a snapshot of another layout is rejected by its header
+    path.write_bytes(header.replace(b" 2 ", b" 1 ") + b"\n" + contents)
+    assert cache.get(key) is None
+
+    path.write_bytes(header + b"\nnot json")
+    assert cache.get(key) is None
+
+    path.write_bytes(header + b"\n" + contents)
+    assert cache.get(key).raw_manifest(["model.a"])["nodes"] == {"model.a": {}}
+
+
+def test_nodes_are_stored_once(tmp_path):
+    node = {"resource_type": "model", "name": "a", "sql": "select 1"}
+    snapshot = ProjectSnapshot.from_artifacts({"nodes": {"model.a": node}})
+
+    data = snapshot.dumps()
+
+    assert data.count(b"select 1") == 1
+    assert ProjectSnapshot.loads(data).raw_manifest(["model.a"])["nodes"] == {
+        "model.a": node
+    }
+
+
+def test_least_recently_used_snapshots_are_evicted(tmp_path):
+    cache = SnapshotCache(str(tmp_path), max_snapshots=2)
+    for key in ["a", "b", "c"]:
+        cache.put(key, ProjectSnapshot({}, {}, {}, {}, {}, b""))
+        os.utime(tmp_path / f"{key}{SNAPSHOT_SUFFIX}", (0, ord(key)))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from dbt2looker_bigquery.streaming import JsonStreamReader
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    document = {
+        "nodes": {
+            "model.a": {"name": "a", "sql": "select \"}\" as x, '[' as y"},
+            "test.b": {"name": "b", "escaped": 'quote \\" and \\\\'},
+            "model.c": {"name": "c", "list": [1, 2.5, -3e4, True, None, {}]},
+            "model.d": {"deep": [[[[{"a": [1, {"b": "]"}]}]]], []], "after": "{"},
+        },
+        "metadata": {"adapter_type": "bigquery"},
+        "macros": {"macro.x": {"name": "x", "unicode": "æøå ✓"}},
+        "count": 12345,
+        "empty": {},
+    }
+    file_path = tmp_path / "document.json"
+    file_path.write_text(json.dumps(document, indent=2, ensure_ascii=False))
+    return str(file_path), document
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 20])
+def test_streamed_members_match_json_load(json_file, chunk_size):
+    file_path, document = json_file
+    reader = JsonStreamReader(file_path, chunk_size=chunk_size)
+
+    nodes = {
+        key: value
+        for section, key, value in reader.iter_sections(streamed=["nodes"])
+        if section == "nodes"
+    }
+
+    assert nodes == document["nodes"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_loaded_sections_match_json_load(json_file, chunk_size):
+    file_path, document = json_file
+    reader = JsonStreamReader(file_path, chunk_size=chunk_size)
+
+    sections = {
+        section: value
+        for section, _, value in reader.iter_sections(
+            loaded=["metadata", "count", "empty", "macros"]
+        )
+    }
+
+    assert sections == {
+        key: document[key] for key in ["metadata", "count", "empty", "macros"]
+    }
+
+
+def test_spans_point_into_file(json_file):
+    file_path, _ = json_file
+    with open(file_path, "rb") as f:
+        contents = f.read()
+
+    for _, _, offset, raw in JsonStreamReader(file_path, chunk_size=3).iter_spans(
+        streamed=["nodes"], loaded=["metadata"]
+    ):
+        assert contents[offset : offset + len(raw)] == raw
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_streamed_members_filtered_by_key(json_file, chunk_size):
+    file_path, document = json_file
+    reader = JsonStreamReader(file_path, chunk_size=chunk_size)
+
+    nodes = {
+        key: value
+        for _, key, value in reader.iter_sections(
+            streamed=["nodes"], keys={"model.a", "model.c", "model.missing"}
+        )
+    }
+
+    assert nodes == {key: document["nodes"][key] for key in ["model.a", "model.c"]}
+
+
+def test_unrequested_sections_are_skipped(json_file):
+    file_path, _ = json_file
+    sections = {
+        section for section, _, _ in JsonStreamReader(file_path).iter_sections()
+    }
+    assert sections == set()
+
+
+def test_malformed_json_raises(tmp_path):
+    file_path = tmp_path / "broken.json"
+    file_path.write_text('{"nodes": {"a": {"name": "a"}')
+
+    with pytest.raises(ValueError):
+        list(JsonStreamReader(str(file_path)).iter_sections(streamed=["nodes"]))
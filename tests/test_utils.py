@@ -69,3 +69,53 @@ def test_file_write_failure():
     file_path = "/non_writable_file.txt"
     with pytest.raises(CliError):
         file_handler.write(file_path, "test data")
+
+
+def test_file_write_skips_unchanged(tmp_path):
+    file_handler = FileHandler()
+    file_path = tmp_path / "test_file.txt"
+    assert file_handler.write(str(file_path), "test data") is True
+    os.utime(file_path, (0, 0))
+
+    assert file_handler.write(str(file_path), "test data") is False
+    assert file_path.stat().st_mtime == 0
+
+    assert file_handler.write(str(file_path), "test date") is True
+    assert file_path.read_text() == "test date"
+    assert file_handler.counts == {"written": 2, "unchanged": 1}
+
+
+def test_file_write_skips_unchanged_text(tmp_path):
+    file_handler = FileHandler()
+    file_path = tmp_path / "test_file.txt"
+    contents = 'label: "Café"\r\nsql: ${TABLE}\n'
+
+    assert file_handler.write(str(file_path), contents) is True
+    assert file_path.read_bytes() == contents.encode("utf-8")
+    assert file_handler.write(str(file_path), contents) is False
+
+
+def test_file_write_keeps_permissions(tmp_path):
+    file_handler = FileHandler()
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("test data")
+    file_path.chmod(0o640)
+
+    assert file_handler.write(str(file_path), "test date") is True
+    assert file_path.stat().st_mode & 0o777 == 0o640
+
+    new_path = tmp_path / "new_file.txt"
+    open(tmp_path / "opened.txt", "w").close()
+    file_handler.write(str(new_path), "test data")
+    assert new_path.stat().st_mode == (tmp_path / "opened.txt").stat().st_mode
+
+
+def test_file_remove(tmp_path):
+    file_handler = FileHandler()
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("test data")
+
+    file_handler.remove(str(file_path))
+    file_handler.remove(str(file_path))
+    assert not file_path.exists()
+    assert file_handler.counts["removed"] == 1
@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+from dbt2looker_bigquery.cli import Cli
+from dbt2looker_bigquery.incremental import STATE_FILE_NAME
+from dbt2looker_bigquery.warnings import (
+    ParsingWarning,
+    capture_warning,
+    captured_warnings,
+)
+from dbt2looker_bigquery.watch import ArtifactWatcher
+
+
+def test_watcher_waits_for_files_to_settle(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{}")
+    writes = iter(['{"nodes"', '{"nodes": {}}'])
+
+    def sleep(_):
+        # every poll sees the file change, until the writer is done
+        content = next(writes, None)
+        if content is not None:
+            path.write_text(content)
+
+    watcher = ArtifactWatcher([str(path)], sleep=sleep)
+    assert not watcher.changed()
+
+    signatures = watcher.wait()
+
+    assert signatures[str(path)][0] == len('{"nodes": {}}')
+    assert not watcher.changed()
+
+
+def test_watcher_reports_missing_files(tmp_path):
+    path = tmp_path / "catalog.json"
+    watcher = ArtifactWatcher([str(path)], sleep=lambda _: None)
+
+    path.write_text("{}")
+    assert watcher.changed()
+    path.unlink()
+    assert watcher.changed()
+
+
+def test_watch_only_regenerates_changed_models(tmp_path):
+    target_dir = tmp_path / "target"
+    output_dir = tmp_path / "views"
+    shutil.copytree("tests/fixtures/osmosis2", target_dir)
+    manifest_path = target_dir / "manifest.json"
+
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        ["--target-dir", str(target_dir), "--output-dir", str(output_dir), "--watch"]
+    )
+    builds = []
+    generate = cli.generate
+
+    def counting_generate(args, models):
+        models = list(models)
+        builds.append([model.unique_id for model in models])
+        return generate(args, models)
+
+    def edit_manifest():
+        if len(builds) > 1:
+            raise KeyboardInterrupt
+        manifest = json.loads(manifest_path.read_text())
+        node = manifest["nodes"]["model.dbt_test_data_gen.tv_data"]
+        node["columns"]["show_name"]["description"] = "Changed while watching"
+        manifest_path.write_text(json.dumps(manifest))
+
+    with (
+        patch.object(cli, "generate", side_effect=counting_generate),
+        patch.object(ArtifactWatcher, "wait", side_effect=edit_manifest),
+    ):
+        cli.watch(args)
+
+    assert len(builds[0]) == 2
+    assert builds[1] == ["model.dbt_test_data_gen.tv_data"]
+    views = [
+        view.read_text()
+        for view in output_dir.rglob("*.view.lkml")
+        if "Changed while watching" in view.read_text()
+    ]
+    assert len(views) == 1
+    # without --incremental the state is only kept in memory
+    assert not os.path.exists(output_dir / STATE_FILE_NAME)
+
+
+def test_watch_reports_warnings_on_every_build(tmp_path):
+    target_dir = tmp_path / "target"
+    shutil.copytree("tests/fixtures/osmosis2", target_dir)
+    manifest_path = target_dir / "manifest.json"
+
+    cli = Cli()
+    args = cli._init_argparser().parse_args(
+        ["--target-dir", str(target_dir), "--output-dir", str(tmp_path / "views")]
+        + ["--watch"]
+    )
+    feedback = []
+    log_feedback = cli._log_feedback
+
+    def recording_log_feedback(args):
+        feedback.append([warning[0] for warning in captured_warnings])
+        return log_feedback(args)
+
+    def touch_manifest():
+        if len(feedback) > 1:
+            raise KeyboardInterrupt
+        # new contents regenerate every model, with the same problems
+        manifest = json.loads(manifest_path.read_text())
+        for node in manifest["nodes"].values():
+            node["description"] = "Changed while watching"
+        manifest_path.write_text(json.dumps(manifest))
+
+    captured_warnings.clear()
+    # pytest records warnings itself, route them to the hook of the cli instead
+    with (
+        patch("warnings.showwarning", capture_warning),
+        patch.object(cli, "_log_feedback", side_effect=recording_log_feedback),
+        patch.object(ArtifactWatcher, "wait", side_effect=touch_manifest),
+    ):
+        cli.watch(args)
+
+    assert any(isinstance(message, ParsingWarning) for message in feedback[0])
+    assert [str(message) for message in feedback[1]] == [
+        str(message) for message in feedback[0]
+    ]